@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+bench_acoustic.py -- Throughput, per-stage latency and peak-memory benchmark
+for src/audio/extract_features_v5.py.
+
+Each case (synthetic scenario x duration, see synthetic_voice.py) runs in a
+fresh process: one warm-up extraction on a 2 s clip (imports, JIT caches),
+then ``--repeats`` profiled extractions of the full signal.  Reported per
+case:
+
+  - throughput   : audio seconds processed per wall-clock second
+  - wall / CPU   : median over the repeats
+  - stages       : median wall ms per extractor stage (the ``timings``
+                   block of ``extract_file(profile=True)``)
+  - peak RSS     : high-water mark of the case process
+
+Results can be saved as a baseline and later runs compared against it; a
+case whose wall time or peak RSS grows by more than the tolerance is
+flagged and the exit status is 1.
+
+Usage:
+    # Quick run, print the table
+    python scripts/bench_acoustic.py --durations 5,60
+
+    # Record a baseline on this machine, then check a branch against it
+    python scripts/bench_acoustic.py --save-baseline bench-baseline.json
+    python scripts/bench_acoustic.py --baseline bench-baseline.json --tolerance 0.2
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+EXTRACTOR_DIR = os.path.join(HERE, "..", "src", "audio")
+
+DEFAULT_DURATIONS = (5, 60, 600, 3600)
+WARMUP_S = 2.0
+# Stages faster than this are too noisy to flag on their own
+MIN_STAGE_MS = 50.0
+
+
+def _import_extractor():
+    if EXTRACTOR_DIR not in sys.path:
+        sys.path.insert(0, EXTRACTOR_DIR)
+    import extract_features_v5
+    return extract_features_v5
+
+
+def _run_case(wav_path, warmup_path, task_type, repeats, memory_budget_mb):
+    """Process-pool task: warm up, then profile ``repeats`` extractions."""
+    ext = _import_extractor()
+    no_cache = ext.FeatureCache("")
+    ext.extract_file(warmup_path, task_type, cache=no_cache)
+
+    runs = []
+    for _ in range(repeats):
+        result = ext.extract_file(
+            wav_path, task_type, cache=no_cache,
+            memory_budget_mb=memory_budget_mb, profile=True,
+        )
+        runs.append(result)
+
+    timings = [r["timings"] for r in runs]
+    stage_names = timings[-1]["stages"].keys()
+    return {
+        "wall_s": statistics.median(t["total_wall_ms"] for t in timings) / 1000,
+        "cpu_s": statistics.median(t["total_cpu_ms"] for t in timings) / 1000,
+        "peak_rss_mb": timings[-1]["peak_rss_mb"],
+        "extraction_mode": runs[-1].get("extraction_mode", "whole"),
+        "stages": {
+            name: round(statistics.median(
+                t["stages"].get(name, {}).get("wall_ms", 0.0) for t in timings), 2)
+            for name in stage_names
+        },
+    }
+
+
+def machine_info():
+    import numpy
+    import scipy
+    return {
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "numpy": numpy.__version__,
+        "scipy": scipy.__version__,
+    }
+
+
+def run_benchmark(scenarios, durations, repeats=3, memory_budget_mb=None,
+                  seed=0, log=sys.stderr):
+    """Run every scenario x duration case; returns the list of case records."""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    sys.path.insert(0, HERE)
+    import synthetic_voice
+
+    mp_context = multiprocessing.get_context("spawn")
+    results = []
+    with tempfile.TemporaryDirectory(prefix="cvf-bench-") as tmp:
+        for scenario in scenarios:
+            warmup_path = os.path.join(tmp, f"{scenario}-warmup.wav")
+            synthetic_voice.write_scenario_wav(warmup_path, scenario, WARMUP_S,
+                                               seed=seed + 1000)
+            for duration in durations:
+                wav_path = os.path.join(tmp, f"{scenario}-{duration:g}.wav")
+                task_type = synthetic_voice.write_scenario_wav(
+                    wav_path, scenario, duration, seed=seed,
+                )
+                print(f"  {scenario} @ {duration:g}s ...", file=log, flush=True)
+                # A fresh process per case keeps peak RSS attributable
+                with ProcessPoolExecutor(max_workers=1, mp_context=mp_context) as pool:
+                    case = pool.submit(_run_case, wav_path, warmup_path, task_type,
+                                       repeats, memory_budget_mb).result()
+                os.remove(wav_path)
+                case.update({
+                    "case": f"{scenario}@{duration:g}s",
+                    "scenario": scenario,
+                    "task_type": task_type,
+                    "duration_s": duration,
+                    "throughput": round(duration / case["wall_s"], 2)
+                    if case["wall_s"] > 0 else None,
+                })
+                results.append(case)
+    return results
+
+
+def compare_to_baseline(results, baseline, tolerance=0.2, memory_tolerance=0.2):
+    """Regression messages for cases slower / larger than the baseline."""
+    base = {r["case"]: r for r in baseline.get("results", [])}
+    flags = []
+    for r in results:
+        b = base.get(r["case"])
+        if b is None:
+            continue
+        if r["wall_s"] > b["wall_s"] * (1 + tolerance):
+            flags.append(f"{r['case']}: wall {b['wall_s']:.2f}s -> {r['wall_s']:.2f}s "
+                         f"({r['wall_s'] / b['wall_s'] - 1:+.0%})")
+        if (r["peak_rss_mb"] and b.get("peak_rss_mb")
+                and r["peak_rss_mb"] > b["peak_rss_mb"] * (1 + memory_tolerance)):
+            flags.append(f"{r['case']}: peak RSS {b['peak_rss_mb']:.0f} MB -> "
+                         f"{r['peak_rss_mb']:.0f} MB")
+        for name, ms in r["stages"].items():
+            old = b.get("stages", {}).get(name)
+            if old and max(ms, old) >= MIN_STAGE_MS and ms > old * (1 + tolerance):
+                flags.append(f"{r['case']}: stage {name} {old:.0f} ms -> {ms:.0f} ms")
+    return flags
+
+
+def format_report(results, top=5):
+    lines = [f"{'case':<28}{'mode':<9}{'wall s':>9}{'cpu s':>9}"
+             f"{'x realtime':>12}{'peak MB':>10}"]
+    for r in results:
+        lines.append(
+            f"{r['case']:<28}{r['extraction_mode']:<9}{r['wall_s']:>9.2f}"
+            f"{r['cpu_s']:>9.2f}{r['throughput'] or 0:>12.1f}"
+            f"{r['peak_rss_mb'] or 0:>10.0f}"
+        )
+        # Leaf stages only (dotted names), slowest first
+        leaves = sorted(((ms, name) for name, ms in r["stages"].items()
+                         if "." in name), reverse=True)[:top]
+        for ms, name in leaves:
+            lines.append(f"    {name:<44}{ms:>10.1f} ms")
+    return "\n".join(lines)
+
+
+def main():
+    sys.path.insert(0, HERE)
+    import synthetic_voice
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark extract_features_v5.py on synthetic voice signals"
+    )
+    parser.add_argument(
+        "--scenarios", default=",".join(synthetic_voice.SCENARIOS),
+        help="Comma-separated scenarios (default: all)",
+    )
+    parser.add_argument(
+        "--durations", default=",".join(f"{d:g}" for d in DEFAULT_DURATIONS),
+        help="Comma-separated signal durations in seconds (default: 5,60,600,3600)",
+    )
+    parser.add_argument("--repeats", type=int, default=3,
+                        help="Profiled runs per case; the median is reported")
+    parser.add_argument(
+        "--memory-budget-mb", type=int, default=4096,
+        help="Forwarded to extract_file so long recordings go chunked "
+             "(0 = always whole-file)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the results JSON here")
+    parser.add_argument("--baseline", help="Compare against this results JSON")
+    parser.add_argument("--save-baseline", help="Write the results as a baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed relative wall-time growth (default: 0.2)")
+    parser.add_argument("--memory-tolerance", type=float, default=0.2,
+                        help="Allowed relative peak-RSS growth (default: 0.2)")
+    args = parser.parse_args()
+
+    scenarios = [s for s in args.scenarios.split(",") if s]
+    unknown = set(scenarios) - set(synthetic_voice.SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(sorted(unknown))}")
+    durations = [float(d) for d in args.durations.split(",") if d]
+
+    results = run_benchmark(
+        scenarios, durations, repeats=max(1, args.repeats),
+        memory_budget_mb=args.memory_budget_mb or None, seed=args.seed,
+    )
+    report = {"machine": machine_info(), "results": results}
+    print(format_report(results))
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("machine") != report["machine"]:
+            print("warning: baseline was recorded on a different machine/"
+                  "library setup", file=sys.stderr)
+        flags = compare_to_baseline(results, baseline, args.tolerance,
+                                    args.memory_tolerance)
+        for flag in flags:
+            print(f"REGRESSION {flag}")
+        if flags:
+            sys.exit(1)
+        print(f"No regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
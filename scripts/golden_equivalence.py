@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+golden_equivalence.py -- Check that the optimised ("fast") feature paths of
+src/audio/extract_features_v5.py reproduce the reference implementations.
+
+Every corpus file is extracted twice through ``extract_file``, once with
+``set_extractor_mode("reference")`` (per-frame loops, per-frame Praat
+queries, nolds called with its defaults on the original ``y[::step]``
+input, as the code did before the KD-tree estimators) and once with
+``"fast"``.  Each feature is compared with
+
+    |fast - reference| <= abs_tol + rel_tol * |reference|
+
+(per-feature tolerances, see DEFAULT_TOLERANCES), a value that is present
+in one path but missing in the other is a failure, and per-feature drift
+statistics are reported over the whole corpus.  The exit status is 1 when
+any feature is out of tolerance.
+
+Reference outputs can be stored as a golden file and later fast runs
+checked against it without re-running the (slow) reference path.
+
+The corpus is the synthetic scenarios of synthetic_voice.py at
+``--durations``, plus any recordings given with ``--audio`` or
+``--manifest`` (same CSV/JSONL format as the extractor's batch mode).
+
+Usage:
+    python scripts/golden_equivalence.py
+    python scripts/golden_equivalence.py --audio rec.wav:conversation \
+        --save-golden golden.json
+    python scripts/golden_equivalence.py --golden golden.json --report drift.json
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+EXTRACTOR_DIR = os.path.join(HERE, "..", "src", "audio")
+
+# (absolute, relative) tolerance per feature; "*" applies to the rest.
+# Outputs are rounded to 6 decimals, so 1e-6 absolute is one unit in the
+# last place.
+DEFAULT_TOLERANCES = {
+    "*": (1e-6, 1e-6),
+}
+
+
+def _import_extractor():
+    if EXTRACTOR_DIR not in sys.path:
+        sys.path.insert(0, EXTRACTOR_DIR)
+    import extract_features_v5
+    return extract_features_v5
+
+
+def build_corpus(tmp, durations, audio_specs=(), manifest=None, seed=0):
+    """List of {"name", "audio_path", "task_type"} for the comparison."""
+    sys.path.insert(0, HERE)
+    import synthetic_voice
+    ext = _import_extractor()
+
+    corpus = []
+    for scenario in synthetic_voice.SCENARIOS:
+        for duration in durations:
+            path = os.path.join(tmp, f"{scenario}-{duration:g}.wav")
+            task_type = synthetic_voice.write_scenario_wav(path, scenario, duration,
+                                                           seed=seed)
+            corpus.append({"name": f"{scenario}@{duration:g}s",
+                           "audio_path": path, "task_type": task_type})
+    for spec in audio_specs:
+        path, _, task_type = spec.rpartition(":")
+        if not path or task_type not in ext.VALID_TASK_TYPES:
+            raise ValueError(f"--audio expects PATH:TASK_TYPE, got {spec!r}")
+        corpus.append({"name": os.path.basename(path), "audio_path": path,
+                       "task_type": task_type})
+    if manifest:
+        for entry in ext.read_manifest(manifest):
+            corpus.append({"name": entry["path"], "audio_path": entry["audio_path"],
+                           "task_type": entry["task_type"]})
+    return corpus
+
+
+def extract_corpus(corpus, mode, log=sys.stderr):
+    """{name: features} for every corpus entry in the given extractor mode."""
+    ext = _import_extractor()
+    no_cache = ext.FeatureCache("")
+    previous = ext.get_extractor_mode()
+    ext.set_extractor_mode(mode)
+    try:
+        outputs = {}
+        for item in corpus:
+            print(f"  [{mode}] {item['name']}", file=log, flush=True)
+            result = ext.extract_file(item["audio_path"], item["task_type"],
+                                      cache=no_cache)
+            outputs[item["name"]] = result["features"]
+        return outputs
+    finally:
+        ext.set_extractor_mode(previous)
+
+
+def _tolerance(feature, tolerances):
+    return tolerances.get(feature, tolerances["*"])
+
+
+def compare(reference, fast, tolerances=DEFAULT_TOLERANCES):
+    """Per-feature drift statistics and the list of failures."""
+    stats = {}
+    failures = []
+    for name, ref_features in reference.items():
+        fast_features = fast.get(name)
+        if fast_features is None:
+            failures.append(f"{name}: missing from the fast run")
+            continue
+        for feature in sorted(set(ref_features) | set(fast_features)):
+            r, f = ref_features.get(feature), fast_features.get(feature)
+            s = stats.setdefault(feature, {
+                "n": 0, "failures": 0, "missing": 0,
+                "max_abs": 0.0, "sum_abs": 0.0, "max_rel": 0.0, "sum_rel": 0.0,
+            })
+            if r is None and f is None:
+                continue
+            if r is None or f is None:
+                s["missing"] += 1
+                s["failures"] += 1
+                failures.append(f"{name}: {feature} reference={r} fast={f}")
+                continue
+            abs_err = abs(f - r)
+            rel = (f - r) / abs(r) if r else 0.0
+            s["n"] += 1
+            s["max_abs"] = max(s["max_abs"], abs_err)
+            s["sum_abs"] += abs_err
+            s["max_rel"] = max(s["max_rel"], abs(rel))
+            s["sum_rel"] += rel
+            abs_tol, rel_tol = _tolerance(feature, tolerances)
+            if abs_err > abs_tol + rel_tol * abs(r) or math.isnan(abs_err):
+                s["failures"] += 1
+                failures.append(f"{name}: {feature} reference={r} fast={f} "
+                                f"(abs {abs_err:.3g}, rel {rel:+.3g})")
+
+    drift = {}
+    for feature, s in sorted(stats.items()):
+        n = s["n"]
+        drift[feature] = {
+            "n": n,
+            "failures": s["failures"],
+            "missing": s["missing"],
+            "max_abs": s["max_abs"],
+            "mean_abs": s["sum_abs"] / n if n else 0.0,
+            "max_rel": s["max_rel"],
+            "mean_rel_bias": s["sum_rel"] / n if n else 0.0,
+        }
+    return drift, failures
+
+
+def format_drift(drift):
+    lines = [f"{'feature':<24}{'n':>5}{'fail':>6}{'max abs':>12}"
+             f"{'mean abs':>12}{'max rel':>12}{'bias':>12}"]
+    for feature, d in drift.items():
+        lines.append(
+            f"{feature:<24}{d['n']:>5}{d['failures']:>6}{d['max_abs']:>12.3g}"
+            f"{d['mean_abs']:>12.3g}{d['max_rel']:>12.3g}{d['mean_rel_bias']:>+12.3g}"
+        )
+    return "\n".join(lines)
+
+
+def load_tolerances(path):
+    tolerances = dict(DEFAULT_TOLERANCES)
+    if path:
+        with open(path, encoding="utf-8") as f:
+            for feature, tol in json.load(f).items():
+                tolerances[feature] = (float(tol["abs"]), float(tol["rel"]))
+    return tolerances
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare fast vs reference acoustic feature paths"
+    )
+    parser.add_argument("--durations", default="5,20",
+                        help="Synthetic signal durations in seconds (default: 5,20)")
+    parser.add_argument("--audio", action="append", default=[],
+                        help="Extra recording as PATH:TASK_TYPE (repeatable)")
+    parser.add_argument("--manifest", help="CSV/JSONL manifest of extra recordings")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tolerances",
+                        help='JSON {"feature": {"abs": x, "rel": y}} overrides')
+    parser.add_argument("--golden", help="Use stored reference outputs from this file")
+    parser.add_argument("--save-golden", help="Store the reference outputs here")
+    parser.add_argument("--report", help="Write drift statistics JSON here")
+    args = parser.parse_args()
+
+    durations = [float(d) for d in args.durations.split(",") if d]
+    tolerances = load_tolerances(args.tolerances)
+
+    with tempfile.TemporaryDirectory(prefix="cvf-golden-") as tmp:
+        corpus = build_corpus(tmp, durations, args.audio, args.manifest, args.seed)
+        if args.golden:
+            with open(args.golden, encoding="utf-8") as f:
+                golden = json.load(f)["outputs"]
+            corpus = [c for c in corpus if c["name"] in golden]
+            reference = {c["name"]: golden[c["name"]] for c in corpus}
+            skipped = len(golden) - len(reference)
+            if skipped:
+                print(f"note: {skipped} golden entries are not in this corpus",
+                      file=sys.stderr)
+        else:
+            reference = extract_corpus(corpus, "reference")
+        if args.save_golden:
+            with open(args.save_golden, "w", encoding="utf-8") as f:
+                json.dump({"seed": args.seed, "durations": durations,
+                           "outputs": reference}, f, indent=2)
+        fast = extract_corpus(corpus, "fast")
+
+    drift, failures = compare(reference, fast, tolerances)
+    print(format_drift(drift))
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump({"drift": drift, "failures": failures}, f, indent=2)
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if failures:
+        sys.exit(1)
+    print(f"All features within tolerance on {len(reference)} files")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+stream_equivalence.py -- Check that the final snapshot of streaming mode
+(``--stream``) stays within STREAM_TOLERANCES of batch extraction.
+
+Every corpus file is extracted once through ``extract_file`` and once by
+piping its 16-bit PCM through ``run_stream`` at ``--interval``; the final
+snapshot's "cumulative" features are compared with the batch features the
+task reports (see golden_equivalence.compare).  Streaming only sees the
+audio received so far, so it approximates batch for the features listed in
+STREAM_TOLERANCES (see the "Streaming mode" notes in the extractor); the
+exit status is 1 when any feature is outside its tolerance.
+
+The corpus is the synthetic scenarios of synthetic_voice.py at
+``--durations``.
+
+Usage:
+    python scripts/stream_equivalence.py
+    python scripts/stream_equivalence.py --durations 20,120 --interval 2
+"""
+
+import argparse
+import io
+import json
+import sys
+import tempfile
+
+from golden_equivalence import _import_extractor, build_corpus, compare, format_drift
+
+
+def stream_final(audio_path, interval_s):
+    """Cumulative features of the final snapshot for ``audio_path``."""
+    import soundfile as sf
+    ext = _import_extractor()
+    pcm, sr = sf.read(audio_path, dtype="int16")
+    if sr != 16000:
+        raise ValueError(f"{audio_path}: streaming mode needs 16 kHz, got {sr}")
+    out = io.StringIO()
+    ext.run_stream(io.BytesIO(pcm.tobytes()), out, interval_s=interval_s,
+                   pcm_format="s16le")
+    final = json.loads(out.getvalue().splitlines()[-1])
+    assert final["event"] == "final"
+    return final["cumulative"]
+
+
+def extract_pairs(corpus, interval_s, log=sys.stderr):
+    """({name: batch features}, {name: stream features}), restricted to the
+    stream features each task reports in batch."""
+    ext = _import_extractor()
+    no_cache = ext.FeatureCache("")
+    batch, stream = {}, {}
+    for item in corpus:
+        print(f"  {item['name']}", file=log, flush=True)
+        features = ext.extract_file(item["audio_path"], item["task_type"],
+                                    cache=no_cache)["features"]
+        keys = [k for k in ext.STREAM_FEATURES if k in features]
+        if not keys:
+            continue
+        final = stream_final(item["audio_path"], interval_s)
+        batch[item["name"]] = {k: features[k] for k in keys}
+        stream[item["name"]] = {k: final.get(k) for k in keys}
+    return batch, stream
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the streaming final snapshot with batch extraction"
+    )
+    parser.add_argument("--durations", default="20,60",
+                        help="Synthetic signal durations in seconds (default: 20,60)")
+    parser.add_argument("--interval", type=float, default=5.0,
+                        help="Streaming window length in seconds (default: 5)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--report", help="Write drift statistics JSON here")
+    args = parser.parse_args()
+
+    ext = _import_extractor()
+    durations = [float(d) for d in args.durations.split(",") if d]
+    with tempfile.TemporaryDirectory(prefix="cvf-stream-") as tmp:
+        corpus = build_corpus(tmp, durations, seed=args.seed)
+        batch, stream = extract_pairs(corpus, args.interval)
+
+    drift, failures = compare(batch, stream, ext.STREAM_TOLERANCES)
+    print(format_drift(drift))
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump({"drift": drift, "failures": failures}, f, indent=2)
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if failures:
+        sys.exit(1)
+    print(f"All features within tolerance on {len(batch)} files")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+voiced_only_check.py -- Exercise ``voiced_only`` extraction end to end.
+
+Every synthetic scenario of synthetic_voice.py is extracted in-process with
+``extract()`` twice, with ``voiced_only=False`` and ``True``.  The
+voiced-only result must
+
+  - report ``voiced_only`` in its metadata,
+  - return exactly the feature keys of the full-signal run,
+  - give a finite number for every feature the full-signal run measures,
+  - and, when the task reports any of VOICED_ONLY_FEATURES (the measures
+    that switch to the voiced spans), differ from the full-signal run in at
+    least one of them on scenarios with unvoiced stretches; every other
+    feature must be unchanged.
+
+The exit status is 1 when any check fails.
+
+Usage:
+    python scripts/voiced_only_check.py
+    python scripts/voiced_only_check.py --durations 5,30
+"""
+
+import argparse
+import math
+import sys
+import tempfile
+
+from golden_equivalence import _import_extractor, build_corpus
+
+# Features computed on the voiced spans when voiced_only is set (see
+# AnalysisContext.dsp_input and _compute_cpp)
+VOICED_ONLY_FEATURES = ("cpp", "rpde", "dfa", "d2", "spectral_harmonicity",
+                        "spectral_tilt")
+# Scenarios that are voiced throughout, where both runs may coincide
+FULLY_VOICED = ("vowel", "vowel_pathological", "vowel_tremor")
+
+
+def check(name, full, voiced):
+    """(failure messages, changed voiced-only features) for one scenario's
+    pair of FeatureResults."""
+    failures = []
+    if voiced.meta.get("voiced_only") is not True:
+        failures.append(f"{name}: voiced_only={voiced.meta.get('voiced_only')!r} in result")
+    if set(voiced.features) != set(full.features):
+        failures.append(f"{name}: keys differ: "
+                        f"{sorted(set(voiced.features) ^ set(full.features))}")
+    changed = []
+    for feature, value in sorted(voiced.features.items()):
+        reference = full.features.get(feature)
+        if reference is None:
+            continue
+        if value is None or not math.isfinite(value):
+            failures.append(f"{name}: {feature}={value} (full signal: {reference})")
+        elif value != reference:
+            if feature in VOICED_ONLY_FEATURES:
+                changed.append(feature)
+            else:
+                failures.append(f"{name}: {feature} changed from {reference} to {value}")
+    applies = any(f in VOICED_ONLY_FEATURES for f in full.features)
+    if applies and not changed and not name.startswith(FULLY_VOICED):
+        failures.append(f"{name}: no voiced-only feature differs from the full signal")
+    return failures, changed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check voiced-only extraction through extract()"
+    )
+    parser.add_argument("--durations", default="10",
+                        help="Synthetic signal durations in seconds (default: 10)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    ext = _import_extractor()
+    no_cache = ext.FeatureCache("")
+    durations = [float(d) for d in args.durations.split(",") if d]
+    failures = []
+    with tempfile.TemporaryDirectory(prefix="cvf-voiced-") as tmp:
+        corpus = build_corpus(tmp, durations, seed=args.seed)
+        for item in corpus:
+            full, voiced = (
+                ext.extract(item["audio_path"], item["task_type"], voiced_only=flag,
+                            cache=no_cache)
+                for flag in (False, True)
+            )
+            problems, changed = check(item["name"], full, voiced)
+            failures.extend(problems)
+            print(f"{item['name']:<28}{len(voiced.features):>4} features, "
+                  f"voiced-only changed: {', '.join(changed) or '-'}")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if failures:
+        sys.exit(1)
+    print(f"Voiced-only results valid on {len(corpus)} files")
+
+
+if __name__ == "__main__":
+    main()
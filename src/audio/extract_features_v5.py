@@ -14,6 +14,18 @@ Usage:
         --audio-path rec.wav --task-type conversation --gender female \
         --gpu --whisper-model large-v3 --word-timestamps
 
+    # Batch: one JSON line per manifest entry, resumable
+    python extract_features_v5.py \
+        --manifest sessions.csv --output results.jsonl --jobs 8 --resume
+
+    # Audio on stdin instead of a file (raw PCM here, piped from ffmpeg)
+    ffmpeg -i rec.webm -f s16le -ac 1 -ar 16000 - | python extract_features_v5.py \
+        --audio-path - --audio-format s16le --task-type conversation
+
+    # Streaming: raw 16 kHz s16le PCM on stdin, JSON snapshots on stdout
+    arecord -f S16_LE -r 16000 -c 1 -t raw | \
+        python extract_features_v5.py --stream --stream-interval 5
+
 References:
     Little et al. (2009) - PPE algorithm, IEEE TBME.
     Tsanas et al. (2011) - Nonlinear speech signal features for PD classification.
@@ -21,7 +33,10 @@ References:
                             Weak Supervision.
 """
 
-import argparse, json, sys, math, os, warnings
+import argparse, bisect, csv, hashlib, io, json, sys, math, os, threading, time, warnings
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import cached_property
 import numpy as np
 
 warnings.filterwarnings("ignore", category=FutureWarning)
@@ -70,71 +85,472 @@ def get_device(prefer_gpu=True):
 
 
 # ============================================================================
-# Audio loading with GPU-accelerated MFCC (torchaudio) or librosa fallback
+# Audio loading (single decode) with GPU-accelerated MFCC (torchaudio) or
+# librosa fallback
 # ============================================================================
 
-def load_audio_and_mfcc(audio_path, sr=16000, n_mfcc=13, device="cpu"):
+def _read_wav_mmap(audio_path, sr):
+    """Memory-map a PCM/float WAV that is already at ``sr``.
+
+    Mono float32 files are returned as a read-only view of the file with no
+    copy; integer PCM is converted to float32 straight from the mapping.
+    Returns None for anything else (other formats or sample rates), which
+    the caller decodes and resamples instead.
     """
-    Load audio and compute MFCCs.
+    from scipy.io import wavfile
+    try:
+        file_sr, data = wavfile.read(audio_path, mmap=True)
+    except Exception:
+        return None
+    return _wav_samples(file_sr, data, sr)
 
-    Attempts torchaudio on the requested device first; falls back to librosa
-    on CPU if torchaudio is unavailable or the GPU transfer fails.
+
+def _wav_samples(file_sr, data, sr):
+    """Mono float32 view/copy of ``wavfile.read`` output, or None if it is
+    not at ``sr`` or has an unsupported sample type."""
+    if file_sr != sr or data.size == 0:
+        return None
+    if data.ndim > 1:
+        data = data.mean(axis=1, dtype=np.float32)
+    if data.dtype == np.float32:
+        return data
+    scale = {
+        np.dtype(np.int16): 32768.0,
+        np.dtype(np.int32): 2147483648.0,
+    }.get(data.dtype)
+    if scale is not None:
+        return data.astype(np.float32) / np.float32(scale)
+    if data.dtype == np.uint8:
+        return (data.astype(np.float32) - 128.0) / 128.0
+    if data.dtype == np.float64:
+        return data.astype(np.float32)
+    return None
+
+
+def load_audio(audio_path, sr=16000):
+    """Decode ``audio_path`` once to a mono float32 waveform at ``sr``.
+
+    PCM WAV input that is already at ``sr`` (what the Node bridge produces)
+    is memory-mapped; anything else is decoded and resampled with
+    torchaudio, falling back to librosa.
 
     Returns
     -------
-    y : np.ndarray   -- mono float32 waveform at ``sr``
-    sr : int          -- sample rate
-    mfccs : np.ndarray -- (n_mfcc, T) MFCC matrix
-    backend : str     -- "torchaudio" or "librosa"
+    y : np.ndarray -- mono float32 waveform at ``sr``
+    loader : str   -- "wav-mmap", "torchaudio" or "librosa"
     """
-    # --- try torchaudio (GPU-capable) ---
+    y = _read_wav_mmap(audio_path, sr)
+    if y is not None:
+        return y, "wav-mmap"
+
     try:
-        import torch
         import torchaudio
 
         waveform, orig_sr = torchaudio.load(audio_path)
-
         # Mono
         if waveform.shape[0] > 1:
             waveform = waveform.mean(dim=0, keepdim=True)
-
         # Resample
         if orig_sr != sr:
-            resampler = torchaudio.transforms.Resample(orig_freq=orig_sr, new_freq=sr)
-            waveform = resampler(waveform)
+            waveform = _torch_resampler(orig_sr, sr)(waveform)
+        return waveform.squeeze(0).numpy().astype(np.float32), "torchaudio"
+    except ImportError:
+        pass
+    except Exception:
+        pass
+
+    import librosa
+    y, _ = librosa.load(audio_path, sr=sr, mono=True)
+    return y.astype(np.float32, copy=False), "librosa"
+
+
+# torchaudio modules are built once per configuration and reused across
+# files and requests (building them costs more than a short clip's MFCC)
+_TORCH_MODULES = {}
+_TORCH_MODULES_LOCK = threading.Lock()
+
+# Historical torchaudio MFCC settings (25 ms / 10 ms at 16 kHz, 40 mels)
+TORCH_MELKWARGS = {"n_fft": 512, "hop_length": 160, "n_mels": 40}
+# Dynamic range kept by the mel dB conversion of either MFCC backend
+MFCC_TOP_DB = 80.0
+# Padded samples per MFCC batch; bounds the batch tensor to ~40 MB
+MFCC_BATCH_SAMPLES = 10 * 60 * 16000
+
+
+def _torch_module(key, factory):
+    """Cached torch module for ``key``, built with ``factory()`` on first use."""
+    with _TORCH_MODULES_LOCK:
+        module = _TORCH_MODULES.get(key)
+        if module is None:
+            module = _TORCH_MODULES[key] = factory()
+        return module
 
-        # GPU-accelerated MFCC
-        mfcc_transform = torchaudio.transforms.MFCC(
-            sample_rate=sr, n_mfcc=n_mfcc,
-            melkwargs={"n_fft": 512, "hop_length": 160, "n_mels": 40},
+
+def _torch_resampler(orig_sr, sr):
+    import torchaudio
+    return _torch_module(
+        ("resample", orig_sr, sr),
+        lambda: torchaudio.transforms.Resample(orig_freq=orig_sr, new_freq=sr),
+    )
+
+
+def resample_waveform(y, orig_sr, sr=16000):
+    """Resample a mono float32 waveform like :func:`load_audio` does:
+    torchaudio when available, librosa otherwise."""
+    if orig_sr == sr:
+        return y
+    try:
+        import torch
+        return _torch_resampler(orig_sr, sr)(torch.from_numpy(y)[None]).squeeze(0).numpy()
+    except ImportError:
+        import librosa
+        return librosa.resample(y, orig_sr=orig_sr, target_sr=sr).astype(np.float32)
+
+
+def _torch_mfcc_modules(sr, n_mfcc, device):
+    """(mel spectrogram, power-to-dB, DCT matrix) on ``device``.
+
+    The same pipeline as ``torchaudio.transforms.MFCC(sample_rate=sr,
+    n_mfcc=n_mfcc, melkwargs=TORCH_MELKWARGS)``, except that frames are not
+    centred: callers reflect-pad each waveform themselves, so zero padding
+    added to batch several waveforms never reaches a real frame.
+    """
+    import torchaudio
+
+    def build():
+        mel = torchaudio.transforms.MelSpectrogram(
+            sample_rate=sr, center=False, **TORCH_MELKWARGS,
         )
+        to_db = torchaudio.transforms.AmplitudeToDB("power", top_db=MFCC_TOP_DB)
+        dct = torchaudio.functional.create_dct(
+            n_mfcc, TORCH_MELKWARGS["n_mels"], "ortho",
+        )
+        return mel.to(device), to_db.to(device), dct.to(device)
+
+    return _torch_module(("mfcc", sr, n_mfcc, str(device)), build)
+
+
+def _torch_mel_mfcc(waveforms, sr, n_mfcc, device):
+    """Mel spectrograms (dB) and MFCCs for one padded batch.
+
+    Each waveform is reflect-padded by ``n_fft // 2`` (what centred STFT
+    frames do), then zero-padded to the longest one.  The batch has shape
+    (B, 1, samples): with the channel axis, AmplitudeToDB's ``top_db`` floor
+    is taken per file rather than over the whole batch.  Each file has
+    ``1 + len // hop`` real frames; the power of later frames (which overlap
+    the padding) is masked to zero before the dB conversion so it cannot
+    raise that floor, and only the real frames are returned.  Every output
+    therefore depends on its own file's samples alone and equals an
+    unbatched run.
+    """
+    import torch
+    import torch.nn.functional as F
+
+    pad = TORCH_MELKWARGS["n_fft"] // 2
+    hop = TORCH_MELKWARGS["hop_length"]
+    padded = [
+        F.pad(torch.from_numpy(np.ascontiguousarray(y, dtype=np.float32))
+              .view(1, 1, -1), (pad, pad), mode="reflect").view(-1)
+        for y in waveforms
+    ]
+    batch = torch.zeros(len(padded), 1, max(len(p) for p in padded))
+    for i, p in enumerate(padded):
+        batch[i, 0, :len(p)] = p
+    n_frames = [1 + len(y) // hop for y in waveforms]
+
+    mel, to_db, dct = _torch_mfcc_modules(sr, n_mfcc, device)
+    with torch.no_grad():
+        power = mel(batch.to(device))                      # (B, 1, n_mels, T)
+        lengths = torch.tensor(n_frames, device=power.device)
+        mask = torch.arange(power.shape[-1], device=power.device) < lengths[:, None]
+        mel_db = to_db(power * mask[:, None, None, :])
+        mfcc = torch.matmul(mel_db.transpose(-1, -2), dct).transpose(-1, -2)
+    mel_db, mfcc = mel_db[:, 0].cpu().numpy(), mfcc[:, 0].cpu().numpy()
+    return [(mel_db[i, :, :t], mfcc[i, :, :t]) for i, t in enumerate(n_frames)]
+
+
+def torch_mel_mfcc_batch(waveforms, sr=16000, n_mfcc=13, device="cpu",
+                         max_batch_samples=MFCC_BATCH_SAMPLES):
+    """Mel spectrograms (dB) and MFCCs for many waveforms with torchaudio.
+
+    Waveforms are sorted by length and grouped into padded batches of at
+    most ``max_batch_samples`` padded samples, each computed in one tensor
+    operation on ``device`` (CPU threads, CUDA or MPS).  A batch that fails
+    on the device is recomputed on CPU.  Raises ImportError without torch.
+
+    Returns a list of ``(mel_db, mfccs)`` arrays in input order, shapes
+    (n_mels, T_i) and (n_mfcc, T_i).
+    """
+    import torch  # noqa: F401 -- ImportError tells the caller to fall back
+    order = sorted(range(len(waveforms)), key=lambda i: len(waveforms[i]))
+    results = [None] * len(waveforms)
+    group = []
+
+    def flush():
+        ys = [waveforms[i] for i in group]
         try:
-            waveform_dev = waveform.to(device)
-            mfcc_transform = mfcc_transform.to(device)
-            mfcc_tensor = mfcc_transform(waveform_dev)  # (1, n_mfcc, T)
-            mfccs = mfcc_tensor.squeeze(0).cpu().numpy()
+            out = _torch_mel_mfcc(ys, sr, n_mfcc, device)
         except Exception:
-            # GPU failed, run on CPU tensor
-            mfcc_tensor = torchaudio.transforms.MFCC(
-                sample_rate=sr, n_mfcc=n_mfcc,
-                melkwargs={"n_fft": 512, "hop_length": 160, "n_mels": 40},
-            )(waveform)
-            mfccs = mfcc_tensor.squeeze(0).numpy()
+            if str(device) == "cpu":
+                raise
+            out = _torch_mel_mfcc(ys, sr, n_mfcc, "cpu")  # GPU failed
+        for i, r in zip(group, out):
+            results[i] = r
+        group.clear()
+
+    for i in order:
+        # Sorted ascending, so the current waveform sets the padded length
+        if group and (len(group) + 1) * len(waveforms[i]) > max_batch_samples:
+            flush()
+        group.append(i)
+    if group:
+        flush()
+    return results
+
+
+def compute_mfcc_batch(waveforms, sr=16000, n_mfcc=13, device="cpu"):
+    """MFCC matrices for several waveforms: batched torchaudio, or librosa
+    per waveform when torchaudio is unavailable.
+
+    Returns a list of ``(mfccs, backend)`` in input order, each equal to
+    ``compute_mfcc(y, sr, n_mfcc, device)``.
+    """
+    try:
+        return [(mfccs, "torchaudio") for _, mfccs in
+                torch_mel_mfcc_batch(waveforms, sr, n_mfcc, device)]
+    except Exception:
+        pass
+    return [(SpectralFrontEnd(y, sr).mfcc(n_mfcc=n_mfcc), "librosa")
+            for y in waveforms]
 
-        y = waveform.squeeze(0).numpy().astype(np.float32)
-        return y, sr, mfccs, "torchaudio"
 
-    except ImportError:
-        pass
+def compute_mfcc(y, sr=16000, n_mfcc=13, device="cpu", spectra=None):
+    """MFCC matrix for ``y``.
+
+    Attempts torchaudio on the requested device first (a batch of one, see
+    :func:`torch_mel_mfcc_batch`); falls back to librosa on CPU if
+    torchaudio is unavailable or fails.  The librosa path reads its
+    spectrogram from ``spectra`` (a :class:`SpectralFrontEnd` of ``y``)
+    when given.
+
+    Returns
+    -------
+    mfccs : np.ndarray -- (n_mfcc, T) MFCC matrix
+    backend : str      -- "torchaudio" or "librosa"
+    """
+    # --- try torchaudio (GPU-capable) ---
+    try:
+        mfccs = torch_mel_mfcc_batch([y], sr, n_mfcc, device)[0][1]
+        return mfccs, "torchaudio"
     except Exception:
         pass
 
     # --- fallback: librosa (CPU only) ---
-    import librosa
+    spectra = spectra or SpectralFrontEnd(y, sr)
+    return spectra.mfcc(n_mfcc=n_mfcc), "librosa"
+
+
+def mel_db_frames(y, sr=16000, device="cpu", spectra=None, start=0):
+    """Mel spectrogram in dB *before* the ``MFCC_TOP_DB`` floor, from the
+    backend and settings :func:`compute_mfcc` uses.
+
+    For callers that see a recording in pieces: ``y`` begins at sample
+    ``start`` of the recording, and frames are placed on the recording's
+    frame grid (centred on multiples of the hop), so they equal the
+    whole-recording frames away from the piece's edges.  The floor has to
+    come from the whole recording's peak, see :func:`mfcc_from_mel_db`.
+    ``spectra`` (a :class:`SpectralFrontEnd` of ``y``) is only used when
+    ``y`` already starts on the grid.
+
+    Returns
+    -------
+    mel_db : np.ndarray  -- (n_mels, T)
+    centres : np.ndarray -- (T,) frame centres, in samples of ``y``
+    backend : str        -- "torchaudio" or "librosa"
+    """
+    try:
+        import torch
+        import torch.nn.functional as F
+        hop = TORCH_MELKWARGS["hop_length"]
+        skip = -start % hop
+        mel, _, _ = _torch_mfcc_modules(sr, 13, device)
+        pad = TORCH_MELKWARGS["n_fft"] // 2
+        x = F.pad(torch.from_numpy(np.ascontiguousarray(y[skip:], dtype=np.float32))
+                  .view(1, 1, -1), (pad, pad), mode="reflect").view(-1)
+        with torch.no_grad():
+            mel_db = 10.0 * torch.log10(torch.clamp(mel(x.to(device)), min=1e-10))
+        mel_db, backend = mel_db.cpu().numpy(), "torchaudio"
+    except Exception:
+        hop = STFT_HOP
+        skip = -start % hop
+        if skip or spectra is None:
+            spectra = SpectralFrontEnd(y[skip:], sr)
+        mel_db, backend = spectra.log_mel(top_db=None), "librosa"
+    return mel_db, skip + np.arange(mel_db.shape[1]) * hop, backend
+
+
+def mfcc_from_mel_db(mel_db, floor, n_mfcc=13):
+    """MFCC matrix of an unfloored mel dB spectrogram with values below
+    ``floor`` raised to it (``top_db`` with an explicit reference)."""
+    import scipy.fft
+    return scipy.fft.dct(np.maximum(mel_db, floor), axis=0, type=2,
+                         norm="ortho")[:n_mfcc]
+
+
+# Raw PCM sample layouts accepted over stdin (mono, little-endian)
+PCM_FORMATS = {"s16le": np.dtype("<i2"), "f32le": np.dtype("<f4")}
+AUDIO_INPUT_FORMATS = ("encoded", *PCM_FORMATS)
+
+
+def pcm_to_float32(data, pcm_format):
+    """Mono float32 samples from raw ``pcm_format`` bytes (a trailing
+    partial sample is dropped)."""
+    dtype = PCM_FORMATS[pcm_format]
+    y = np.frombuffer(data, dtype=dtype, count=len(data) // dtype.itemsize)
+    if dtype.kind == "i":
+        return y.astype(np.float32) / np.float32(32768.0)
+    return y.astype(np.float32)
+
+
+def _ffmpeg_decode(data, sr):
+    """Decode ``data`` with ffmpeg over pipes; returns mono float32 at ``sr``."""
+    import subprocess
+    proc = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-loglevel", "error", "-i", "pipe:0",
+         "-f", "s16le", "-ac", "1", "-ar", str(sr), "pipe:1"],
+        input=data, capture_output=True, timeout=60,
+    )
+    if proc.returncode != 0 or not proc.stdout:
+        message = proc.stderr.decode("utf-8", "replace").strip().splitlines()
+        raise RuntimeError(f"ffmpeg decode failed: {message[-1] if message else proc.returncode}")
+    return pcm_to_float32(proc.stdout, "s16le")
+
+
+def decode_audio_bytes(data, audio_format="encoded", sr=16000):
+    """Decode an in-memory recording to a mono float32 waveform at ``sr``.
+
+    ``audio_format`` is a :data:`PCM_FORMATS` key for raw mono PCM already
+    at ``sr``, or "encoded" for a container file: PCM WAV at ``sr`` is read
+    in-process, anything libsndfile reads (WAV at any rate, FLAC, Ogg) is
+    decoded with soundfile and resampled (:func:`resample_waveform`), and
+    only other codecs are piped through ffmpeg.  Nothing touches the disk.
+
+    Returns (y, loader) like :func:`load_audio`.
+    """
+    if audio_format in PCM_FORMATS:
+        return pcm_to_float32(data, audio_format), f"pcm-{audio_format}"
+    if audio_format != "encoded":
+        raise ValueError(f"Unknown audio format: {audio_format!r}")
+    from scipy.io import wavfile
+    try:
+        y = _wav_samples(*wavfile.read(io.BytesIO(data)), sr)
+    except Exception:
+        y = None
+    if y is not None:
+        return y, "wav-memory"
+    try:
+        import soundfile as sf
+        samples, file_sr = sf.read(io.BytesIO(data), dtype="float32", always_2d=True)
+    except Exception:
+        samples = None
+    if samples is not None and samples.size:
+        y = samples.mean(axis=1, dtype=np.float32) if samples.shape[1] > 1 else samples[:, 0]
+        return resample_waveform(np.ascontiguousarray(y), file_sr, sr), "soundfile-memory"
+    return _ffmpeg_decode(data, sr), "ffmpeg-pipe"
+
+
+def load_audio_and_mfcc(audio_path, sr=16000, n_mfcc=13, device="cpu"):
+    """
+    Load audio and compute MFCCs.
+
+    Returns
+    -------
+    y : np.ndarray   -- mono float32 waveform at ``sr``
+    sr : int          -- sample rate
+    mfccs : np.ndarray -- (n_mfcc, T) MFCC matrix
+    backend : str     -- "torchaudio" or "librosa"
+    """
+    y, _ = load_audio(audio_path, sr=sr)
+    mfccs, backend = compute_mfcc(y, sr=sr, n_mfcc=n_mfcc, device=device)
+    return y, sr, mfccs, backend
+
+
+def make_sound(y, sr):
+    """Parselmouth Sound built from the shared waveform (no second decode)."""
+    import parselmouth
+    return parselmouth.Sound(np.asarray(y, dtype=np.float64), sampling_frequency=sr)
+
+
+# ============================================================================
+# Spectral front end -- STFTs shared across consumers of one waveform
+# ============================================================================
+
+# librosa's defaults, used by MFCC, HPSS and onset detection alike
+STFT_N_FFT = 2048
+STFT_HOP = 512
+
+
+class SpectralFrontEnd:
+    """STFT-derived matrices of one waveform, each computed once.
+
+    The complex STFT, its power spectrogram and the log-mel spectrogram are
+    cached per (n_fft, hop, window) configuration for the life of the
+    object (one request, or one window of a chunked run).  Every result is
+    exactly what the corresponding librosa call on ``y`` computes
+    internally, so consumers fed from here give unchanged values.
+
+    Consumers: librosa MFCC, HPSS (spectral harmonicity) and DDK onset
+    detection.  CPP, H1-H2 and spectral tilt use their own 40 ms / 2 s
+    analysis windows, which no other feature shares; they keep their
+    block-wise FFTs so their working set stays bounded.
+    """
 
-    y, sr = librosa.load(audio_path, sr=sr, mono=True)
-    mfccs = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=n_mfcc)
-    return y, sr, mfccs, "librosa"
+    def __init__(self, y, sr, profiler=None):
+        self.y = y
+        self.sr = sr
+        self.profiler = profiler or NULL_PROFILER
+        self._cache = {}
+
+    def _get(self, key, compute):
+        if key not in self._cache:
+            with self.profiler.stage(f"spectra.{key[0]}", nested=False):
+                self._cache[key] = compute()
+        return self._cache[key]
+
+    def stft(self, n_fft=STFT_N_FFT, hop_length=STFT_HOP, window="hann"):
+        """Complex STFT (centred frames, zero padding), shape (1 + n_fft/2, T)."""
+        import librosa
+        return self._get(
+            ("stft", n_fft, hop_length, window),
+            lambda: librosa.stft(self.y, n_fft=n_fft, hop_length=hop_length,
+                                 window=window, center=True, pad_mode="constant"),
+        )
+
+    def power(self, n_fft=STFT_N_FFT, hop_length=STFT_HOP, window="hann"):
+        """``|stft| ** 2``."""
+        return self._get(
+            ("power", n_fft, hop_length, window),
+            lambda: np.abs(self.stft(n_fft, hop_length, window)) ** 2,
+        )
+
+    def log_mel(self, n_mels=128, n_fft=STFT_N_FFT, hop_length=STFT_HOP,
+                window="hann", top_db=MFCC_TOP_DB):
+        """Mel power spectrogram (fmax = sr/2) in dB, as MFCC and onset
+        strength compute it."""
+        import librosa
+        return self._get(
+            ("log_mel", n_mels, n_fft, hop_length, window, top_db),
+            lambda: librosa.power_to_db(librosa.feature.melspectrogram(
+                S=self.power(n_fft, hop_length, window), sr=self.sr, n_mels=n_mels,
+            ), top_db=top_db),
+        )
+
+    def mfcc(self, n_mfcc=13):
+        """librosa MFCC matrix, (n_mfcc, T)."""
+        import librosa
+        if _reference_mode():
+            return librosa.feature.mfcc(y=self.y, sr=self.sr, n_mfcc=n_mfcc)
+        return librosa.feature.mfcc(S=self.log_mel(), n_mfcc=n_mfcc)
 
 
 # ============================================================================
@@ -161,6 +577,147 @@ def sanitize_features(features):
     return sanitized
 
 
+# ============================================================================
+# Extractor mode -- optimised ("fast") or reference implementations
+# ============================================================================
+#
+# Every optimised kernel (CPP, formant read-out, H1-H2, RMS, the nonlinear
+# estimators) keeps its straightforward per-frame / library counterpart.
+# "reference" routes all of them to those counterparts so the equivalence
+# harness (scripts/golden_equivalence.py) can compare the two paths on the
+# same input.  The nonlinear measures are the exception: their reference
+# decimates as the original code did (nolds on ``y[::step]``), so changes
+# to the decimation show up as drift too.  Production uses "fast".
+
+EXTRACTOR_MODES = ("fast", "reference")
+_extractor_mode = os.environ.get("CVF_EXTRACTOR_MODE", "fast")
+if _extractor_mode not in EXTRACTOR_MODES:
+    _extractor_mode = "fast"
+
+
+def set_extractor_mode(mode):
+    """Select the "fast" or "reference" implementations process-wide."""
+    global _extractor_mode
+    if mode not in EXTRACTOR_MODES:
+        raise ValueError(f"Unknown extractor mode: {mode}")
+    _extractor_mode = mode
+
+
+def get_extractor_mode():
+    return _extractor_mode
+
+
+def _reference_mode():
+    return _extractor_mode == "reference"
+
+
+# ============================================================================
+# Profiling -- opt-in wall/CPU time per stage
+# ============================================================================
+
+class StageProfiler:
+    """Wall and CPU time per named stage of one extraction.
+
+    ``stage(name)`` times a block; ``lap(name)`` splits the enclosing stage
+    into consecutive sub-blocks without re-indenting them (a lap ends where
+    the next one starts, the last one when the stage exits).  Names are
+    dotted paths such as ``extract_tier1.jitter_local``; times are inclusive
+    and repeated stages accumulate.  CPU time is process-wide, so it covers
+    BLAS/FFT threads too.  A disabled profiler records nothing.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.stages = {}
+        self.info = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()  # per-thread stage stack
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, name, wall0, cpu0):
+        wall_ms = (time.perf_counter() - wall0) * 1000
+        cpu_ms = (time.process_time() - cpu0) * 1000
+        with self._lock:
+            entry = self.stages.setdefault(
+                name, {"wall_ms": 0.0, "cpu_ms": 0.0, "calls": 0})
+            entry["wall_ms"] += wall_ms
+            entry["cpu_ms"] += cpu_ms
+            entry["calls"] += 1
+
+    @contextmanager
+    def stage(self, name, nested=True):
+        """Time the enclosed block; ``nested=False`` keeps ``name`` top-level."""
+        if not self.enabled:
+            yield
+            return
+        stack = self._stack()
+        path = f"{stack[-1][0]}.{name}" if nested and stack else name
+        frame = [path, None]  # [path, open lap]
+        stack.append(frame)
+        wall0, cpu0 = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            self._close_lap(frame)
+            stack.pop()
+            self._record(path, wall0, cpu0)
+
+    def lap(self, name):
+        """Start sub-block ``name`` of the current stage."""
+        if not self.enabled:
+            return
+        stack = self._stack()
+        if not stack:
+            return
+        frame = stack[-1]
+        self._close_lap(frame)
+        frame[1] = (f"{frame[0]}.{name}", time.perf_counter(), time.process_time())
+
+    def _close_lap(self, frame):
+        if frame[1] is not None:
+            self._record(*frame[1])
+            frame[1] = None
+
+    def note(self, **info):
+        """Attach run facts (backends, devices) to the report."""
+        if self.enabled:
+            self.info.update(info)
+
+    def report(self):
+        """The ``timings`` block: stages, peak RSS and the noted run facts."""
+        with self._lock:
+            stages = {
+                name: {"wall_ms": round(e["wall_ms"], 2),
+                       "cpu_ms": round(e["cpu_ms"], 2),
+                       "calls": e["calls"]}
+                for name, e in self.stages.items()
+            }
+        return {"stages": stages, "peak_rss_mb": _peak_rss_mb(), **self.info}
+
+
+NULL_PROFILER = StageProfiler(enabled=False)
+
+
+def _peak_rss_mb():
+    """High-water RSS of this process in MB (None where unsupported).
+
+    In worker mode this is the worker's peak since it started, not only
+    the current request's.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, KiB on Linux
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
 # ============================================================================
 # nolds helper -- prefer nolds-rs, fall back to Python nolds
 # ============================================================================
@@ -177,205 +734,949 @@ def _get_nolds():
 
 
 # ============================================================================
-# Tier 1: Core acoustic features (F0, jitter, shimmer, HNR, MFCC)
+# Nonlinear dynamics -- sample entropy, correlation dimension, DFA
 # ============================================================================
+#
+# The signal is first reduced to at most ``max_points`` samples.  The
+# default (``"stride"``) is the historical ``y[::step]`` with 5000 / 3000
+# point caps, which the RPDE / DFA / D2 norms in src/engine/indicators.js
+# were derived on.  The ``full`` quality tier instead low-pass filters
+# before decimating (``"filter"``, polyphase anti-aliasing) and raises the
+# caps.  Filtering changes the values substantially (synthetic audio:
+# conversation RPDE ~0.70 -> ~0.03, sustained-vowel D2 ~1.6 -> ~2.7), so
+# results from the two are not comparable against the same norms.
+# Sample entropy and correlation dimension then count neighbours with a
+# KD-tree rather than materialising the O(n^2) distance matrix nolds builds,
+# so memory is O(n) and the point caps can be higher than before.  DFA
+# detrends every window of a given size at once in closed form instead of
+# one ``polyfit`` per window.  All three count what nolds counts (same
+# template sets, radii, windows) and use its default parameters: the sample
+# entropy tolerance formula, ``std(ddof=1)``-scaled radii, and a RANSAC fit
+# of the DFA / D2 log-log line (:func:`_fit_slope`).  nolds' RANSAC is
+# unseeded; here it is seeded with :data:`RANSAC_SEED`, so on identical
+# input the values equal ``nolds.sampen(x)``, ``nolds.dfa(x)`` and
+# ``nolds.corr_dim(x, 10)`` run after ``np.random.seed(RANSAC_SEED)``.
+
+NONLINEAR_PARAMS = {
+    "decimation": "stride",             # or "filter" (see decimate_signal)
+    "sampen_emb_dim": 2,
+    "sampen_tolerance": None,           # x std(ddof=1); None = nolds default
+    "entropy_max_points": 5000,         # sample entropy and DFA input
+    "corr_dim_emb_dim": 10,
+    "corr_dim_r_range": (0.1, 0.5),     # x std(ddof=1)
+    "corr_dim_r_factor": 1.03,
+    "corr_dim_max_points": 3000,
+    "fit": "RANSAC",                    # DFA / D2 line fit, or "poly"
+}
+
+RANSAC_SEED = 0
+
+
+def decimate_signal(y, max_points, method="stride"):
+    """Integer decimation of ``y`` to at most ~``max_points``.
+
+    The factor is ``len(y) // max_points``.  ``"stride"`` keeps every
+    factor-th sample (``y[::step]``); ``"filter"`` low-pass filters first
+    (Kaiser-windowed polyphase FIR), so energy above the new Nyquist
+    frequency no longer folds into the estimators.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    step = max(1, len(y) // max_points)
+    if step == 1:
+        return y
+    if method == "stride":
+        return y[::step]
+    from scipy.signal import resample_poly
+    return resample_poly(y, 1, step)
 
-def extract_tier1(sound, y, sr, mfccs=None):
-    """Core features using parselmouth Sound + librosa/torchaudio arrays.
 
-    Parameters
-    ----------
-    sound : parselmouth.Sound
-    y : np.ndarray
-    sr : int
-    mfccs : np.ndarray or None
-        Pre-computed (n_mfcc, T) matrix.  If None, computed via librosa.
-    """
-    from parselmouth.praat import call
-    features = {}
+def _delay_embedding(x, emb_dim):
+    """(n - emb_dim + 1, emb_dim) view of consecutive windows of ``x``."""
+    return np.lib.stride_tricks.sliding_window_view(x, emb_dim)
 
-    # F0 via Praat pitch tracking (75-500 Hz)
-    try:
-        pitch = call(sound, "To Pitch", 0.0, 75, 500)
-        f0 = pitch.selected_array["frequency"]
-        f0v = f0[f0 > 0]
-        if len(f0v) > 0:
-            features["f0_mean"] = float(np.mean(f0v))
-            features["f0_sd"] = float(np.std(f0v))
-            features["f0_range"] = float(np.max(f0v) - np.min(f0v))
-        else:
-            features["f0_mean"] = features["f0_sd"] = features["f0_range"] = None
-    except Exception:
-        features["f0_mean"] = features["f0_sd"] = features["f0_range"] = None
 
-    # Jitter local
-    try:
-        pp = call(sound, "To PointProcess (periodic, cc)", 75, 500)
-        features["jitter_local"] = float(
-            call(pp, "Get jitter (local)", 0, 0, 0.0001, 0.02, 1.3)
-        )
-    except Exception:
-        features["jitter_local"] = None
+def _strictly_below(r):
+    """Largest float < r: KD-tree counts are ``<=``, nolds counts ``<``."""
+    return np.nextafter(r, 0.0)
 
-    # Shimmer local
-    try:
-        pp = call(sound, "To PointProcess (periodic, cc)", 75, 500)
-        features["shimmer_local"] = float(
-            call([sound, pp], "Get shimmer (local)", 0, 0, 0.0001, 0.02, 1.3, 1.6)
-        )
-    except Exception:
-        features["shimmer_local"] = None
 
-    # HNR
-    try:
-        harm = call(sound, "To Harmonicity (cc)", 0.01, 75, 0.1, 1.0)
-        features["hnr"] = float(call(harm, "Get mean", 0, 0))
-    except Exception:
-        features["hnr"] = None
+def sample_entropy(x, emb_dim=2, tolerance=None):
+    """Sample entropy (Richman & Moorman 2000) with Chebyshev distance.
 
-    # MFCC coefficient 2 mean
+    Template pairs closer than ``tolerance`` are counted with a KD-tree pair
+    count.  The default tolerance is nolds' (0.2 * std for ``emb_dim=2``,
+    growing with the embedding dimension).  Returns ``inf`` when no
+    (m+1)-length matches exist, like nolds.
+    """
+    from scipy.spatial import cKDTree
+    x = np.asarray(x, dtype=np.float64)
+    if tolerance is None:
+        tolerance = np.std(x, ddof=1) * 0.1164 * (0.5627 * np.log(emb_dim) + 1.3334)
+    n_templates = len(x) - emb_dim
+    if n_templates < 2 or tolerance <= 0:
+        return np.nan
+    # Both template sets use the first n - emb_dim windows, so every
+    # m-template has an (m+1) extension (nolds does the same)
+    emb = _delay_embedding(x, emb_dim + 1)[:n_templates]
+    r = _strictly_below(tolerance)
+    counts = []
+    for m in (emb_dim, emb_dim + 1):
+        tree = cKDTree(emb[:, :m])
+        # Ordered pairs including self-matches; the ratio only needs i < j
+        counts.append((tree.count_neighbors(tree, r, p=np.inf) - n_templates) / 2)
+    if counts[1] == 0:
+        return np.inf
+    return float(-np.log(counts[1] / counts[0]))
+
+
+def correlation_dimension(x, emb_dim=10, rvals=None, fit="RANSAC"):
+    """Correlation dimension (Grassberger & Procaccia 1983).
+
+    C(r) for every radius comes from a single dual-tree traversal (pairs at
+    distance <= r, as nolds); the slope of log C(r) against log r is fitted
+    with :func:`_fit_slope`.  ``rvals`` defaults to a geometric series from
+    0.1 to 0.5 std (factor 1.03).
+    """
+    from scipy.spatial import cKDTree
+    x = np.asarray(x, dtype=np.float64)
+    n = len(x)
+    if rvals is None:
+        sd = np.std(x, ddof=1)
+        lo, hi = NONLINEAR_PARAMS["corr_dim_r_range"]
+        rvals = _logarithmic_r(lo * sd, hi * sd, NONLINEAR_PARAMS["corr_dim_r_factor"])
+    rvals = np.asarray(rvals, dtype=np.float64)
+    if n <= emb_dim or len(rvals) == 0 or rvals[0] <= 0:
+        return np.nan
+    tree = cKDTree(_delay_embedding(x, emb_dim))
+    n = len(x) - emb_dim + 1  # embedded points
+    counts = tree.count_neighbors(tree, rvals)
+    csums = np.asarray(counts, dtype=np.float64) / (n * (n - 1))
+    keep = csums > 0
+    if keep.sum() < 2:
+        return np.nan
+    return _fit_slope(np.log(rvals[keep]), np.log(csums[keep]), fit)
+
+
+def _logarithmic_r(min_r, max_r, factor):
+    """min_r, min_r * factor, ... up to max_r (nolds.logarithmic_r)."""
+    if not max_r > min_r:
+        return np.empty(0)
+    n = int(np.floor(np.log(max_r / min_r) / np.log(factor)))
+    return min_r * factor ** np.arange(n + 1)
+
+
+def _logarithmic_n(min_n, max_n, factor):
+    """Distinct integer window sizes (nolds.logarithmic_n)."""
+    n_steps = int(np.floor(np.log(max_n / min_n) / np.log(factor)))
+    ns = [min_n]
+    for i in range(n_steps + 1):
+        n = int(np.floor(min_n * factor ** i))
+        if n > ns[-1]:
+            ns.append(n)
+    return ns
+
+
+def _fit_slope(x, y, fit="RANSAC"):
+    """Slope of a straight-line fit of ``y`` on ``x`` (``nolds.poly_fit``).
+
+    ``"RANSAC"`` is nolds' default robust fit (scikit-learn
+    ``RANSACRegressor`` around an intercept-free linear model on [1, x]),
+    seeded with :data:`RANSAC_SEED`; like nolds it falls back to least
+    squares (``"poly"``) without scikit-learn or without a consensus set.
+    """
+    if fit == "RANSAC":
+        try:
+            import sklearn.linear_model as sklin
+        except ImportError:
+            fit = "poly"
+    if fit == "poly":
+        return float(np.polyfit(x, y, 1)[0])
+    model = sklin.RANSACRegressor(sklin.LinearRegression(fit_intercept=False),
+                                  random_state=RANSAC_SEED)
     try:
-        if mfccs is not None:
-            features["mfcc2_mean"] = float(np.mean(mfccs[1]))
-        else:
-            import librosa
-            computed = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13)
-            features["mfcc2_mean"] = float(np.mean(computed[1]))
-    except Exception:
-        features["mfcc2_mean"] = None
+        model.fit(np.column_stack((np.ones(len(x)), x)), y)
+    except ValueError:
+        return float(np.polyfit(x, y, 1)[0])
+    return float(model.estimator_.coef_[1])
 
-    return features
 
+def detrended_fluctuation(x, nvals=None, fit="RANSAC"):
+    """DFA exponent with half-overlapping windows and linear detrending.
 
-# ============================================================================
-# Tier 2: Advanced features (nonlinear dynamics, cepstral, formants)
-# ============================================================================
+    For each window size the residual of a least-squares line is computed
+    for all windows in one matrix product, and the fluctuation is the RMS
+    of the residuals over all windows, as in nolds; ``nvals`` defaults to a geometric
+    series from 4 to 10 % of the signal length (factor 1.2), or 4-9 for
+    short signals.  The exponent is fitted with :func:`_fit_slope`.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    total = len(x)
+    if nvals is None:
+        if total <= 10:
+            return np.nan
+        nvals = _logarithmic_n(4, 0.1 * total, 1.2) if total > 70 else list(range(4, 10))
+    walk = np.cumsum(x - np.mean(x))
+    flucts = []
+    for n in nvals:
+        # Window starts 0, n//2, ... < total - n (as nolds with overlap=True)
+        windows = np.lib.stride_tricks.sliding_window_view(walk, n)[:total - n:n // 2]
+        t = np.arange(n, dtype=np.float64)
+        tc = t - t.mean()
+        centred = windows - windows.mean(axis=1, keepdims=True)
+        slope = (centred @ tc) / np.dot(tc, tc)
+        resid = centred - slope[:, None] * tc
+        # RMS over all windows (nolds: sqrt of the mean squared residual)
+        flucts.append(np.sqrt(np.mean(np.sum(resid * resid, axis=1) / n)))
+    flucts = np.asarray(flucts)
+    keep = flucts != 0
+    if keep.sum() < 2:
+        return np.nan
+    return _fit_slope(np.log(np.asarray(nvals, dtype=np.float64)[keep]),
+                      np.log(flucts[keep]), fit)
+
+
+def extract_nonlinear(y, kinds=("rpde", "dfa"), params=None, entropy_input=None):
+    """RPDE (sample-entropy proxy), DFA and/or D2 for one waveform.
+
+    ``params`` overrides entries of :data:`NONLINEAR_PARAMS`.
+    ``entropy_input`` supplies an already decimated signal for RPDE and DFA
+    (the chunked path builds it window by window).  Each measure is ``None``
+    when it cannot be computed.
+    """
+    p = {**NONLINEAR_PARAMS, **(params or {})}
+    if _reference_mode():
+        return _nonlinear_reference(y, kinds, p, entropy_input)
 
-def extract_tier2(sound, y, sr):
-    """Advanced features: RPDE, DFA, PPE, CPP, articulation rate, formants,
-    spectral harmonicity."""
-    from parselmouth.praat import call
-    nolds = _get_nolds()
     features = {}
+    if entropy_input is None and ("rpde" in kinds or "dfa" in kinds):
+        entropy_input = decimate_signal(y, p["entropy_max_points"], p["decimation"])
 
-    # RPDE (Recurrence Period Density Entropy) via sample entropy proxy
-    try:
-        step = max(1, len(y) // 5000)
-        rpde = nolds.sampen(y[::step].astype(np.float64), emb_dim=2)
-        features["rpde"] = float(rpde) if np.isfinite(rpde) else None
-    except Exception:
-        features["rpde"] = None
+    if "rpde" in kinds:
+        try:
+            tolerance = p["sampen_tolerance"]
+            if tolerance is not None:
+                tolerance *= np.std(entropy_input, ddof=1)
+            rpde = sample_entropy(entropy_input, emb_dim=p["sampen_emb_dim"],
+                                  tolerance=tolerance)
+            features["rpde"] = float(rpde) if np.isfinite(rpde) else None
+        except Exception:
+            features["rpde"] = None
 
-    # DFA (Detrended Fluctuation Analysis)
-    try:
-        step = max(1, len(y) // 5000)
-        dfa_val = nolds.dfa(y[::step].astype(np.float64))
-        features["dfa"] = float(dfa_val) if np.isfinite(dfa_val) else None
-    except Exception:
-        features["dfa"] = None
+    if "dfa" in kinds:
+        try:
+            dfa_val = detrended_fluctuation(entropy_input, fit=p["fit"])
+            features["dfa"] = float(dfa_val) if np.isfinite(dfa_val) else None
+        except Exception:
+            features["dfa"] = None
 
-    # PPE (Pitch Period Entropy) -- Little 2009 algorithm
-    try:
-        pitch = call(sound, "To Pitch", 0.0, 75, 500)
-        f0v = pitch.selected_array["frequency"]
-        f0v = f0v[f0v > 0]
-        if len(f0v) > 2:
-            st_diffs = 12.0 * np.log2(f0v[1:] / f0v[:-1])
-            hist, _ = np.histogram(st_diffs, bins=30, density=True)
-            hist = hist[hist > 0]
-            hist = hist / hist.sum()
-            features["ppe"] = float(-np.sum(hist * np.log2(hist)))
-        else:
-            features["ppe"] = None
-    except Exception:
-        features["ppe"] = None
+    if "d2" in kinds:
+        try:
+            d2_input = decimate_signal(y, p["corr_dim_max_points"], p["decimation"])
+            sd = np.std(d2_input, ddof=1)
+            lo, hi = p["corr_dim_r_range"]
+            d2 = correlation_dimension(
+                d2_input, emb_dim=p["corr_dim_emb_dim"],
+                rvals=_logarithmic_r(lo * sd, hi * sd, p["corr_dim_r_factor"]),
+                fit=p["fit"],
+            )
+            features["d2"] = float(d2) if np.isfinite(d2) else None
+        except Exception:
+            features["d2"] = None
 
-    # CPP (Cepstral Peak Prominence)
-    try:
-        features["cpp"] = _compute_cpp(y, sr)
-    except Exception:
-        features["cpp"] = None
+    return features
 
-    # Articulation rate (voiced frames / total as proxy)
-    try:
-        pitch = call(sound, "To Pitch", 0.0, 75, 500)
-        f0 = pitch.selected_array["frequency"]
-        features["articulation_rate"] = (
-            float(np.sum(f0 > 0) / len(f0)) if len(f0) > 0 else None
-        )
-    except Exception:
-        features["articulation_rate"] = None
 
-    # Formants F1, F2 mean via Praat
-    try:
-        formant = call(sound, "To Formant (burg)", 0.0, 5, 5500, 0.025, 50)
-        n = call(formant, "Get number of frames")
-        f1s, f2s = [], []
-        for i in range(1, n + 1):
-            t = call(formant, "Get time from frame number", i)
-            f1 = call(formant, "Get value at time", 1, t, "Hertz", "Linear")
-            f2 = call(formant, "Get value at time", 2, t, "Hertz", "Linear")
-            if not math.isnan(f1) and f1 > 0:
-                f1s.append(f1)
-            if not math.isnan(f2) and f2 > 0:
-                f2s.append(f2)
-        features["f1_mean"] = float(np.mean(f1s)) if f1s else None
-        features["f2_mean"] = float(np.mean(f2s)) if f2s else None
-    except Exception:
-        features["f1_mean"] = features["f2_mean"] = None
+# Input of the original nolds path, whatever the quality tier: y[::step]
+# with 5000 (sampen / DFA) and 3000 (D2) point caps.
+_REFERENCE_DECIMATION = {"decimation": "stride", "entropy_max_points": 5000,
+                         "corr_dim_max_points": 3000}
 
-    # Spectral harmonicity (harmonic-to-total energy ratio)
-    try:
-        features["spectral_harmonicity"] = _compute_spectral_harmonicity(y, sr)
-    except Exception:
-        features["spectral_harmonicity"] = None
 
+def _nonlinear_reference(y, kinds, p, entropy_input=None):
+    """The measures exactly as the original code computed them: nolds with
+    its default parameters and fits on ``y[::step]``
+    (:data:`_REFERENCE_DECIMATION`), whatever ``p`` asks.
+
+    The equivalence harness thus reports any drift from the original values,
+    including decimation, point caps, tolerances and line fits.  nolds'
+    RANSAC fits draw from NumPy's global generator, which is seeded with
+    :data:`RANSAC_SEED` for each call (and restored afterwards).
+    ``entropy_input`` is only used when there is no ``y`` (chunked path,
+    which builds it with the same decimation in reference mode).
+    """
+    nolds = _get_nolds()
+    p = {**p, **_REFERENCE_DECIMATION}
+    features = {}
+    if y is not None:
+        entropy_input = None
+    if entropy_input is None and ("rpde" in kinds or "dfa" in kinds):
+        entropy_input = decimate_signal(y, p["entropy_max_points"], p["decimation"])
+    calls = {
+        "rpde": lambda: nolds.sampen(entropy_input, emb_dim=2),
+        "dfa": lambda: nolds.dfa(entropy_input),
+        "d2": lambda: nolds.corr_dim(
+            decimate_signal(y, p["corr_dim_max_points"], p["decimation"]), emb_dim=10),
+    }
+    for kind in ("rpde", "dfa", "d2"):
+        if kind not in kinds:
+            continue
+        state = np.random.get_state()
+        try:
+            np.random.seed(RANSAC_SEED)
+            val = calls[kind]()
+            features[kind] = float(val) if np.isfinite(val) else None
+        except Exception:
+            features[kind] = None
+        finally:
+            np.random.set_state(state)
     return features
 
 
 # ============================================================================
-# Sustained vowel (/aaa/ micro-task)
+# Feature selection -- which intermediate analyses each output needs
 # ============================================================================
+#
+# Every output feature declares the intermediate products it is computed
+# from, and every product declares the products it is derived from.  A
+# request for a subset of features resolves to the transitive closure of
+# that graph; extractor blocks whose features are not selected are skipped,
+# and products outside the closure (MFCC, the Praat Sound, the lazy Praat
+# analyses, HPSS, ...) are never built.
+
+PRODUCT_DEPENDENCIES = {
+    "waveform": (),
+    "sound": ("waveform",),               # parselmouth.Sound
+    "pitch": ("sound",),                  # Praat Pitch (75-500 Hz)
+    "point_process": ("sound",),          # glottal pulses
+    "harmonicity": ("sound",),            # Praat Harmonicity (cc)
+    "formant": ("sound",),                # Praat Formant (burg)
+    "stft": ("waveform",),                # SpectralFrontEnd, librosa defaults
+    "log_mel": ("stft",),
+    "mfcc": ("log_mel",),                 # (torchaudio computes its own)
+    "hpss": ("stft",),
+    "onset_envelope": ("log_mel",),
+    "cepstrum": ("waveform",),            # per-frame CPP
+    "harmonic_spectra": ("waveform", "pitch"),  # per-pitch-frame H1-H2
+    "long_term_spectrum": ("waveform",),  # spectral tilt
+    "rms_track": ("waveform",),
+    "decimated": ("waveform",),           # nonlinear-dynamics input
+}
+
+_F0 = ("pitch",)
+_PULSES = ("point_process",)
+_FORMANT = ("formant",)
+_ONSETS = ("onset_envelope",)
+
+FEATURE_DEPENDENCIES = {
+    "f0_mean": _F0, "f0_sd": _F0, "f0_range": _F0, "f0_min": _F0, "f0_max": _F0,
+    "jitter_local": _PULSES, "jitter_local_abs": _PULSES, "jitter_rap": _PULSES,
+    "jitter_ppq5": _PULSES, "jitter_ddp": _PULSES,
+    "shimmer_local": _PULSES, "shimmer_local_db": _PULSES, "shimmer_apq3": _PULSES,
+    "shimmer_apq5": _PULSES, "shimmer_apq11": _PULSES, "shimmer_dda": _PULSES,
+    "hnr": ("harmonicity",),
+    "nhr": ("harmonicity",),
+    "mfcc2_mean": ("mfcc",),
+    "rpde": ("decimated",),
+    "dfa": ("decimated",),
+    "d2": ("decimated",),
+    "ppe": _F0,
+    "cpp": ("cepstrum",),
+    "articulation_rate": _F0,
+    "f1_mean": _FORMANT, "f2_mean": _FORMANT, "vsa": _FORMANT, "vai": _FORMANT,
+    "spectral_harmonicity": ("hpss",),
+    "formant_bandwidth": _FORMANT,
+    "spectral_tilt": ("long_term_spectrum",),
+    "voice_breaks": _F0,
+    "tremor_freq_power": _F0,
+    "breathiness_h1h2": ("harmonic_spectra",),
+    "loudness_decay": ("rms_track",),
+    "onset_count": _ONSETS, "ddk_rate": _ONSETS, "ddk_regularity_cv": _ONSETS,
+    "ddk_mean_ioi": _ONSETS, "ddk_sd_ioi": _ONSETS, "festination": _ONSETS,
+}
+
+_V5_FEATURES = (
+    "formant_bandwidth", "spectral_tilt", "voice_breaks", "tremor_freq_power",
+    "breathiness_h1h2", "loudness_decay",
+)
+_TIER1_FEATURES = (
+    "f0_mean", "f0_sd", "f0_range", "jitter_local", "shimmer_local", "hnr",
+    "mfcc2_mean",
+)
+
+# Features each task type produces when no selection is given
+TASK_FEATURES = {
+    "conversation": _TIER1_FEATURES + (
+        "rpde", "dfa", "ppe", "cpp", "articulation_rate", "f1_mean", "f2_mean",
+        "spectral_harmonicity",
+    ) + _V5_FEATURES,
+    "sustained_vowel": (
+        "jitter_local", "jitter_local_abs", "jitter_rap", "jitter_ppq5",
+        "jitter_ddp", "shimmer_local", "shimmer_local_db", "shimmer_apq3",
+        "shimmer_apq5", "shimmer_apq11", "shimmer_dda", "hnr", "nhr", "cpp",
+        "f0_mean", "f0_sd", "f0_min", "f0_max", "f0_range", "rpde", "dfa",
+        "ppe", "d2", "f1_mean", "f2_mean", "vsa", "vai",
+    ) + _V5_FEATURES,
+    "ddk": (
+        "onset_count", "ddk_rate", "ddk_regularity_cv", "ddk_mean_ioi",
+        "ddk_sd_ioi", "festination",
+    ),
+    "fluency": _TIER1_FEATURES + _V5_FEATURES,
+}
+
+
+def parse_feature_list(value):
+    """``"f0_mean, hnr"`` or ``["f0_mean", "hnr"]`` -> list of names, or None
+    for an empty / missing selection (= every feature of the task)."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.split(",")
+    names = [str(v).strip() for v in value if str(v).strip()]
+    return names or None
 
-def extract_sustained_vowel(sound, y, sr):
-    """Full jitter, shimmer, HNR, NHR, CPP, F0 stats, RPDE, DFA, PPE, D2."""
-    from parselmouth.praat import call
-    nolds = _get_nolds()
-    features = {}
 
-    # Point process (shared for jitter + shimmer)
-    try:
-        pp = call(sound, "To PointProcess (periodic, cc)", 75, 500)
-    except Exception:
-        pp = None
+def resolve_features(task_type, features=None):
+    """Resolve a feature selection against the dependency graph.
 
-    # Full jitter suite
-    jitter_defs = {
-        "jitter_local": "Get jitter (local)",
-        "jitter_local_abs": "Get jitter (local, absolute)",
-        "jitter_rap": "Get jitter (rap)",
-        "jitter_ppq5": "Get jitter (ppq5)",
-        "jitter_ddp": "Get jitter (ddp)",
-    }
-    for key, cmd in jitter_defs.items():
-        try:
-            val = call(pp, cmd, 0, 0, 0.0001, 0.02, 1.3) if pp else None
-            features[key] = (
-                float(val) if val is not None and np.isfinite(val) else None
-            )
-        except Exception:
-            features[key] = None
+    ``features`` is an iterable of names from :data:`FEATURE_DEPENDENCIES`,
+    or None for every feature of ``task_type``.  Names the task does not
+    produce are dropped (so one indicator list can be sent with any task);
+    unknown names raise ``ValueError``.
 
-    # Full shimmer suite
-    shimmer_defs = {
-        "shimmer_local": "Get shimmer (local)",
-        "shimmer_local_db": "Get shimmer (local, dB)",
-        "shimmer_apq3": "Get shimmer (apq3)",
-        "shimmer_apq5": "Get shimmer (apq5)",
-        "shimmer_apq11": "Get shimmer (apq11)",
-        "shimmer_dda": "Get shimmer (dda)",
+    Returns
+    -------
+    (selected, products) : frozensets of the task features to compute and
+    of every intermediate product they transitively need.
+    """
+    task_features = TASK_FEATURES.get(task_type, ())
+    if features is None:
+        selected = frozenset(task_features)
+    else:
+        requested = set(features)
+        unknown = requested - set(FEATURE_DEPENDENCIES)
+        if unknown:
+            raise ValueError(f"Unknown feature(s): {', '.join(sorted(unknown))}")
+        selected = frozenset(f for f in task_features if f in requested)
+
+    products = set()
+    pending = [p for f in selected for p in FEATURE_DEPENDENCIES[f]]
+    while pending:
+        product = pending.pop()
+        if product not in products:
+            products.add(product)
+            pending.extend(PRODUCT_DEPENDENCIES[product])
+    return selected, frozenset(products)
+
+
+def _wants(selected, *names):
+    """True if any of ``names`` is selected (``selected`` None = all)."""
+    return selected is None or any(name in selected for name in names)
+
+
+# ============================================================================
+# Quality tiers -- accuracy / latency trade-off per request
+# ============================================================================
+#
+# ``standard`` is the historical behaviour.  ``fast`` swaps in cheaper
+# estimators for interactive feedback; ``full`` lifts the point caps of the
+# nonlinear measures and decimates their input with an anti-aliasing
+# filter, for offline recomputation (its RPDE / DFA / D2 are on a different
+# scale from the standard norms, see NONLINEAR_PARAMS).  Results carry the tier
+# (``"quality"``) and it is part of the cache key, so values from different
+# tiers are never mixed up.
+
+QUALITY_TIERS = ("fast", "standard", "full")
+
+QUALITY_PRESETS = {
+    "fast": {
+        # NONLINEAR_PARAMS overrides: fewer points for sampen / DFA / D2
+        "nonlinear": {"entropy_max_points": 2000, "corr_dim_max_points": 1000},
+        "formant_time_step": 0.02,          # s (Praat's auto step is 6.25 ms)
+        "cpp_max_frames": 1000,             # wider hop beyond this many frames
+        "harmonicity": "autocorrelation",   # instead of HPSS median filtering
+    },
+    "standard": {
+        "nonlinear": {},
+        "formant_time_step": 0.0,
+        "cpp_max_frames": None,
+        "harmonicity": "hpss",
+    },
+    "full": {
+        # Anti-aliased decimation: not comparable with the standard norms
+        "nonlinear": {"decimation": "filter", "entropy_max_points": 40000,
+                      "corr_dim_max_points": 10000},
+        "formant_time_step": 0.0,
+        "cpp_max_frames": None,
+        "harmonicity": "hpss",
+    },
+}
+
+
+# ============================================================================
+# Analysis context -- Praat objects shared across extractors
+# ============================================================================
+
+class AnalysisContext:
+    """Per-recording state shared by every extractor.
+
+    Praat analyses (pitch, point process, formants, harmonicity) are built on
+    first access and reused afterwards, so a ``conversation`` run tracks
+    pitch once instead of six times.  All analysis parameters match the
+    values the extractors used when each called Praat directly.
+
+    Parameters
+    ----------
+    sound : parselmouth.Sound
+    y : np.ndarray
+        Mono waveform used by the NumPy/librosa features.
+    sr : int
+        Sample rate of ``y``.
+    mfccs : np.ndarray or None
+        Pre-computed (n_mfcc, T) matrix.  If None, computed via librosa.
+    profiler : StageProfiler or None
+        Receives one ``praat.*`` stage per analysis as it is built.
+    features : frozenset or None
+        Selected output features (see :func:`resolve_features`); extractor
+        blocks for other features are skipped.  None selects everything.
+    spectra : SpectralFrontEnd or None
+        Shared STFT cache for ``y``; a new one is made if None.
+    quality : str
+        One of :data:`QUALITY_TIERS`; selects the estimator settings in
+        :data:`QUALITY_PRESETS` (exposed as ``self.preset``).
+    voiced_only : bool
+        Run CPP, the nonlinear measures, spectral harmonicity and spectral
+        tilt on the voiced spans of :attr:`voicing` only.
+    """
+
+    def __init__(self, sound, y, sr, mfccs=None, profiler=None, features=None,
+                 spectra=None, quality="standard", voiced_only=False):
+        self.sound = sound
+        self.y = y
+        self.sr = sr
+        self.mfccs = mfccs
+        self.profiler = profiler or NULL_PROFILER
+        self.features = features
+        self.spectra = spectra or SpectralFrontEnd(y, sr, profiler=self.profiler)
+        self.quality = quality
+        self.preset = QUALITY_PRESETS[quality]
+        self.voiced_only = voiced_only
+
+    def wants(self, *names):
+        """True if any of the feature ``names`` is selected."""
+        return _wants(self.features, *names)
+
+    @cached_property
+    def pitch(self):
+        """Praat Pitch object (autocorrelation, 75-500 Hz)."""
+        from parselmouth.praat import call
+        with self.profiler.stage("praat.pitch", nested=False):
+            return call(self.sound, "To Pitch", 0.0, 75, 500)
+
+    @cached_property
+    def f0(self):
+        """F0 contour in Hz, one value per pitch frame (0 = unvoiced)."""
+        return self.pitch.selected_array["frequency"]
+
+    @cached_property
+    def point_process(self):
+        """Periodic point process (glottal pulses) for jitter/shimmer."""
+        from parselmouth.praat import call
+        with self.profiler.stage("praat.point_process", nested=False):
+            return call(self.sound, "To PointProcess (periodic, cc)", 75, 500)
+
+    @cached_property
+    def formant(self):
+        """Praat Formant object (Burg, 5 formants up to 5500 Hz)."""
+        from parselmouth.praat import call
+        with self.profiler.stage("praat.formant", nested=False):
+            return call(self.sound, "To Formant (burg)",
+                        self.preset["formant_time_step"], 5, 5500, 0.025, 50)
+
+    @cached_property
+    def formant_tracks(self):
+        """(times, frequencies, bandwidths) arrays for F1-F3, see
+        :func:`extract_formant_tracks`."""
+        return extract_formant_tracks(self.formant, n_formants=3)
+
+    @cached_property
+    def harmonicity(self):
+        """Praat Harmonicity object (cross-correlation method)."""
+        from parselmouth.praat import call
+        with self.profiler.stage("praat.harmonicity", nested=False):
+            return call(self.sound, "To Harmonicity (cc)", 0.01, 75, 0.1, 1.0)
+
+    @cached_property
+    def voicing(self):
+        """:class:`VoicedIndex` of the pitch track, shared by every
+        voicing-dependent feature."""
+        with self.profiler.stage("voicing", nested=False):
+            return VoicedIndex(self.f0, times=self.pitch.xs(), step=self.pitch.dx,
+                               sr=self.sr, n_samples=len(self.y))
+
+    @cached_property
+    def voiced_y(self):
+        """The voiced spans of ``y`` joined end to end."""
+        return self.voicing.gather(self.y)
+
+    def dsp_input(self):
+        """(waveform, spectra) for the signal-level measures: ``y`` and the
+        shared front end, or ``voiced_y`` and None when ``voiced_only``
+        (empty if pitch tracking failed, so those measures come out None)."""
+        if not self.voiced_only:
+            return self.y, self.spectra
+        try:
+            return self.voiced_y, None
+        except Exception:
+            return self.y[:0], None
+
+
+class VoicedIndex:
+    """Run-length index of the voiced frames of one pitch track.
+
+    Built once per recording from the F0 contour (0 = unvoiced).  Each
+    voiced run is kept as a [start, end) pair of pitch-frame indices in
+    ``frames`` and, when ``times`` and ``sr`` are given, of sample offsets
+    in ``samples`` (frame ``i`` covers ``step`` s centred on ``times[i]``,
+    clipped to ``n_samples``).  Voicing statistics are derived from the
+    runs, so the extractors no longer rescan ``f0 > 0`` each.
+
+    Parameters
+    ----------
+    f0 : np.ndarray
+        F0 per pitch frame (Hz).
+    times : np.ndarray or None
+        Frame centre times (s); without them ``samples`` is empty.
+    step : float or None
+        Pitch frame step (s).
+    sr : int or None
+        Sample rate of the waveform the sample offsets refer to.
+    n_samples : int or None
+        Length of that waveform.
+    """
+
+    def __init__(self, f0, times=None, step=None, sr=None, n_samples=None):
+        self.f0 = np.asarray(f0)
+        self.step = step
+        self.mask = self.f0 > 0
+        edges = np.diff(self.mask.astype(np.int8), prepend=0, append=0)
+        self.frames = np.column_stack((np.flatnonzero(edges == 1),
+                                       np.flatnonzero(edges == -1)))
+        self.samples = np.empty((0, 2), dtype=np.int64)
+        if times is not None and sr is not None and len(self.frames):
+            times = np.asarray(times)
+            bounds = np.column_stack((times[self.frames[:, 0]] - step / 2,
+                                      times[self.frames[:, 1] - 1] + step / 2))
+            limit = np.inf if n_samples is None else n_samples
+            self.samples = np.clip(np.round(bounds * sr), 0, limit).astype(np.int64)
+
+    def __len__(self):
+        """Number of voiced runs."""
+        return len(self.frames)
+
+    @cached_property
+    def indices(self):
+        """Indices of the voiced pitch frames."""
+        return np.flatnonzero(self.mask)
+
+    @cached_property
+    def voiced_f0(self):
+        """F0 of the voiced frames, in order."""
+        return self.f0[self.mask]
+
+    @property
+    def voiced_ratio(self):
+        """Share of pitch frames that are voiced (None for an empty track)."""
+        return float(len(self.indices) / len(self.f0)) if len(self.f0) else None
+
+    @property
+    def n_breaks(self):
+        """Voiced-to-unvoiced transitions (runs ending before the last frame)."""
+        return int(np.sum(self.frames[:, 1] < len(self.f0)))
+
+    @property
+    def n_voiced_samples(self):
+        """Total length of the voiced sample spans."""
+        return int(np.sum(self.samples[:, 1] - self.samples[:, 0]))
+
+    def spans(self):
+        """Yield ``(frame_start, frame_end, sample_start, sample_end)`` per
+        voiced run; sample offsets are None without a sample index."""
+        for i, (f_start, f_end) in enumerate(self.frames):
+            if len(self.samples):
+                s_start, s_end = self.samples[i]
+                yield int(f_start), int(f_end), int(s_start), int(s_end)
+            else:
+                yield int(f_start), int(f_end), None, None
+
+    def contains(self, positions):
+        """Boolean mask: which sample ``positions`` fall in a voiced span."""
+        positions = np.asarray(positions)
+        run = np.searchsorted(self.samples[:, 0], positions, side="right") - 1
+        inside = run >= 0
+        inside[inside] = positions[inside] < self.samples[run[inside], 1]
+        return inside
+
+    def gather(self, y):
+        """The voiced spans of ``y`` joined end to end."""
+        if not len(self.samples):
+            return y[:0]
+        return np.concatenate([y[s0:s1] for s0, s1 in self.samples])
+
+
+def extract_formant_tracks(formant, n_formants=3):
+    """Bulk-read formant frequencies and bandwidths from a Praat Formant.
+
+    Praat's per-frame query commands cost one interpreter round-trip each;
+    here the whole object is dumped through a single ``Down to Table`` /
+    ``List`` pair and parsed with NumPy.  Values equal those returned by
+    ``Get value at time`` / ``Get bandwidth at time`` at each frame centre.
+
+    Returns
+    -------
+    times : np.ndarray        -- (n_frames,) frame centre times (s)
+    frequencies : np.ndarray  -- (n_formants, n_frames) Hz, NaN if undefined
+    bandwidths : np.ndarray   -- (n_formants, n_frames) Hz, NaN if undefined
+    """
+    if _reference_mode():
+        return _formant_tracks_reference(formant, n_formants)
+    from parselmouth.praat import call
+    table = call(formant, "Down to Table",
+                 "no", "yes", 10, "no", 3, "no", 10, "yes")
+    text = call(table, "List", "no").replace("--undefined--", "nan")
+    # Columns: time, F1, B1, F2, B2, ... (one pair per formant)
+    rows = [line for line in text.splitlines()[1:] if line.strip()]
+    if not rows:
+        empty = np.empty((n_formants, 0))
+        return np.empty(0), empty, empty.copy()
+    data = np.loadtxt(io.StringIO("\n".join(rows)), ndmin=2)
+    n_avail = min(n_formants, (data.shape[1] - 1) // 2)
+    frequencies = np.full((n_formants, data.shape[0]), np.nan)
+    bandwidths = np.full((n_formants, data.shape[0]), np.nan)
+    frequencies[:n_avail] = data[:, 1:1 + 2 * n_avail:2].T
+    bandwidths[:n_avail] = data[:, 2:2 + 2 * n_avail:2].T
+    return data[:, 0], frequencies, bandwidths
+
+
+def _formant_tracks_reference(formant, n_formants=3):
+    """Frame-by-frame ``Get value at time`` / ``Get bandwidth at time``."""
+    from parselmouth.praat import call
+    n = call(formant, "Get number of frames")
+    times = np.array([call(formant, "Get time from frame number", i)
+                      for i in range(1, n + 1)])
+    frequencies = np.array([
+        [call(formant, "Get value at time", k, t, "Hertz", "Linear") for t in times]
+        for k in range(1, n_formants + 1)
+    ]).reshape(n_formants, n)
+    bandwidths = np.array([
+        [call(formant, "Get bandwidth at time", k, t, "Hertz", "Linear") for t in times]
+        for k in range(1, n_formants + 1)
+    ]).reshape(n_formants, n)
+    return times, frequencies, bandwidths
+
+
+def _positive_mean(values):
+    """Mean of the finite, strictly positive entries of ``values``, or None."""
+    values = values[np.isfinite(values) & (values > 0)]
+    return float(np.mean(values)) if len(values) else None
+
+
+# ============================================================================
+# Tier 1: Core acoustic features (F0, jitter, shimmer, HNR, MFCC)
+# ============================================================================
+
+def extract_tier1(ctx):
+    """Core features using parselmouth Sound + librosa/torchaudio arrays.
+
+    Parameters
+    ----------
+    ctx : AnalysisContext
+    """
+    from parselmouth.praat import call
+    sound, mfccs = ctx.sound, ctx.mfccs
+    features = {}
+    prof = ctx.profiler
+
+    if ctx.wants("f0_mean", "f0_sd", "f0_range"):
+        prof.lap("f0")
+        # F0 via Praat pitch tracking (75-500 Hz)
+        try:
+            f0v = ctx.voicing.voiced_f0
+            if len(f0v) > 0:
+                features["f0_mean"] = float(np.mean(f0v))
+                features["f0_sd"] = float(np.std(f0v))
+                features["f0_range"] = float(np.max(f0v) - np.min(f0v))
+            else:
+                features["f0_mean"] = features["f0_sd"] = features["f0_range"] = None
+        except Exception:
+            features["f0_mean"] = features["f0_sd"] = features["f0_range"] = None
+
+    if ctx.wants("jitter_local"):
+        prof.lap("jitter_local")
+        # Jitter local
+        try:
+            pp = ctx.point_process
+            features["jitter_local"] = float(
+                call(pp, "Get jitter (local)", 0, 0, 0.0001, 0.02, 1.3)
+            )
+        except Exception:
+            features["jitter_local"] = None
+
+    if ctx.wants("shimmer_local"):
+        prof.lap("shimmer_local")
+        # Shimmer local
+        try:
+            pp = ctx.point_process
+            features["shimmer_local"] = float(
+                call([sound, pp], "Get shimmer (local)", 0, 0, 0.0001, 0.02, 1.3, 1.6)
+            )
+        except Exception:
+            features["shimmer_local"] = None
+
+    if ctx.wants("hnr"):
+        prof.lap("hnr")
+        # HNR
+        try:
+            features["hnr"] = float(call(ctx.harmonicity, "Get mean", 0, 0))
+        except Exception:
+            features["hnr"] = None
+
+    if ctx.wants("mfcc2_mean"):
+        prof.lap("mfcc2_mean")
+        # MFCC coefficient 2 mean
+        try:
+            if mfccs is None:
+                mfccs = ctx.spectra.mfcc(n_mfcc=13)
+            features["mfcc2_mean"] = float(np.mean(mfccs[1]))
+        except Exception:
+            features["mfcc2_mean"] = None
+
+    return features
+
+
+# ============================================================================
+# Tier 2: Advanced features (nonlinear dynamics, cepstral, formants)
+# ============================================================================
+
+def extract_tier2(ctx):
+    """Advanced features: RPDE, DFA, PPE, CPP, articulation rate, formants,
+    spectral harmonicity."""
+    y, sr = ctx.y, ctx.sr
+    features = {}
+    prof = ctx.profiler
+
+    kinds = tuple(k for k in ("rpde", "dfa") if ctx.wants(k))
+    if kinds:
+        prof.lap("rpde_dfa")
+        # RPDE (Recurrence Period Density Entropy) via sample entropy proxy,
+        # DFA (Detrended Fluctuation Analysis)
+        features.update(extract_nonlinear(ctx.dsp_input()[0], kinds=kinds,
+                                          params=ctx.preset["nonlinear"]))
+
+    if ctx.wants("ppe"):
+        prof.lap("ppe")
+        # PPE (Pitch Period Entropy) -- Little 2009 algorithm
+        try:
+            features["ppe"] = _pitch_period_entropy(ctx.voicing)
+        except Exception:
+            features["ppe"] = None
+
+    if ctx.wants("cpp"):
+        prof.lap("cpp")
+        # CPP (Cepstral Peak Prominence)
+        try:
+            features["cpp"] = _compute_cpp(
+                y, sr, ctx.preset["cpp_max_frames"],
+                voicing=ctx.voicing if ctx.voiced_only else None,
+            )
+        except Exception:
+            features["cpp"] = None
+
+    if ctx.wants("articulation_rate"):
+        prof.lap("articulation_rate")
+        # Articulation rate (voiced frames / total as proxy)
+        try:
+            features["articulation_rate"] = ctx.voicing.voiced_ratio
+        except Exception:
+            features["articulation_rate"] = None
+
+    if ctx.wants("f1_mean", "f2_mean"):
+        prof.lap("formants")
+        # Formants F1, F2 mean via Praat
+        try:
+            _, freqs, _ = ctx.formant_tracks
+            features["f1_mean"] = _positive_mean(freqs[0])
+            features["f2_mean"] = _positive_mean(freqs[1])
+        except Exception:
+            features["f1_mean"] = features["f2_mean"] = None
+
+    if ctx.wants("spectral_harmonicity"):
+        prof.lap("spectral_harmonicity")
+        # Spectral harmonicity (harmonic-to-total energy ratio)
+        try:
+            y_dsp, spectra = ctx.dsp_input()
+            features["spectral_harmonicity"] = _compute_spectral_harmonicity(
+                y_dsp, sr, spectra, method=ctx.preset["harmonicity"],
+            )
+        except Exception:
+            features["spectral_harmonicity"] = None
+
+    return features
+
+
+# ============================================================================
+# Sustained vowel (/aaa/ micro-task)
+# ============================================================================
+
+def extract_sustained_vowel(ctx):
+    """Full jitter, shimmer, HNR, NHR, CPP, F0 stats, RPDE, DFA, PPE, D2."""
+    from parselmouth.praat import call
+    sound, y, sr = ctx.sound, ctx.y, ctx.sr
+    features = {}
+    prof = ctx.profiler
+
+    jitter_defs = {
+        "jitter_local": "Get jitter (local)",
+        "jitter_local_abs": "Get jitter (local, absolute)",
+        "jitter_rap": "Get jitter (rap)",
+        "jitter_ppq5": "Get jitter (ppq5)",
+        "jitter_ddp": "Get jitter (ddp)",
+    }
+    shimmer_defs = {
+        "shimmer_local": "Get shimmer (local)",
+        "shimmer_local_db": "Get shimmer (local, dB)",
+        "shimmer_apq3": "Get shimmer (apq3)",
+        "shimmer_apq5": "Get shimmer (apq5)",
+        "shimmer_apq11": "Get shimmer (apq11)",
+        "shimmer_dda": "Get shimmer (dda)",
     }
+
+    prof.lap("point_process")
+    # Point process (shared for jitter + shimmer)
+    pp = None
+    if ctx.wants(*jitter_defs, *shimmer_defs):
+        try:
+            pp = ctx.point_process
+        except Exception:
+            pp = None
+
+    prof.lap("jitter")
+    # Full jitter suite
+    for key, cmd in jitter_defs.items():
+        if not ctx.wants(key):
+            continue
+        try:
+            val = call(pp, cmd, 0, 0, 0.0001, 0.02, 1.3) if pp else None
+            features[key] = (
+                float(val) if val is not None and np.isfinite(val) else None
+            )
+        except Exception:
+            features[key] = None
+
+    prof.lap("shimmer")
+    # Full shimmer suite
     for key, cmd in shimmer_defs.items():
+        if not ctx.wants(key):
+            continue
         try:
             val = (
                 call([sound, pp], cmd, 0, 0, 0.0001, 0.02, 1.3, 1.6)
@@ -388,86 +1689,75 @@ def extract_sustained_vowel(sound, y, sr):
         except Exception:
             features[key] = None
 
-    # HNR
-    try:
-        harm = call(sound, "To Harmonicity (cc)", 0.01, 75, 0.1, 1.0)
-        features["hnr"] = float(call(harm, "Get mean", 0, 0))
-    except Exception:
-        features["hnr"] = None
+    if ctx.wants("hnr", "nhr"):
+        prof.lap("hnr")
+        # HNR
+        try:
+            features["hnr"] = float(call(ctx.harmonicity, "Get mean", 0, 0))
+        except Exception:
+            features["hnr"] = None
 
-    # NHR (noise-to-harmonics = 1 / HNR_linear)
-    try:
-        if features.get("hnr") is not None and features["hnr"] != 0:
-            features["nhr"] = float(1.0 / (10 ** (features["hnr"] / 10)))
-        else:
+    if ctx.wants("nhr"):
+        prof.lap("nhr")
+        # NHR (noise-to-harmonics = 1 / HNR_linear)
+        try:
+            if features.get("hnr") is not None and features["hnr"] != 0:
+                features["nhr"] = float(1.0 / (10 ** (features["hnr"] / 10)))
+            else:
+                features["nhr"] = None
+        except Exception:
             features["nhr"] = None
-    except Exception:
-        features["nhr"] = None
 
-    # CPP
-    try:
-        features["cpp"] = _compute_cpp(y, sr)
-    except Exception:
-        features["cpp"] = None
+    if ctx.wants("cpp"):
+        prof.lap("cpp")
+        # CPP
+        try:
+            features["cpp"] = _compute_cpp(
+                y, sr, ctx.preset["cpp_max_frames"],
+                voicing=ctx.voicing if ctx.voiced_only else None,
+            )
+        except Exception:
+            features["cpp"] = None
 
-    # F0 statistics
-    try:
-        pitch = call(sound, "To Pitch", 0.0, 75, 500)
-        f0v = pitch.selected_array["frequency"]
-        f0v = f0v[f0v > 0]
-        if len(f0v) > 0:
-            features.update({
-                "f0_mean": float(np.mean(f0v)),
-                "f0_sd": float(np.std(f0v)),
-                "f0_min": float(np.min(f0v)),
-                "f0_max": float(np.max(f0v)),
-                "f0_range": float(np.max(f0v) - np.min(f0v)),
-            })
-        else:
+    if ctx.wants("f0_mean", "f0_sd", "f0_min", "f0_max", "f0_range"):
+        prof.lap("f0")
+        # F0 statistics
+        try:
+            f0v = ctx.voicing.voiced_f0
+            if len(f0v) > 0:
+                features.update({
+                    "f0_mean": float(np.mean(f0v)),
+                    "f0_sd": float(np.std(f0v)),
+                    "f0_min": float(np.min(f0v)),
+                    "f0_max": float(np.max(f0v)),
+                    "f0_range": float(np.max(f0v) - np.min(f0v)),
+                })
+            else:
+                for k in ("f0_mean", "f0_sd", "f0_min", "f0_max", "f0_range"):
+                    features[k] = None
+        except Exception:
             for k in ("f0_mean", "f0_sd", "f0_min", "f0_max", "f0_range"):
                 features[k] = None
-    except Exception:
-        for k in ("f0_mean", "f0_sd", "f0_min", "f0_max", "f0_range"):
-            features[k] = None
-
-    # RPDE
-    try:
-        step = max(1, len(y) // 5000)
-        rpde = nolds.sampen(y[::step].astype(np.float64), emb_dim=2)
-        features["rpde"] = float(rpde) if np.isfinite(rpde) else None
-    except Exception:
-        features["rpde"] = None
 
-    # DFA
-    try:
-        step = max(1, len(y) // 5000)
-        features["dfa"] = float(nolds.dfa(y[::step].astype(np.float64)))
-    except Exception:
-        features["dfa"] = None
-
-    # PPE (Pitch Period Entropy)
-    try:
-        pitch = call(sound, "To Pitch", 0.0, 75, 500)
-        f0v = pitch.selected_array["frequency"]
-        f0v = f0v[f0v > 0]
-        if len(f0v) > 2:
-            st = 12.0 * np.log2(f0v[1:] / f0v[:-1])
-            h, _ = np.histogram(st, bins=30, density=True)
-            h = h[h > 0]
-            h = h / h.sum()
-            features["ppe"] = float(-np.sum(h * np.log2(h)))
-        else:
+    nonlinear = {}
+    kinds = tuple(k for k in ("rpde", "dfa", "d2") if ctx.wants(k))
+    if kinds:
+        prof.lap("nonlinear")
+        # RPDE, DFA and D2 (correlation dimension)
+        nonlinear = extract_nonlinear(ctx.dsp_input()[0], kinds=kinds,
+                                      params=ctx.preset["nonlinear"])
+        features.update((k, nonlinear[k]) for k in ("rpde", "dfa") if k in nonlinear)
+
+    if ctx.wants("ppe"):
+        prof.lap("ppe")
+        # PPE (Pitch Period Entropy)
+        try:
+            features["ppe"] = _pitch_period_entropy(ctx.voicing)
+        except Exception:
             features["ppe"] = None
-    except Exception:
-        features["ppe"] = None
 
-    # D2 (correlation dimension)
-    try:
-        step = max(1, len(y) // 3000)
-        d2 = nolds.corr_dim(y[::step].astype(np.float64), emb_dim=10)
-        features["d2"] = float(d2) if np.isfinite(d2) else None
-    except Exception:
-        features["d2"] = None
+    if "d2" in nonlinear:
+        features["d2"] = nonlinear["d2"]
 
     return features
 
@@ -476,15 +1766,24 @@ def extract_sustained_vowel(sound, y, sr):
 # DDK (/pataka/ micro-task)
 # ============================================================================
 
-def extract_ddk(y, sr):
+def extract_ddk(y, sr, profiler=None, spectra=None):
     """DDK rate, regularity (CV of IOIs), festination detection."""
     import librosa
     features = {}
+    prof = profiler or NULL_PROFILER
 
+    prof.lap("onsets")
     # Detect syllable onsets
     try:
+        onset_envelope = None
+        if not _reference_mode():
+            spectra = spectra or SpectralFrontEnd(y, sr, profiler=prof)
+            onset_envelope = librosa.onset.onset_strength(
+                S=spectra.log_mel(), sr=sr, hop_length=512,
+            )
         frames = librosa.onset.onset_detect(
-            y=y, sr=sr, units="frames", hop_length=512, backtrack=True,
+            y=y, sr=sr, onset_envelope=onset_envelope, units="frames",
+            hop_length=512, backtrack=True,
             pre_max=3, post_max=3, pre_avg=3, post_avg=5, delta=0.07, wait=4,
         )
         times = librosa.frames_to_time(frames, sr=sr, hop_length=512)
@@ -497,6 +1796,7 @@ def extract_ddk(y, sr):
             features[k] = None
         return features
 
+    prof.lap("ddk_rate")
     # DDK rate (syllables/second)
     try:
         dur = times[-1] - times[0] if len(times) >= 2 else 0
@@ -504,6 +1804,7 @@ def extract_ddk(y, sr):
     except Exception:
         features["ddk_rate"] = None
 
+    prof.lap("regularity")
     # Inter-onset intervals + regularity CV
     try:
         if len(times) >= 3:
@@ -523,6 +1824,7 @@ def extract_ddk(y, sr):
         features["ddk_sd_ioi"] = None
         features["ddk_regularity_cv"] = None
 
+    prof.lap("festination")
     # Festination: later intervals systematically shorter (PD marker)
     try:
         if len(times) >= 6:
@@ -550,26 +1852,16 @@ def extract_ddk(y, sr):
 # Vowel space: formant-based articulation metrics
 # ============================================================================
 
-def extract_vowel_space(sound):
+def extract_vowel_space(ctx):
     """F1/F2 tracking, VSA (if multiple vowels), VAI proxy."""
-    from parselmouth.praat import call
     features = {}
+    if not ctx.wants("f1_mean", "f2_mean", "vsa", "vai"):
+        return features
 
     try:
-        formant = call(sound, "To Formant (burg)", 0.0, 5, 5500, 0.025, 50)
-        n = call(formant, "Get number of frames")
-        f1s, f2s = [], []
-        for i in range(1, n + 1):
-            t = call(formant, "Get time from frame number", i)
-            f1 = call(formant, "Get value at time", 1, t, "Hertz", "Linear")
-            f2 = call(formant, "Get value at time", 2, t, "Hertz", "Linear")
-            if not math.isnan(f1) and f1 > 0:
-                f1s.append(f1)
-            if not math.isnan(f2) and f2 > 0:
-                f2s.append(f2)
-
-        features["f1_mean"] = float(np.mean(f1s)) if f1s else None
-        features["f2_mean"] = float(np.mean(f2s)) if f2s else None
+        _, freqs, _ = ctx.formant_tracks
+        features["f1_mean"] = _positive_mean(freqs[0])
+        features["f2_mean"] = _positive_mean(freqs[1])
         # VSA requires corner vowels /a/, /i/, /u/ -- not computable from single vowel
         features["vsa"] = None
         # VAI single-vowel proxy: F2/F1 ratio as articulatory spread
@@ -590,46 +1882,319 @@ def extract_vowel_space(sound):
 # Helpers (V4)
 # ============================================================================
 
-def _compute_cpp(y, sr):
-    """Cepstral Peak Prominence: peak-to-regression difference in cepstrum."""
-    from scipy.signal import get_window
-    frame_len = int(0.04 * sr)  # 40ms
-    hop = int(0.01 * sr)        # 10ms
-    cpp_vals = []
+def compute_cpp_track(y, sr, frame_s=0.04, hop_s=0.01, block_frames=2048,
+                      voicing=None):
+    """Per-frame Cepstral Peak Prominence (75-500 Hz quefrency band).
 
+    Frames are taken as a strided view of ``y`` and transformed in blocks of
+    ``block_frames`` with one 2-D FFT pair each, which bounds the working set
+    to a few tens of MB regardless of signal length.  The cepstral regression
+    line is fitted in closed form for every frame at once.  With a
+    ``voicing`` index (:class:`VoicedIndex` over ``y``) only the frames
+    centred in a voiced span are transformed.
+
+    Returns
+    -------
+    times : np.ndarray -- (n_frames,) frame centre times (s)
+    cpp : np.ndarray   -- (n_frames,) CPP per frame (dB)
+    """
+    if _reference_mode():
+        times, cpp = _cpp_track_reference(y, sr, frame_s, hop_s)
+        if voicing is not None:
+            keep = voicing.contains(np.round(times * sr).astype(np.int64))
+            times, cpp = times[keep], cpp[keep]
+        return times, cpp
+    from scipy.signal import get_window
+    frame_len = int(frame_s * sr)
+    hop = int(hop_s * sr)
+    n_frames = max(0, -(-(len(y) - frame_len) // hop))
+    n_cep = 2 * (frame_len // 2)  # irfft output length
+    lo, hi = int(sr / 500), min(int(sr / 75), n_cep - 1)
+    if n_frames == 0 or hop <= 0 or lo >= hi:
+        return np.empty(0), np.empty(0)
+
+    frames = np.lib.stride_tricks.sliding_window_view(y, frame_len)[::hop][:n_frames]
+    window = get_window("hann", frame_len)
+    selected = np.arange(n_frames)
+    if voicing is not None:
+        selected = selected[voicing.contains(selected * hop + frame_len // 2)]
+
+    # Regression of the cepstrum on quefrency index over [lo, hi)
+    x = np.arange(lo, hi, dtype=np.float64)
+    xc = x - x.mean()
+    sxx = float(np.dot(xc, xc))
+
+    cpp = np.empty(len(selected))
+    for b in range(0, len(selected), block_frames):
+        block = frames[selected[b:b + block_frames]].astype(np.float64) * window
+        power = np.maximum(np.abs(np.fft.rfft(block, axis=1)) ** 2, 1e-12)
+        region = np.fft.irfft(10 * np.log10(power), axis=1)[:, lo:hi]
+        mean = region.mean(axis=1)
+        slope = (region - mean[:, None]) @ xc / sxx
+        peak = np.argmax(region, axis=1)
+        peak_val = region[np.arange(len(region)), peak]
+        reg_at_peak = mean + slope * (x[peak] - x.mean())
+        cpp[b:b + len(region)] = peak_val - reg_at_peak
+
+    times = (selected * hop + frame_len / 2) / sr
+    return times, cpp
+
+
+def _cpp_track_reference(y, sr, frame_s=0.04, hop_s=0.01):
+    """One FFT pair and ``np.polyfit`` per frame."""
+    from scipy.signal import get_window
+    frame_len = int(frame_s * sr)
+    hop = int(hop_s * sr)
+    times, cpp_vals = [], []
+    if hop <= 0:
+        return np.empty(0), np.empty(0)
     for start in range(0, len(y) - frame_len, hop):
         w = y[start:start + frame_len] * get_window("hann", frame_len)
         power = np.maximum(np.abs(np.fft.rfft(w)) ** 2, 1e-12)
         cep = np.fft.irfft(10 * np.log10(power))
-
         lo, hi = int(sr / 500), min(int(sr / 75), len(cep) - 1)  # 75-500 Hz
         if lo >= hi:
             continue
         region = cep[lo:hi]
-        if len(region) == 0:
-            continue
-
         x = np.arange(lo, lo + len(region))
         reg = np.polyval(np.polyfit(x, region, 1), x)
         peak = np.argmax(region)
+        times.append((start + frame_len / 2) / sr)
         cpp_vals.append(region[peak] - reg[peak])
+    return np.asarray(times), np.asarray(cpp_vals)
 
-    return float(np.mean(cpp_vals)) if cpp_vals else None
 
+def _compute_cpp(y, sr, max_frames=None, voicing=None):
+    """Cepstral Peak Prominence: peak-to-regression difference in cepstrum.
 
-def _compute_spectral_harmonicity(y, sr):
-    """Harmonic-to-total energy ratio via librosa HPSS."""
-    import librosa
-    y_h, _ = librosa.effects.hpss(y)
+    ``max_frames`` caps the cost on long signals: the 10 ms hop is widened
+    so that at most that many frames, spread over the whole signal, are
+    analysed.  With a ``voicing`` index only frames centred in its voiced
+    spans are analysed (and counted against ``max_frames``).
+    """
+    duration_s = (len(y) if voicing is None else voicing.n_voiced_samples) / sr
+    _, cpp = compute_cpp_track(y, sr, hop_s=_cpp_hop_s(duration_s, max_frames),
+                               voicing=voicing)
+    return float(np.mean(cpp)) if len(cpp) else None
+
+
+def _pitch_period_entropy(voicing):
+    """PPE (Little 2009): entropy of the semitone F0-step distribution."""
+    f0v = voicing.voiced_f0
+    if len(f0v) <= 2:
+        return None
+    st_diffs = 12.0 * np.log2(f0v[1:] / f0v[:-1])
+    hist, _ = np.histogram(st_diffs, bins=30, density=True)
+    hist = hist[hist > 0]
+    hist = hist / hist.sum()
+    return float(-np.sum(hist * np.log2(hist)))
+
+
+def _cpp_hop_s(duration_s, max_frames=None, hop_s=0.01):
+    """CPP frame hop (s), widened so ``duration_s`` yields <= ``max_frames``."""
+    if max_frames and duration_s / hop_s > max_frames:
+        return duration_s / max_frames
+    return hop_s
+
+
+def _compute_spectral_harmonicity(y, sr, spectra=None, method="hpss"):
+    """Harmonic-to-total energy ratio via librosa HPSS, or its
+    autocorrelation estimate (``method="autocorrelation"``)."""
+    if method == "autocorrelation":
+        return autocorrelation_harmonicity(y, sr, spectra)
     total = np.sum(y ** 2)
-    return float(np.sum(y_h ** 2) / total) if total > 0 else None
+    if total <= 0:
+        return None
+    return float(np.sum(harmonic_component(y, sr, spectra) ** 2) / total)
+
+
+def autocorrelation_harmonicity(y, sr, spectra=None, block_frames=1024):
+    """Harmonic energy share from per-frame autocorrelation peaks.
+
+    For each STFT frame the normalised autocorrelation (inverse FFT of the
+    power spectrum, read from ``spectra``) is searched for its highest
+    peak at 75-500 Hz lags, which approximates that frame's periodic energy
+    fraction.  The energy-weighted mean over frames estimates the same
+    ratio as HPSS without any median filtering.  Returns None on silence.
+    """
+    spectra = spectra or SpectralFrontEnd(y, sr)
+    power = spectra.power()
+    lo, hi = int(sr / 500), int(sr / 75)
+    harmonic = total = 0.0
+    for b in range(0, power.shape[1], block_frames):
+        acf = np.fft.irfft(power[:, b:b + block_frames].astype(np.float64), axis=0)
+        r0 = acf[0]
+        voiced = r0 > 0
+        peak = acf[lo:hi + 1, voiced].max(axis=0)
+        harmonic += float(np.sum(np.clip(peak, 0.0, r0[voiced])))
+        total += float(np.sum(r0[voiced]))
+    return harmonic / total if total > 0 else None
+
+
+def harmonic_component(y, sr, spectra=None):
+    """Harmonic part of ``y`` by median-filtering HPSS.
+
+    Same result as ``librosa.effects.hpss(y)[0]``, but the STFT comes from
+    ``spectra`` (a :class:`SpectralFrontEnd` of ``y``) when given.
+    """
+    import librosa
+    if _reference_mode():
+        y_h, _ = librosa.effects.hpss(y)
+        return y_h
+    spectra = spectra or SpectralFrontEnd(y, sr)
+    stft_h, _ = librosa.decompose.hpss(spectra.stft())
+    return librosa.istft(stft_h, dtype=y.dtype, n_fft=STFT_N_FFT,
+                         hop_length=STFT_HOP, length=len(y))
+
+
+# ============================================================================
+# Helpers (V5)
+# ============================================================================
+
+def compute_h1h2_track(y, sr, times, f0, frame_s=0.04, block_frames=2048):
+    """H1-H2 (dB) for each pitch frame, from 40 ms Hann-windowed spectra.
+
+    ``times`` and ``f0`` give the frame centres (s) and F0 (Hz) of the voiced
+    pitch frames.  H1 and H2 are read at the FFT bins nearest F0 and 2*F0.
+    Frames that overrun the signal or have a zero harmonic come back as NaN.
+    """
+    if _reference_mode():
+        return _h1h2_track_reference(y, sr, times, f0, frame_s)
+    frame_len = int(frame_s * sr)
+    times = np.asarray(times, dtype=np.float64)
+    f0 = np.asarray(f0, dtype=np.float64)
+    out = np.full(len(times), np.nan)
+    if len(times) == 0 or len(y) < frame_len:
+        return out
+
+    starts = (times * sr).astype(np.int64) - frame_len // 2
+    inside = (starts >= 0) & (starts + frame_len <= len(y))
+    idx = np.where(inside)[0]
+    if len(idx) == 0:
+        return out
+
+    # Nearest-bin lookup (ties resolve to the lower bin, as argmin did)
+    n_bins = frame_len // 2 + 1
+    bin_hz = sr / frame_len
+    h1_bin = np.clip(np.ceil(f0[idx] / bin_hz - 0.5), 0, n_bins - 1).astype(np.int64)
+    h2_bin = np.clip(np.ceil(2 * f0[idx] / bin_hz - 0.5), 0, n_bins - 1).astype(np.int64)
+
+    frames = np.lib.stride_tricks.sliding_window_view(y, frame_len)
+    window = np.hanning(frame_len)
+    for b in range(0, len(idx), block_frames):
+        sel = slice(b, b + block_frames)
+        block = frames[starts[idx[sel]]].astype(np.float64) * window
+        spectrum = np.abs(np.fft.rfft(block, axis=1))
+        rows = np.arange(len(block))
+        h1 = spectrum[rows, h1_bin[sel]]
+        h2 = spectrum[rows, h2_bin[sel]]
+        valid = (h1 > 0) & (h2 > 0)
+        vals = np.full(len(block), np.nan)
+        vals[valid] = 20.0 * np.log10(h1[valid] / h2[valid])
+        out[idx[sel]] = vals
+    return out
+
+
+def _h1h2_track_reference(y, sr, times, f0, frame_s=0.04):
+    """One windowed FFT and ``argmin`` bin search per frame."""
+    frame_len = int(frame_s * sr)
+    out = np.full(len(times), np.nan)
+    freqs = np.fft.rfftfreq(frame_len, d=1.0 / sr)
+    for i, (t_sec, f0_hz) in enumerate(zip(times, f0)):
+        start_idx = int(t_sec * sr) - frame_len // 2
+        end_idx = start_idx + frame_len
+        if start_idx < 0 or end_idx > len(y):
+            continue
+        spectrum = np.abs(np.fft.rfft(y[start_idx:end_idx] * np.hanning(frame_len)))
+        h1_amp = spectrum[np.argmin(np.abs(freqs - f0_hz))]
+        h2_amp = spectrum[np.argmin(np.abs(freqs - 2 * f0_hz))]
+        if h1_amp > 0 and h2_amp > 0:
+            out[i] = 20.0 * np.log10(h1_amp / h2_amp)
+    return out
+
+
+def compute_rms_track(y, sr, frame_s=0.025, hop_s=0.010):
+    """Short-time RMS contour from a running sum of squares.
+
+    Returns
+    -------
+    times : np.ndarray -- (n_frames,) frame start times (s)
+    rms : np.ndarray   -- (n_frames,) RMS amplitude per frame
+    """
+    if _reference_mode():
+        return _rms_track_reference(y, sr, frame_s, hop_s)
+    frame_len = int(frame_s * sr)
+    hop = int(hop_s * sr)
+    n_frames = 1 + (len(y) - frame_len) // hop
+    if n_frames <= 0:
+        return np.empty(0), np.empty(0)
+    csum = np.concatenate(([0.0], np.cumsum(np.square(y, dtype=np.float64))))
+    starts = np.arange(n_frames) * hop
+    energy = (csum[starts + frame_len] - csum[starts]) / frame_len
+    rms = np.sqrt(np.maximum(energy, 0.0))
+    return starts / sr, rms
+
+
+def _rms_track_reference(y, sr, frame_s=0.025, hop_s=0.010):
+    """Direct per-frame RMS."""
+    frame_len = int(frame_s * sr)
+    hop = int(hop_s * sr)
+    n_frames = 1 + (len(y) - frame_len) // hop
+    if n_frames <= 0:
+        return np.empty(0), np.empty(0)
+    rms = np.zeros(n_frames)
+    for i in range(n_frames):
+        s = i * hop
+        rms[i] = np.sqrt(np.mean(np.asarray(y[s:s + frame_len], dtype=np.float64) ** 2))
+    return np.arange(n_frames) * hop / sr, rms
+
+
+def _compute_spectral_tilt(y, sr):
+    """Slope (dB/Hz) of the log power spectrum of the first 2 s, 50-8000 Hz."""
+    n_fft = min(len(y), 2 * sr)  # up to 2s window
+    segment = y[:n_fft]
+    window = np.hanning(len(segment))
+    spectrum = np.abs(np.fft.rfft(segment * window))
+    log_spectrum = 20.0 * np.log10(np.maximum(spectrum, 1e-10))
+    freqs = np.linspace(0, sr / 2, len(log_spectrum))
+    # Fit only within speech-relevant range (50-8000 Hz)
+    mask = (freqs >= 50) & (freqs <= 8000)
+    if np.sum(mask) <= 2:
+        return None
+    slope, _ = np.polyfit(freqs[mask], log_spectrum[mask], 1)
+    return float(slope)
+
+
+def _voice_break_rate(voicing, duration):
+    """Voiced-to-unvoiced transitions per second of audio."""
+    if len(voicing.f0) <= 1 or duration <= 0:
+        return None
+    # A voice break = a gap of unvoiced frames after a voiced run
+    return float(voicing.n_breaks / duration)
+
+
+def _tremor_power(voicing, hop_time):
+    """Share of F0-contour power in the 4-7 Hz tremor band."""
+    f0, voiced_idx = voicing.f0, voicing.indices
+    if len(voiced_idx) <= 10:
+        return None
+    # Interpolate F0 over unvoiced gaps for continuous contour, remove DC
+    f0_interp = np.interp(np.arange(len(f0)), voiced_idx, f0[voiced_idx])
+    f0_centered = f0_interp - np.mean(f0_interp)
+    fft_f0 = np.abs(np.fft.rfft(f0_centered))
+    freqs = np.fft.rfftfreq(len(f0_interp), d=hop_time)
+    tremor_band = (freqs >= 4.0) & (freqs <= 7.0)
+    if not np.any(tremor_band):
+        return None
+    total_power = np.sum(fft_f0 ** 2) + 1e-12
+    return float(np.sum(fft_f0[tremor_band] ** 2) / total_power)
 
 
 # ============================================================================
 # NEW V5: 6 acoustic features
 # ============================================================================
 
-def extract_v5_acoustic(sound, y, sr):
+def extract_v5_acoustic(ctx):
     """
     New V5 acoustic features:
       - formant_bandwidth : mean F1 bandwidth (Hz)
@@ -640,185 +2205,354 @@ def extract_v5_acoustic(sound, y, sr):
       - loudness_decay    : linear slope of RMS energy across utterance
     """
     from parselmouth.praat import call
+    y, sr = ctx.y, ctx.sr
     features = {}
+    prof = ctx.profiler
 
-    # --- Formant bandwidth (mean F1 bandwidth) ---
-    try:
-        formant = call(sound, "To Formant (burg)", 0.0, 5, 5500, 0.025, 50)
-        n_frames = call(formant, "Get number of frames")
-        bw_vals = []
-        for i in range(1, n_frames + 1):
-            t = call(formant, "Get time from frame number", i)
-            bw = call(formant, "Get bandwidth at time", 1, t, "Hertz", "Linear")
-            if not math.isnan(bw) and bw > 0:
-                bw_vals.append(bw)
-        features["formant_bandwidth"] = (
-            float(np.mean(bw_vals)) if bw_vals else None
-        )
-    except Exception:
-        features["formant_bandwidth"] = None
+    if ctx.wants("formant_bandwidth"):
+        prof.lap("formant_bandwidth")
+        # --- Formant bandwidth (mean F1 bandwidth) ---
+        try:
+            _, _, bandwidths = ctx.formant_tracks
+            features["formant_bandwidth"] = _positive_mean(bandwidths[0])
+        except Exception:
+            features["formant_bandwidth"] = None
 
-    # --- Spectral tilt (linear regression slope of log power spectrum) ---
-    try:
-        # Use windowed FFT of the full signal
-        n_fft = min(len(y), 2 * sr)  # up to 2s window
-        segment = y[:n_fft]
-        window = np.hanning(len(segment))
-        spectrum = np.abs(np.fft.rfft(segment * window))
-        log_spectrum = 20.0 * np.log10(np.maximum(spectrum, 1e-10))
-        freqs = np.linspace(0, sr / 2, len(log_spectrum))
-        # Fit only within speech-relevant range (50-8000 Hz)
-        mask = (freqs >= 50) & (freqs <= 8000)
-        if np.sum(mask) > 2:
-            slope, _ = np.polyfit(freqs[mask], log_spectrum[mask], 1)
-            features["spectral_tilt"] = float(slope)
-        else:
+    if ctx.wants("spectral_tilt"):
+        prof.lap("spectral_tilt")
+        # --- Spectral tilt (linear regression slope of log power spectrum) ---
+        try:
+            features["spectral_tilt"] = _compute_spectral_tilt(ctx.dsp_input()[0], sr)
+        except Exception:
             features["spectral_tilt"] = None
-    except Exception:
-        features["spectral_tilt"] = None
 
-    # --- Voice breaks (voiced-to-unvoiced transition rate) ---
-    try:
-        pitch = call(sound, "To Pitch", 0.0, 75, 500)
-        f0 = pitch.selected_array["frequency"]
-        if len(f0) > 1:
-            voiced = f0 > 0
-            # Count transitions from voiced to unvoiced within voiced regions
-            # A voice break = a gap of unvoiced frames surrounded by voiced frames
-            transitions = np.diff(voiced.astype(int))
-            # voiced->unvoiced = -1 in diff
-            n_breaks = int(np.sum(transitions == -1))
-            duration = float(len(y) / sr)
-            features["voice_breaks"] = (
-                float(n_breaks / duration) if duration > 0 else None
-            )
-        else:
+    if ctx.wants("voice_breaks"):
+        prof.lap("voice_breaks")
+        # --- Voice breaks (voiced-to-unvoiced transition rate) ---
+        try:
+            features["voice_breaks"] = _voice_break_rate(ctx.voicing, float(len(y) / sr))
+        except Exception:
             features["voice_breaks"] = None
-    except Exception:
-        features["voice_breaks"] = None
 
-    # --- Tremor frequency (power in 4-7 Hz band of F0 contour) ---
-    try:
-        pitch = call(sound, "To Pitch", 0.0, 75, 500)
-        f0 = pitch.selected_array["frequency"]
-        voiced_idx = np.where(f0 > 0)[0]
-        if len(voiced_idx) > 10:
-            # Interpolate F0 over unvoiced gaps for continuous contour
-            f0_interp = np.interp(
-                np.arange(len(f0)), voiced_idx, f0[voiced_idx]
-            )
-            # Remove DC
-            f0_centered = f0_interp - np.mean(f0_interp)
-            # FFT of F0 contour
-            fft_f0 = np.abs(np.fft.rfft(f0_centered))
+    if ctx.wants("tremor_freq_power"):
+        prof.lap("tremor_freq_power")
+        # --- Tremor frequency (power in 4-7 Hz band of F0 contour) ---
+        try:
             # Pitch time step in Praat default: 0.0 => auto = 0.75 / floor
             # With floor=75 Hz, step ~= 0.01s
-            hop_time = call(pitch, "Get time step")
-            freqs = np.fft.rfftfreq(len(f0_interp), d=hop_time)
-            tremor_band = (freqs >= 4.0) & (freqs <= 7.0)
-            if np.any(tremor_band):
-                total_power = np.sum(fft_f0 ** 2) + 1e-12
-                tremor_power = np.sum(fft_f0[tremor_band] ** 2)
-                # Normalized tremor power (ratio)
-                features["tremor_freq_power"] = float(tremor_power / total_power)
-            else:
-                features["tremor_freq_power"] = None
-        else:
+            hop_time = call(ctx.pitch, "Get time step")
+            features["tremor_freq_power"] = _tremor_power(ctx.voicing, hop_time)
+        except Exception:
             features["tremor_freq_power"] = None
-    except Exception:
-        features["tremor_freq_power"] = None
 
-    # --- Breathiness H1-H2 (difference between first two harmonics, dB) ---
-    try:
-        pitch = call(sound, "To Pitch", 0.0, 75, 500)
-        f0_arr = pitch.selected_array["frequency"]
-        voiced_idx = np.where(f0_arr > 0)[0]
-        if len(voiced_idx) > 0:
-            h1h2_vals = []
-            # Compute H1-H2 at each voiced frame using short-time spectra
-            frame_len = int(0.04 * sr)  # 40ms
-            hop_samples = int(0.01 * sr)  # 10ms
-            for vi in voiced_idx[::3]:  # subsample for speed
-                f0_hz = f0_arr[vi]
-                # Map pitch frame index to sample index
-                hop_time = call(pitch, "Get time step")
-                t_sec = vi * hop_time + call(pitch, "Get time from frame number", 1)
-                center = int(t_sec * sr)
-                start_idx = center - frame_len // 2
-                end_idx = start_idx + frame_len
-                if start_idx < 0 or end_idx > len(y):
-                    continue
-                frame = y[start_idx:end_idx] * np.hanning(frame_len)
-                spectrum = np.abs(np.fft.rfft(frame))
-                freqs = np.fft.rfftfreq(frame_len, d=1.0 / sr)
-                # Find H1 (amplitude at F0) and H2 (amplitude at 2*F0)
-                h1_idx = np.argmin(np.abs(freqs - f0_hz))
-                h2_idx = np.argmin(np.abs(freqs - 2 * f0_hz))
-                h1_amp = spectrum[h1_idx]
-                h2_amp = spectrum[h2_idx]
-                if h1_amp > 0 and h2_amp > 0:
-                    h1h2_db = 20.0 * np.log10(h1_amp / h2_amp)
-                    h1h2_vals.append(h1h2_db)
-            features["breathiness_h1h2"] = (
-                float(np.mean(h1h2_vals)) if h1h2_vals else None
-            )
-        else:
+    if ctx.wants("breathiness_h1h2"):
+        prof.lap("breathiness_h1h2")
+        # --- Breathiness H1-H2 (difference between first two harmonics, dB) ---
+        try:
+            voicing = ctx.voicing
+            if len(voicing.indices) > 0:
+                h1h2_vals = compute_h1h2_track(
+                    y, sr, ctx.pitch.xs()[voicing.indices], voicing.voiced_f0,
+                )
+                h1h2_vals = h1h2_vals[np.isfinite(h1h2_vals)]
+                features["breathiness_h1h2"] = (
+                    float(np.mean(h1h2_vals)) if len(h1h2_vals) else None
+                )
+            else:
+                features["breathiness_h1h2"] = None
+        except Exception:
             features["breathiness_h1h2"] = None
-    except Exception:
-        features["breathiness_h1h2"] = None
 
-    # --- Loudness decay (slope of RMS energy across utterance) ---
-    try:
-        # Compute RMS energy in short frames
-        frame_len_ld = int(0.025 * sr)  # 25ms
-        hop_ld = int(0.010 * sr)        # 10ms
-        n_frames_ld = 1 + (len(y) - frame_len_ld) // hop_ld
-        if n_frames_ld > 2:
-            frame_energies = np.zeros(n_frames_ld)
-            for i in range(n_frames_ld):
-                s = i * hop_ld
-                frame_energies[i] = np.sqrt(np.mean(y[s:s + frame_len_ld] ** 2))
-            # Normalize time axis to seconds
-            time_axis = np.arange(n_frames_ld) * (hop_ld / sr)
-            slope, _ = np.polyfit(time_axis, frame_energies, 1)
-            features["loudness_decay"] = float(slope)
-        else:
+    if ctx.wants("loudness_decay"):
+        prof.lap("loudness_decay")
+        # --- Loudness decay (slope of RMS energy across utterance) ---
+        try:
+            time_axis, frame_energies = compute_rms_track(y, sr)
+            if len(frame_energies) > 2:
+                slope, _ = np.polyfit(time_axis, frame_energies, 1)
+                features["loudness_decay"] = float(slope)
+            else:
+                features["loudness_decay"] = None
+        except Exception:
             features["loudness_decay"] = None
-    except Exception:
-        features["loudness_decay"] = None
 
     return features
 
 
+# ============================================================================
+# Whisper model registry -- resident models with RAM-bounded LRU eviction
+# ============================================================================
+
+# Approximate parameter counts, used to make room before a load
+_WHISPER_PARAMS = {
+    "tiny": 39e6, "base": 74e6, "small": 244e6, "medium": 769e6,
+    "large": 1550e6, "large-v2": 1550e6, "large-v3": 1550e6,
+}
+
+
+class WhisperModelRegistry:
+    """Keeps loaded Whisper models resident across requests.
+
+    Models are keyed by (name, device) and evicted least-recently-used first
+    once their combined parameter memory would exceed ``ram_budget_bytes``.
+    The most recently requested model is always kept, even when it alone is
+    over budget.  Hit/miss/eviction counters and cumulative load time are
+    reported by :meth:`stats`.
+    """
+
+    def __init__(self, ram_budget_bytes):
+        self.ram_budget_bytes = ram_budget_bytes
+        self._models = OrderedDict()   # (name, device) -> (model, n_bytes)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.load_time_s = 0.0
+
+    @staticmethod
+    def _model_bytes(model):
+        tensors = list(model.parameters()) + list(model.buffers())
+        return int(sum(t.numel() * t.element_size() for t in tensors))
+
+    def _evict_until(self, free_bytes):
+        """Drop LRU models until ``free_bytes`` more would fit the budget."""
+        used = sum(n for _, n in self._models.values())
+        while self._models and used + free_bytes > self.ram_budget_bytes:
+            _, (_, n_bytes) = self._models.popitem(last=False)
+            used -= n_bytes
+            self.evictions += 1
+        try:
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except Exception:
+            pass
+
+    def get(self, model_name, device="cpu"):
+        """Return a loaded model, loading (and evicting) on a miss."""
+        import whisper  # type: ignore
+        key = (model_name, device)
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                self.hits += 1
+                return self._models[key][0]
+
+            self.misses += 1
+            self._evict_until(int(_WHISPER_PARAMS.get(model_name, 0) * 4))
+            t0 = time.perf_counter()
+            model = whisper.load_model(model_name, device=device)
+            self.load_time_s += time.perf_counter() - t0
+            self._models[key] = (model, self._model_bytes(model))
+            return model
+
+    def prewarm(self, model_names, device="cpu"):
+        """Load ``model_names`` ahead of the first request."""
+        for name in model_names:
+            self.get(name, device)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "load_time_s": round(self.load_time_s, 3),
+                "resident": [f"{name}@{dev}" for name, dev in self._models],
+                "resident_bytes": sum(n for _, n in self._models.values()),
+                "ram_budget_bytes": self.ram_budget_bytes,
+            }
+
+
+WHISPER_MODELS = WhisperModelRegistry(
+    int(os.environ.get("CVF_WHISPER_RAM_BUDGET_MB", "8192")) * 1024 * 1024
+)
+
+
+def _whisper_device(device):
+    """Whisper device handling: 'mps' not yet fully supported by whisper;
+    fall back to cpu for mps."""
+    return device if device in ("cpu", "cuda") else "cpu"
+
+
+# ============================================================================
+# Voice activity detection -- speech regions for Whisper
+# ============================================================================
+
+# Whisper transcribes only VAD speech regions unless CVF_WHISPER_VAD=0
+WHISPER_VAD = os.environ.get("CVF_WHISPER_VAD", "1") != "0"
+
+VAD_FRAME_S = 0.032
+VAD_HOP_S = 0.010
+VAD_BAND_HZ = (150.0, 4000.0)     # speech band for the energy measure
+VAD_FLOOR_MARGIN_DB = 9.0         # above the noise floor (10th percentile)
+VAD_PEAK_MARGIN_DB = 6.0          # ... but never more than this below speech
+VAD_DYNAMIC_RANGE_DB = 45.0       # below the loud speech level (99th pct.)
+VAD_MIN_DB = -70.0                # absolute floor, dB re full scale
+VAD_MAX_FLATNESS = 0.5            # white noise ~0.56, voiced speech < 0.1
+VAD_MIN_SPEECH_S = 0.08
+VAD_PAD_S = 0.2
+VAD_MIN_SILENCE_S = 0.5
+VAD_JOIN_GAP_S = 0.3              # silence kept between joined regions
+VAD_MAX_SPEECH_RATIO = 0.9        # above this, transcribe the whole file
+
+
+def _vad_frame_stats(y, sr, block_frames=4096):
+    """Speech-band energy (dB) and spectral flatness per VAD frame.
+
+    Frames are ``VAD_FRAME_S`` long every ``VAD_HOP_S``; spectra are taken
+    ``block_frames`` at a time so long recordings never hold a full STFT.
+    """
+    n_fft = int(VAD_FRAME_S * sr)
+    hop = int(VAD_HOP_S * sr)
+    if len(y) < n_fft:
+        return np.empty(0), np.empty(0), n_fft, hop
+    frames = np.lib.stride_tricks.sliding_window_view(y, n_fft)[::hop]
+    window = np.hanning(n_fft).astype(np.float32)
+    freqs = np.fft.rfftfreq(n_fft, 1.0 / sr)
+    band = (freqs >= VAD_BAND_HZ[0]) & (freqs <= VAD_BAND_HZ[1])
+    energy_db = np.empty(len(frames))
+    flatness = np.empty(len(frames))
+    for i in range(0, len(frames), block_frames):
+        spec = np.abs(np.fft.rfft(frames[i:i + block_frames] * window, axis=1))
+        power = spec[:, band].astype(np.float64) ** 2 + 1e-12
+        mean = power.mean(axis=1)
+        energy_db[i:i + block_frames] = 10 * np.log10(mean / n_fft)
+        flatness[i:i + block_frames] = np.exp(np.log(power).mean(axis=1)) / mean
+    return energy_db, flatness, n_fft, hop
+
+
+def speech_regions(y, sr=16000):
+    """Speech regions of ``y`` from an energy/spectral-flatness VAD.
+
+    A frame is speech when its speech-band energy clears an adaptive
+    threshold (noise floor + margin, capped just below the loud speech
+    level for recordings without pauses, and within a dynamic range of
+    it) and its spectrum is not noise-flat.  Runs shorter than
+    ``VAD_MIN_SPEECH_S`` are dropped, the rest padded by ``VAD_PAD_S`` and
+    merged across gaps shorter than ``VAD_MIN_SILENCE_S``.
+
+    Returns an (n, 2) int array of [start, end) sample offsets.
+    """
+    energy_db, flatness, n_fft, hop = _vad_frame_stats(y, sr)
+    if len(energy_db) == 0:
+        return np.empty((0, 2), dtype=np.int64)
+    floor, peak = np.percentile(energy_db, (10, 99))
+    threshold = max(
+        min(floor + VAD_FLOOR_MARGIN_DB, peak - VAD_PEAK_MARGIN_DB),
+        peak - VAD_DYNAMIC_RANGE_DB,
+        VAD_MIN_DB,
+    )
+    speech = (energy_db > threshold) & (flatness < VAD_MAX_FLATNESS)
+    edges = np.diff(np.concatenate(([0], speech.astype(np.int8), [0])))
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+    keep = (ends - starts) * hop >= VAD_MIN_SPEECH_S * sr
+    starts, ends = starts[keep] * hop, (ends[keep] - 1) * hop + n_fft
+
+    pad, min_gap = int(VAD_PAD_S * sr), int(VAD_MIN_SILENCE_S * sr)
+    regions = []
+    for a, b in zip(np.maximum(starts - pad, 0), np.minimum(ends + pad, len(y))):
+        if regions and a - regions[-1][1] < min_gap:
+            regions[-1][1] = max(regions[-1][1], int(b))
+        else:
+            regions.append([int(a), int(b)])
+    return np.asarray(regions, dtype=np.int64).reshape(-1, 2)
+
+
+def _join_regions(y, sr, regions):
+    """Concatenate ``regions`` of ``y`` with ``VAD_JOIN_GAP_S`` of silence
+    between them.
+
+    Returns the joined waveform and the time map: a list of
+    ``(joined_start_s, original_start_s, length_s)`` per region.
+    """
+    gap = np.zeros(int(VAD_JOIN_GAP_S * sr), dtype=np.float32)
+    pieces, time_map, pos = [], [], 0
+    for a, b in regions.tolist():
+        if pieces:
+            pieces.append(gap)
+            pos += len(gap)
+        pieces.append(y[a:b])
+        time_map.append((pos / sr, a / sr, (b - a) / sr))
+        pos += b - a
+    return np.concatenate(pieces).astype(np.float32, copy=False), time_map
+
+
+def _to_original_span(start, end, time_map):
+    """Map a word's (start, end) on the joined waveform back to the original
+    timeline.
+
+    A start inside a joining gap snaps to the next region's start.  The end
+    is clamped to the end of the region the start maps into, so a word that
+    straddles a join never spans the silence removed there.
+    """
+    k = max(bisect.bisect_right(time_map, start, key=lambda m: m[0]) - 1, 0)
+    if start - time_map[k][0] > time_map[k][2] and k + 1 < len(time_map):
+        k += 1
+    joined, orig, length = time_map[k]
+    offset = min(max(start - joined, 0.0), length)
+    return orig + offset, orig + min(max(end - joined, offset), length)
+
+
 # ============================================================================
 # NEW V5: Whisper transcription with word-level timestamps
 # ============================================================================
 
-def extract_whisper_timestamps(audio_path, model_name="large-v3", device="cpu"):
+def extract_whisper_timestamps(audio_path, model_name="large-v3", device="cpu",
+                               y=None, vad=None, cancel=None):
     """
     Run Whisper with word-level timestamps.
 
+    With ``vad`` (default :data:`WHISPER_VAD`) only the :func:`speech_regions`
+    of the recording are transcribed, joined by short silences, and word
+    times are mapped back to the original timeline.  ``y`` is the 16 kHz
+    waveform when the caller already has it; otherwise the file is loaded.
+    ``audio_path`` may be None when ``y`` is given.
+    ``cancel`` is a :class:`threading.Event`; once set, the transcription
+    is skipped (a call already inside Whisper runs to completion).
+
     Returns
     -------
     dict with keys:
       - transcript : str
       - model      : str
       - words      : list of {word: str, start: float, end: float}
+      - vad        : {regions, speech_s, duration_s} or None without VAD
 
-    Returns None if Whisper is unavailable.
+    Returns None if Whisper is unavailable or the call was cancelled.
     """
     try:
-        import whisper  # type: ignore
+        import whisper  # type: ignore  # noqa: F401
     except ImportError:
         return None
 
+    def cancelled():
+        return cancel is not None and cancel.is_set()
+
+    vad = WHISPER_VAD if vad is None else vad
+    sr = 16000
     try:
-        # Whisper device handling: 'mps' not yet fully supported by whisper;
-        # fall back to cpu for mps.
-        whisper_device = device if device in ("cpu", "cuda") else "cpu"
-        model = whisper.load_model(model_name, device=whisper_device)
+        audio = audio_path if audio_path is not None else y
+        time_map, vad_info = None, None
+        if vad:
+            if y is None:
+                y, _ = load_audio(audio_path, sr=sr)
+            regions = speech_regions(y, sr)
+            speech = int(np.sum(regions[:, 1] - regions[:, 0]))
+            vad_info = {"regions": len(regions), "speech_s": round(speech / sr, 3),
+                        "duration_s": round(len(y) / sr, 3)}
+            if len(regions) == 0:
+                return {"transcript": "", "model": model_name, "words": [],
+                        "vad": vad_info}
+            if speech > VAD_MAX_SPEECH_RATIO * len(y):
+                audio = y
+            else:
+                audio, time_map = _join_regions(y, sr, regions)
+        if cancelled():
+            return None
+        model = WHISPER_MODELS.get(model_name, _whisper_device(device))
         result = model.transcribe(
-            audio_path,
+            audio,
             word_timestamps=True,
             language="en",
         )
@@ -827,21 +2561,60 @@ def extract_whisper_timestamps(audio_path, model_name="large-v3", device="cpu"):
         words = []
         for segment in result.get("segments", []):
             for word_info in segment.get("words", []):
+                start, end = word_info["start"], word_info["end"]
+                if time_map is not None:
+                    start, end = _to_original_span(start, end, time_map)
                 words.append({
                     "word": word_info["word"].strip(),
-                    "start": round(word_info["start"], 3),
-                    "end": round(word_info["end"], 3),
+                    "start": round(start, 3),
+                    "end": round(end, 3),
                 })
 
         return {
             "transcript": transcript,
             "model": model_name,
             "words": words,
+            "vad": vad_info,
         }
     except Exception:
         return None
 
 
+# Transcription runs on its own thread next to the acoustic extractors.  One
+# thread per process: the resident models are shared, so requests queue.
+_WHISPER_EXECUTOR = None
+_WHISPER_EXECUTOR_LOCK = threading.Lock()
+
+
+def submit_whisper(audio_path, model_name="large-v3", device="cpu", y=None,
+                   vad=None, profiler=None):
+    """Start :func:`extract_whisper_timestamps` in the background.
+
+    Returns ``(future, cancel)``: the future's result is the Whisper dict
+    (or None) and setting the ``cancel`` event abandons a transcription
+    that has not reached the model yet.
+    """
+    global _WHISPER_EXECUTOR
+    from concurrent.futures import ThreadPoolExecutor
+    with _WHISPER_EXECUTOR_LOCK:
+        if _WHISPER_EXECUTOR is None:
+            _WHISPER_EXECUTOR = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="whisper")
+    prof = profiler or NULL_PROFILER
+    cancel = threading.Event()
+
+    def run():
+        if cancel.is_set():
+            return None
+        with prof.stage("whisper"):
+            return extract_whisper_timestamps(
+                audio_path, model_name=model_name, device=device, y=y, vad=vad,
+                cancel=cancel,
+            )
+
+    return _WHISPER_EXECUTOR.submit(run), cancel
+
+
 # ============================================================================
 # NEW V5: Temporal indicators from Whisper word timestamps
 # ============================================================================
@@ -995,6 +2768,1752 @@ def compute_temporal_from_whisper(words, total_duration_s):
     return temporal
 
 
+# ============================================================================
+# Chunked extraction -- bounded memory for long recordings
+# ============================================================================
+#
+# The whole-file path keeps several full-length copies of the signal alive at
+# once (16 kHz float32, Praat's native-rate float64, HPSS spectrograms, CPP
+# frames).  For long conversations the file is instead read in overlapping
+# windows and each window's contribution is folded into running aggregates,
+# so peak memory is set by the window length, not the recording length.
+#
+# Every window is analysed with ``overlap`` seconds of context on both sides;
+# only frames whose time falls in the window's core are accumulated, so each
+# frame is counted once.  What is kept across windows:
+#   - running sums / counts (F0, HNR, CPP, formants, H1-H2, MFCC-2,
+#     harmonic energy) and least-squares sums (RMS slope)
+#   - period-weighted jitter and shimmer (Praat computes them per window)
+#   - the F0 contour (float32, ~400 bytes per second of audio), needed for
+#     PPE, tremor and voice breaks
+#   - a decimated copy of the signal at the same factor and by the same
+#     method the whole-file path uses for RPDE and DFA (see
+#     :func:`decimate_signal`)
+
+# Working-set estimate of the whole-file conversation path, in bytes per
+# sample at the 16 kHz analysis rate (HPSS STFTs dominate).
+_BYTES_PER_ANALYSIS_SAMPLE = 200
+_CHUNK_OVERLAP_S = 1.0
+_CHUNKED_TASKS = ("conversation", "fluency")
+
+
+class _RunningMean:
+    """Count / mean / M2 accumulator (Chan et al. parallel update)."""
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        n_b = len(values)
+        if n_b == 0:
+            return
+        mean_b = float(values.mean())
+        m2_b = float(np.sum((values - mean_b) ** 2))
+        n = self.n + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta * delta * self.n * n_b / n
+        self.n = n
+
+    def result(self):
+        return float(self.mean) if self.n else None
+
+    def std(self):
+        return float(math.sqrt(self.m2 / self.n)) if self.n else None
+
+
+class _RunningLinearFit:
+    """Least-squares slope of y on x from running sums."""
+
+    def __init__(self):
+        self.n = 0
+        self.sx = self.sy = self.sxx = self.sxy = 0.0
+
+    def add(self, x, y):
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        self.n += len(x)
+        self.sx += float(x.sum())
+        self.sy += float(y.sum())
+        self.sxx += float(np.dot(x, x))
+        self.sxy += float(np.dot(x, y))
+
+    def slope(self):
+        denom = self.n * self.sxx - self.sx * self.sx
+        if self.n <= 2 or denom == 0:
+            return None
+        return float((self.n * self.sxy - self.sx * self.sy) / denom)
+
+
+def chunk_seconds_for_budget(memory_budget_mb, sr=16000):
+    """Window length (whole seconds, 30-600) that fits ``memory_budget_mb``."""
+    budget = memory_budget_mb * 1024 * 1024
+    seconds = budget / (_BYTES_PER_ANALYSIS_SAMPLE * sr)
+    return int(min(600, max(30, seconds)))
+
+
+def needs_chunking(audio_path, memory_budget_mb, sr=16000):
+    """True if the whole-file path is expected to exceed ``memory_budget_mb``."""
+    import soundfile as sf
+    if not memory_budget_mb:
+        return False
+    try:
+        duration = sf.info(audio_path).duration
+    except Exception:
+        return False
+    return duration * sr * _BYTES_PER_ANALYSIS_SAMPLE > memory_budget_mb * 1024 * 1024
+
+
+def iter_audio_chunks(audio_path, chunk_s, overlap_s=_CHUNK_OVERLAP_S):
+    """Yield (samples, sr, read_start, core_start, core_end, total_frames).
+
+    ``samples`` is mono float32 at the file's native rate covering
+    [read_start, read_end), i.e. the core window plus up to ``overlap_s`` of
+    context on each side.  All positions are in native-rate frames.
+    """
+    import soundfile as sf
+    with sf.SoundFile(audio_path) as f:
+        sr = f.samplerate
+        total = f.frames
+        chunk = int(chunk_s * sr)
+        overlap = int(overlap_s * sr)
+        for core_start in range(0, total, chunk):
+            core_end = min(total, core_start + chunk)
+            read_start = max(0, core_start - overlap)
+            read_end = min(total, core_end + overlap)
+            f.seek(read_start)
+            data = f.read(read_end - read_start, dtype="float32", always_2d=True)
+            yield data.mean(axis=1), sr, read_start, core_start, core_end, total
+
+
+def extract_chunked(audio_path, task_type, chunk_s, sr=16000, profiler=None,
+                    features=None, quality="standard", device="cpu"):
+    """Tier 1 + tier 2 + V5 acoustic features over overlapping windows.
+
+    Returns ``(features, duration_s)`` with the same keys as the whole-file
+    conversation (or fluency) path.  Only supported for ``_CHUNKED_TASKS``.
+    Per-block laps accumulate over all windows in ``profiler``.  ``features``
+    restricts the output as in :func:`resolve_features`; ``quality`` picks
+    the estimator settings (:data:`QUALITY_PRESETS`).  Windows are resampled
+    and MFCCs computed (on ``device``) as the whole-file path does; the MFCC
+    dB floor needs the recording's peak, so a first pass over the windows
+    finds it before the main one.
+    """
+    from parselmouth.praat import call
+    from scipy.signal import resample_poly
+
+    f0_parts = []
+    pitch_step = None
+    hnr = _RunningMean()
+    cpp = _RunningMean()
+    f1, f2, bw1 = _RunningMean(), _RunningMean(), _RunningMean()
+    h1h2 = _RunningMean()
+    mfcc2 = _RunningMean()
+    rms_fit = _RunningLinearFit()
+    jitter_w = shimmer_w = periods = 0.0
+    harm_energy = total_energy = 0.0
+    nolds_parts = []
+    nolds_step = None
+    spectral_tilt = None
+    duration_s = 0.0
+    prof = profiler or NULL_PROFILER
+    selected, products = resolve_features(task_type, features)
+    preset = QUALITY_PRESETS[quality]
+    nonlinear_params = {**NONLINEAR_PARAMS, **preset["nonlinear"],
+                        **(_REFERENCE_DECIMATION if _reference_mode() else {})}
+
+    def wants(*names):
+        return _wants(selected, *names)
+
+    def windows():
+        """(y, native_sr, read_start, core_start, total, c0, c1, in_core) per
+        window.  ``in_core(times)`` selects chunk times in the core window
+        [c0, c1), or [c0, c1] for the last window, so a frame centred on the
+        final sample is counted as in the whole-file path."""
+        for data, native_sr, read_start, core_start, core_end, total in \
+                iter_audio_chunks(audio_path, chunk_s):
+            prof.lap("resample")
+            y = resample_waveform(data, native_sr, sr)
+            c0 = (core_start - read_start) / native_sr
+            c1 = (core_end - read_start) / native_sr
+            last = core_end == total
+
+            def in_core(times, c0=c0, c1=c1, last=last):
+                return (times >= c0) & ((times <= c1) if last else (times < c1))
+
+            yield y, native_sr, read_start, core_start, total, c0, c1, in_core
+
+    def window_mel_db(y, read_start, native_sr, in_core, spectra=None):
+        """Unfloored mel dB of the window's core frames, on the whole-file
+        frame grid."""
+        mel_db, centres, backend = mel_db_frames(
+            y, sr, device, spectra, start=int(round(read_start * sr / native_sr)))
+        return mel_db[:, in_core(centres / sr)], backend
+
+    mfcc_floor = None
+    if wants("mfcc2_mean"):
+        # The whole-file MFCCs floor the mel dB values at the recording's
+        # peak minus MFCC_TOP_DB; a per-window peak would floor them higher
+        prof.lap("decode")
+        peak = -np.inf
+        for y, native_sr, read_start, *_, in_core in windows():
+            prof.lap("mfcc")
+            try:
+                mel_db, mfcc_backend = window_mel_db(y, read_start, native_sr, in_core)
+                if mel_db.size:
+                    peak = max(peak, float(mel_db.max()))
+            except Exception:
+                pass
+            prof.lap("decode")
+        if np.isfinite(peak):
+            mfcc_floor = peak - MFCC_TOP_DB
+            prof.note(mfcc_backend=mfcc_backend)
+
+    prof.lap("decode")
+    for y, native_sr, read_start, core_start, total, c0, c1, in_core in windows():
+        duration_s = total / native_sr
+        offset_s = read_start / native_sr
+        sound = make_sound(y, sr) if "sound" in products else None
+        ctx = AnalysisContext(sound, y, sr, profiler=prof, features=selected,
+                              quality=quality)
+
+        if wants("f0_mean", "f0_sd", "f0_range", "ppe", "articulation_rate",
+                 "voice_breaks", "tremor_freq_power", "breathiness_h1h2"):
+            prof.lap("pitch")
+            # Pitch contour (core frames only)
+            try:
+                times = ctx.pitch.xs()
+                core = in_core(times)
+                f0_parts.append(ctx.f0[core].astype(np.float32))
+                pitch_step = pitch_step or call(ctx.pitch, "Get time step")
+                if wants("breathiness_h1h2"):
+                    voiced = core & (ctx.f0 > 0)
+                    h1h2_vals = compute_h1h2_track(y, sr, times[voiced], ctx.f0[voiced])
+                    h1h2.add(h1h2_vals[np.isfinite(h1h2_vals)])
+            except Exception:
+                pass
+
+        if wants("jitter_local", "shimmer_local"):
+            prof.lap("jitter_shimmer")
+            # Jitter / shimmer, weighted by the number of periods in the core
+            try:
+                pp = ctx.point_process
+                n_per = call(pp, "Get number of periods", c0, c1, 0.0001, 0.02, 1.3)
+                jit = call(pp, "Get jitter (local)", c0, c1, 0.0001, 0.02, 1.3)
+                shim = call([sound, pp], "Get shimmer (local)", c0, c1, 0.0001, 0.02, 1.3, 1.6)
+                if n_per > 0 and np.isfinite(jit) and np.isfinite(shim):
+                    jitter_w += jit * n_per
+                    shimmer_w += shim * n_per
+                    periods += n_per
+            except Exception:
+                pass
+
+        if wants("hnr"):
+            prof.lap("hnr")
+            # HNR: mean over voiced harmonicity frames (Praat's -200 dB = unvoiced)
+            try:
+                harm = ctx.harmonicity
+                vals = harm.values[0]
+                hnr.add(vals[in_core(harm.xs()) & (vals != -200)])
+            except Exception:
+                pass
+
+        if wants("f1_mean", "f2_mean", "formant_bandwidth"):
+            prof.lap("formants")
+            # Formants
+            try:
+                times, freqs, bws = ctx.formant_tracks
+                core = in_core(times)
+                for acc, track in ((f1, freqs[0]), (f2, freqs[1]), (bw1, bws[0])):
+                    track = track[core]
+                    acc.add(track[np.isfinite(track) & (track > 0)])
+            except Exception:
+                pass
+
+        if wants("cpp"):
+            prof.lap("cpp")
+            # CPP
+            try:
+                hop_s = _cpp_hop_s(total / native_sr, preset["cpp_max_frames"])
+                times, cpp_track = compute_cpp_track(y, sr, hop_s=hop_s)
+                cpp.add(cpp_track[in_core(times)])
+            except Exception:
+                pass
+
+        if wants("loudness_decay"):
+            prof.lap("rms")
+            # RMS contour on the global time axis (frame starts in the core)
+            try:
+                times, rms = compute_rms_track(y, sr)
+                core = in_core(times)
+                rms_fit.add(times[core] + offset_s, rms[core])
+            except Exception:
+                pass
+
+        if mfcc_floor is not None:
+            prof.lap("mfcc")
+            # MFCC-2 mean under the recording-wide dB floor
+            try:
+                mel_db, _ = window_mel_db(y, read_start, native_sr, in_core, ctx.spectra)
+                mfcc2.add(mfcc_from_mel_db(mel_db, mfcc_floor)[1])
+            except Exception:
+                pass
+
+        s0, s1 = int(round(c0 * sr)), int(round(c1 * sr))  # core samples
+        if wants("spectral_harmonicity"):
+            prof.lap("hpss")
+            # Harmonic / total energy over the core samples
+            try:
+                core_energy = float(np.sum(np.square(y[s0:s1], dtype=np.float64)))
+                if preset["harmonicity"] == "autocorrelation":
+                    ratio = autocorrelation_harmonicity(y, sr, ctx.spectra)
+                    harm_energy += (ratio or 0.0) * core_energy
+                else:
+                    y_h = harmonic_component(y, sr, ctx.spectra)
+                    harm_energy += float(np.sum(np.square(y_h[s0:s1], dtype=np.float64)))
+                total_energy += core_energy
+            except Exception:
+                pass
+
+        if wants("rpde", "dfa"):
+            prof.lap("decimate")
+            # Decimated signal for RPDE / DFA, on the same global sample grid
+            # as decimate_signal(); the window's overlap absorbs filter edges
+            try:
+                if nolds_step is None:
+                    nolds_step = max(1, int(total * sr / native_sr)
+                                     // nonlinear_params["entropy_max_points"])
+                g0 = int(round(offset_s * sr)) + s0  # global index of core start
+                first = s0 + (-g0) % nolds_step
+                if nolds_step == 1 or nonlinear_params["decimation"] == "stride":
+                    nolds_parts.append(y[first:s1:nolds_step].astype(np.float64))
+                else:
+                    a = first % nolds_step
+                    filtered = resample_poly(y[a:].astype(np.float64), 1, nolds_step)
+                    k0 = (first - a) // nolds_step
+                    nolds_parts.append(filtered[k0:k0 + len(range(first, s1, nolds_step))])
+            except Exception:
+                pass
+
+        if spectral_tilt is None and core_start == 0 and wants("spectral_tilt"):
+            try:
+                spectral_tilt = _compute_spectral_tilt(y, sr)
+            except Exception:
+                spectral_tilt = None
+        prof.lap("decode")  # the next window is read by the loop header
+
+    prof.lap("aggregate")
+    f0 = np.concatenate(f0_parts).astype(np.float64) if f0_parts else np.empty(0)
+    voicing = VoicedIndex(f0, step=pitch_step)
+    f0v = voicing.voiced_f0
+    features = {
+        "f0_mean": float(np.mean(f0v)) if len(f0v) else None,
+        "f0_sd": float(np.std(f0v)) if len(f0v) else None,
+        "f0_range": float(np.max(f0v) - np.min(f0v)) if len(f0v) else None,
+        "jitter_local": float(jitter_w / periods) if periods else None,
+        "shimmer_local": float(shimmer_w / periods) if periods else None,
+        "hnr": hnr.result(),
+        "mfcc2_mean": mfcc2.result(),
+    }
+    f0_helpers = (
+        ("ppe", lambda: _pitch_period_entropy(voicing)),
+        ("voice_breaks", lambda: _voice_break_rate(voicing, duration_s)),
+        ("tremor_freq_power", lambda: _tremor_power(voicing, pitch_step)),
+    )
+
+    if task_type == "conversation":
+        kinds = tuple(k for k in ("rpde", "dfa") if wants(k))
+        if kinds:
+            decimated = np.concatenate(nolds_parts) if nolds_parts else np.empty(0)
+            features.update(extract_nonlinear(None, kinds=kinds,
+                                              params=preset["nonlinear"],
+                                              entropy_input=decimated))
+        features["cpp"] = cpp.result()
+        features["articulation_rate"] = voicing.voiced_ratio
+        features["f1_mean"] = f1.result()
+        features["f2_mean"] = f2.result()
+        features["spectral_harmonicity"] = (
+            float(harm_energy / total_energy) if total_energy > 0 else None
+        )
+    else:
+        f0_helpers = f0_helpers[1:]
+
+    for key, compute in f0_helpers:
+        if not wants(key):
+            continue
+        try:
+            features[key] = compute()
+        except Exception:
+            features[key] = None
+
+    features["formant_bandwidth"] = bw1.result()
+    features["spectral_tilt"] = spectral_tilt
+    features["breathiness_h1h2"] = h1h2.result()
+    features["loudness_decay"] = rms_fit.slope()
+    return {k: v for k, v in features.items() if k in selected}, duration_s
+
+
+# ============================================================================
+# Streaming mode -- incremental features over live 16 kHz PCM
+# ============================================================================
+#
+# Started with ``--stream``.  Raw mono PCM (s16le or f32le) at 16 kHz is read
+# from stdin, or from each connection to ``--stream-listen HOST:PORT``, and
+# analysed in windows of ``--stream-interval`` seconds with
+# ``_CHUNK_OVERLAP_S`` of context on each side, as in extract_chunked.  After
+# each window one JSON line is written (to stdout, or back on the socket):
+#
+#   {"event": "snapshot", "t": 10.0, "rolling": {...}, "cumulative": {...}}
+#
+# "rolling" covers the window that just ended, "cumulative" everything so
+# far; the line written at end of input has "event": "final".  A snapshot
+# waits for the window's right-hand context, so it lags the audio by
+# _CHUNK_OVERLAP_S.  Cumulative state is a fixed set of running sums, so the
+# cost per window does not grow with the length of the call.
+#
+# The final "cumulative" snapshot approximates, but does not equal, a batch
+# extraction of the same audio: analyses that depend on the whole signal
+# only see the audio received so far.
+#   - Praat's voicing decisions (pitch, point process, harmonicity) are
+#     relative to each window's own peak amplitude, and periods straddling
+#     a window edge are cut, so jitter, shimmer and HNR drift.
+#   - The MFCC dB floor is the peak so far minus MFCC_TOP_DB, which equals
+#     batch's floor once the loudest frame has arrived.
+# STREAM_TOLERANCES bounds the drift; scripts/stream_equivalence.py checks
+# it on the synthetic corpus.
+
+STREAM_FEATURES = (
+    "f0_mean", "f0_sd", "f0_range", "jitter_local", "shimmer_local", "hnr",
+    "voice_breaks", "loudness_decay", "mfcc2_mean",
+)
+STREAM_FORMATS = PCM_FORMATS
+# (absolute, relative) tolerance of the final cumulative snapshot against
+# batch extraction, per feature; "*" applies to the rest
+STREAM_TOLERANCES = {
+    "*": (1e-6, 1e-6),
+    "jitter_local": (1e-6, 0.01),
+    "shimmer_local": (1e-6, 0.02),
+    "hnr": (0.05, 0.1),
+    "mfcc2_mean": (0.05, 0.01),
+}
+
+
+class _StreamStats:
+    """Running sums behind :data:`STREAM_FEATURES`.
+
+    ``last_voiced`` carries the voicing of the frame before the first one
+    added, so breaks that straddle a window boundary are counted once.
+    """
+
+    def __init__(self, last_voiced=False):
+        self.f0 = _RunningMean()
+        self.f0_min, self.f0_max = math.inf, -math.inf
+        self.f0_frames = 0
+        self.n_breaks = 0
+        self.last_voiced = last_voiced
+        self.jitter_w = self.shimmer_w = self.periods = 0.0
+        self.hnr = _RunningMean()
+        self.mfcc2 = _RunningMean()
+        self.rms_fit = _RunningLinearFit()
+        self.duration_s = 0.0
+
+    def add(self, window):
+        """Fold in the measurements of one window (see :func:`_stream_window`)."""
+        self.duration_s += window["duration_s"]
+        f0 = window.get("f0")
+        if f0 is not None and len(f0):
+            voiced = f0 > 0
+            self.f0.add(f0[voiced])
+            if voiced.any():
+                self.f0_min = min(self.f0_min, float(f0[voiced].min()))
+                self.f0_max = max(self.f0_max, float(f0[voiced].max()))
+            # Same count as _voice_break_rate: voiced -> unvoiced transitions
+            flags = np.concatenate(([self.last_voiced], voiced))
+            self.n_breaks += int(np.sum(flags[:-1] & ~flags[1:]))
+            self.last_voiced = bool(voiced[-1])
+            self.f0_frames += len(f0)
+        if "periods" in window:
+            jitter_w, shimmer_w, periods = window["periods"]
+            self.jitter_w += jitter_w
+            self.shimmer_w += shimmer_w
+            self.periods += periods
+        if "hnr" in window:
+            self.hnr.add(window["hnr"])
+        if "rms" in window:
+            self.rms_fit.add(*window["rms"])
+        if "mfcc2" in window:
+            self.mfcc2.add(window["mfcc2"])
+
+    def features(self):
+        return {
+            "f0_mean": self.f0.result(),
+            "f0_sd": self.f0.std(),
+            "f0_range": self.f0_max - self.f0_min if self.f0.n else None,
+            "jitter_local": self.jitter_w / self.periods if self.periods else None,
+            "shimmer_local": self.shimmer_w / self.periods if self.periods else None,
+            "hnr": self.hnr.result(),
+            "voice_breaks": (
+                self.n_breaks / self.duration_s
+                if self.f0_frames > 1 and self.duration_s > 0 else None
+            ),
+            "loudness_decay": self.rms_fit.slope(),
+            "mfcc2_mean": self.mfcc2.result(),
+        }
+
+
+def _stream_window(y, sr, c0, c1, offset_s, quality="standard", mel_peak=-math.inf,
+                   last=False):
+    """Measurements of the core [c0, c1) s of one analysis window ``y``
+    ([c0, c1] for the ``last`` window, whose end is the end of the stream).
+
+    ``offset_s`` is the stream time of ``y[0]`` and ``mel_peak`` the highest
+    mel dB value of the earlier windows (the window's ``mel_peak`` includes
+    its own frames).  The measurements are the ones extract_chunked
+    accumulates for the same features; a block that fails is left out of
+    the window.
+    """
+    from parselmouth.praat import call
+
+    sound = make_sound(y, sr)
+    ctx = AnalysisContext(sound, y, sr, features=frozenset(STREAM_FEATURES),
+                          quality=quality)
+    window = {"duration_s": c1 - c0}
+
+    def in_core(times):
+        return (times >= c0) & ((times <= c1) if last else (times < c1))
+
+    try:
+        window["f0"] = ctx.f0[in_core(ctx.pitch.xs())]
+    except Exception:
+        pass
+    try:
+        pp = ctx.point_process
+        n_per = call(pp, "Get number of periods", c0, c1, 0.0001, 0.02, 1.3)
+        jit = call(pp, "Get jitter (local)", c0, c1, 0.0001, 0.02, 1.3)
+        shim = call([sound, pp], "Get shimmer (local)", c0, c1, 0.0001, 0.02, 1.3, 1.6)
+        if n_per > 0 and np.isfinite(jit) and np.isfinite(shim):
+            window["periods"] = (jit * n_per, shim * n_per, n_per)
+    except Exception:
+        pass
+    try:
+        harm = ctx.harmonicity
+        vals = harm.values[0]
+        window["hnr"] = vals[in_core(harm.xs()) & (vals != -200)]
+    except Exception:
+        pass
+    try:
+        times, rms = compute_rms_track(y, sr)
+        core = in_core(times)
+        window["rms"] = (times[core] + offset_s, rms[core])
+    except Exception:
+        pass
+    try:
+        mel_db, centres, _ = mel_db_frames(y, sr, spectra=ctx.spectra,
+                                           start=int(round(offset_s * sr)))
+        mel_db = mel_db[:, in_core(centres / sr)]
+        if mel_db.size:
+            mel_peak = max(mel_peak, float(mel_db.max()))
+            window["mel_peak"] = mel_peak
+            window["mfcc2"] = mfcc_from_mel_db(mel_db, mel_peak - MFCC_TOP_DB)[1]
+    except Exception:
+        pass
+    return window
+
+
+class StreamingExtractor:
+    """Incremental :data:`STREAM_FEATURES` over pushed 16 kHz samples.
+
+    ``push(samples)`` returns the snapshots completed by the new samples and
+    ``close()`` analyses the remainder and returns the final snapshot, whose
+    cumulative features match batch extraction within
+    :data:`STREAM_TOLERANCES`.  Only the current window plus its context is
+    buffered.
+    """
+
+    def __init__(self, interval_s=5.0, sr=16000, quality="standard"):
+        if interval_s <= 0:
+            raise ValueError("interval_s must be positive")
+        self.sr = sr
+        self.quality = quality
+        self.interval = int(round(interval_s * sr))
+        self.overlap = int(_CHUNK_OVERLAP_S * sr)
+        self._parts = []
+        self._buf_start = 0      # stream sample index of the first buffered sample
+        self._buf_len = 0
+        self._core_start = 0     # start of the next window's core
+        self._mel_peak = -math.inf
+        self._total = _StreamStats()
+
+    @property
+    def samples_seen(self):
+        return self._buf_start + self._buf_len
+
+    def push(self, samples):
+        samples = np.asarray(samples, dtype=np.float32).reshape(-1)
+        if len(samples):
+            self._parts.append(samples)
+            self._buf_len += len(samples)
+        snapshots = []
+        while self.samples_seen >= self._core_start + self.interval + self.overlap:
+            snapshots.append(self._analyse(self._core_start + self.interval))
+        return snapshots
+
+    def close(self):
+        if self.samples_seen > self._core_start:
+            snapshot = self._analyse(self.samples_seen, last=True)
+        else:
+            snapshot = self._snapshot(_StreamStats())
+        snapshot["event"] = "final"
+        return snapshot
+
+    def _snapshot(self, rolling):
+        return {
+            "event": "snapshot",
+            "t": round(self._core_start / self.sr, 3),
+            "rolling": sanitize_features(rolling.features()),
+            "cumulative": sanitize_features(self._total.features()),
+        }
+
+    def _analyse(self, core_end, last=False):
+        buf = np.concatenate(self._parts) if len(self._parts) > 1 else self._parts[0]
+        read_start = max(self._buf_start, self._core_start - self.overlap)
+        read_end = min(self.samples_seen, core_end + self.overlap)
+        y = buf[read_start - self._buf_start:read_end - self._buf_start]
+        window = _stream_window(
+            y, self.sr,
+            (self._core_start - read_start) / self.sr,
+            (core_end - read_start) / self.sr,
+            read_start / self.sr, self.quality, self._mel_peak, last,
+        )
+        self._mel_peak = window.get("mel_peak", self._mel_peak)
+        rolling = _StreamStats(last_voiced=self._total.last_voiced)
+        rolling.add(window)
+        self._total.add(window)
+        self._core_start = core_end
+
+        # Keep only the next window's left context
+        keep = max(self._buf_start, core_end - self.overlap)
+        buf = buf[keep - self._buf_start:]
+        self._parts = [buf.copy()] if len(buf) else []
+        self._buf_start, self._buf_len = keep, len(buf)
+        return self._snapshot(rolling)
+
+
+def run_stream(source, out, interval_s=5.0, pcm_format="s16le",
+               quality="standard", block_s=0.1):
+    """Read raw PCM from the binary stream ``source`` until EOF, writing
+    snapshot JSON lines to the text stream ``out``."""
+    dtype = STREAM_FORMATS[pcm_format]
+    stream = StreamingExtractor(interval_s, quality=quality)
+    read = getattr(source, "read1", source.read)
+    block = int(block_s * stream.sr) * dtype.itemsize
+    pending = b""
+
+    def emit(snapshot):
+        out.write(json.dumps(snapshot) + "\n")
+        out.flush()
+
+    while True:
+        data = read(block)
+        if not data:
+            break
+        data = pending + data
+        usable = len(data) - len(data) % dtype.itemsize
+        pending = data[usable:]
+        for snapshot in stream.push(pcm_to_float32(data[:usable], pcm_format)):
+            emit(snapshot)
+    emit(stream.close())
+
+
+def serve_stream(host, port, **kwargs):
+    """Accept PCM streams on ``host:port``, one connection at a time; each
+    connection gets its own snapshots back as JSON lines."""
+    import socket
+    with socket.create_server((host, port)) as server:
+        print(f"Streaming on {host}:{server.getsockname()[1]}", file=sys.stderr,
+              flush=True)
+        while True:
+            conn, _ = server.accept()
+            with conn, conn.makefile("rb") as rfile, \
+                    conn.makefile("w", encoding="utf-8") as wfile:
+                try:
+                    run_stream(rfile, wfile, **kwargs)
+                except OSError:
+                    pass  # client went away mid-stream
+
+
+# ============================================================================
+# Feature cache -- content-addressed results on disk
+# ============================================================================
+#
+# Results are keyed by a hash of the *decoded* samples (so re-encoding or
+# re-muxing the same audio still hits), the request parameters that change
+# the output, and a fingerprint of this script.  Entries live under a
+# per-fingerprint directory; directories left by other extractor versions
+# are deleted when the cache is opened, so a code change invalidates
+# everything automatically.  The cache is bounded in bytes and evicts the
+# least recently used entries (access time is tracked through mtime).
+
+EXTRACTOR_VERSION = "5.2.0"
+
+
+def extractor_fingerprint():
+    """EXTRACTOR_VERSION plus a hash of this source file."""
+    with open(os.path.abspath(__file__), "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    return f"{EXTRACTOR_VERSION}-{digest[:16]}"
+
+
+def audio_content_hash(audio_path, block_frames=1 << 20):
+    """SHA-256 of the decoded samples, streamed in blocks."""
+    h = hashlib.sha256()
+    try:
+        import soundfile as sf
+        with sf.SoundFile(audio_path) as f:
+            h.update(f"{f.samplerate}:{f.channels}:".encode())
+            for block in f.blocks(blocksize=block_frames, dtype="float32", always_2d=True):
+                h.update(np.ascontiguousarray(block).tobytes())
+        return h.hexdigest()
+    except Exception:
+        pass
+    # Formats soundfile cannot read: hash the canonical 16 kHz decode
+    y, _ = load_audio(audio_path, sr=16000)
+    return audio_samples_hash(y)
+
+
+def audio_samples_hash(y, sr=16000):
+    """SHA-256 of an in-memory mono waveform.
+
+    Hashes the same bytes :func:`audio_content_hash` reads from a mono
+    float or 16-bit WAV at ``sr``, so piped and on-disk copies of a
+    recording share cache entries.
+    """
+    h = hashlib.sha256()
+    h.update(f"{sr}:1:".encode())
+    h.update(np.ascontiguousarray(y, dtype=np.float32).tobytes())
+    return h.hexdigest()
+
+
+class FeatureCache:
+    """Size-bounded LRU cache of extraction results on disk.
+
+    Disabled (every lookup misses, nothing is written) when ``cache_dir``
+    is empty.
+    """
+
+    def __init__(self, cache_dir, max_bytes=512 * 1024 * 1024, fingerprint=None):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._fingerprint = fingerprint
+        self._root = None
+
+    @property
+    def enabled(self):
+        return bool(self.cache_dir)
+
+    # Entries live in <cache_dir>/cvf-features-<fingerprint>; ``cache_dir``
+    # is user-supplied and may hold anything else, which is never touched.
+    DIR_PREFIX = "cvf-features-"
+
+    @property
+    def root(self):
+        """Per-fingerprint directory; stale versions are purged on first use."""
+        if self._root is None:
+            import shutil
+            name = self.DIR_PREFIX + (self._fingerprint or extractor_fingerprint())
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for other in os.listdir(self.cache_dir):
+                path = os.path.join(self.cache_dir, other)
+                if (other != name and other.startswith(self.DIR_PREFIX)
+                        and os.path.isdir(path)):
+                    shutil.rmtree(path, ignore_errors=True)
+            self._root = os.path.join(self.cache_dir, name)
+            os.makedirs(self._root, exist_ok=True)
+        return self._root
+
+    @staticmethod
+    def make_key(content_hash, **params):
+        """Combine the audio hash with the output-affecting parameters."""
+        blob = json.dumps({"audio": content_hash, **params}, sort_keys=True)
+        return hashlib.sha256(blob.encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.root, key[:2], key + ".json")
+
+    def get(self, key):
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                result = json.load(f)
+            os.utime(path)  # LRU: mark as recently used
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, key, result):
+        if not self.enabled:
+            return
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(result, f)
+        os.replace(tmp, path)
+        self.writes += 1
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for dirpath, _, files in os.walk(self.root):
+            for name in files:
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                self.evictions += 1
+            except OSError:
+                pass
+
+    def stats(self):
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "max_bytes": self.max_bytes,
+        }
+
+
+FEATURE_CACHE = FeatureCache(
+    os.environ.get("CVF_FEATURE_CACHE_DIR", ""),
+    int(os.environ.get("CVF_FEATURE_CACHE_MAX_MB", "512")) * 1024 * 1024,
+)
+
+
+# ============================================================================
+# Request handling (shared by the one-shot CLI and worker mode)
+# ============================================================================
+
+VALID_TASK_TYPES = ("conversation", "sustained_vowel", "ddk", "fluency")
+VALID_GENDERS = ("male", "female")
+ALLOWED_WHISPER_MODELS = {"tiny", "base", "small", "medium", "large", "large-v2", "large-v3"}
+MAX_AUDIO_SIZE = 500 * 1024 * 1024
+
+F0_NORMS = {
+    "male": {"mean": 120, "sd": 20},
+    "female": {"mean": 210, "sd": 30},
+}
+
+
+def _error_result(message):
+    """Error payload in the shape the Node bridge expects."""
+    return {"status": "error", "error": message, "features": None}
+
+
+def _null_temporal():
+    return {
+        "pause_before_noun": None,
+        "pause_variability": None,
+        "syllable_rate_decay": None,
+        "word_duration_mean": None,
+        "voiced_ratio": None,
+    }
+
+
+def validate_audio_path(audio_path):
+    """Resolve ``audio_path`` and check it is a non-empty file within limits.
+
+    Returns
+    -------
+    (real_path, None) on success, (None, error message) otherwise.
+    """
+    if not audio_path:
+        return None, "Audio file not found"
+    real_path = os.path.realpath(audio_path)
+    if not os.path.isfile(real_path):
+        return None, "Audio file not found"
+    file_size = os.path.getsize(real_path)
+    if file_size > MAX_AUDIO_SIZE:
+        return None, f"Audio file too large ({file_size} bytes, max {MAX_AUDIO_SIZE})"
+    if file_size == 0:
+        return None, "Audio file is empty"
+    return real_path, None
+
+
+def decode_audio_input(data, audio_format="encoded"):
+    """Check and decode audio received in memory (stdin or a worker payload).
+
+    Returns
+    -------
+    ({"y": ..., "loader": ...}, None) on success -- the ``prepared`` dict for
+    :func:`extract_file` -- or (None, error message) otherwise.
+    """
+    if audio_format not in AUDIO_INPUT_FORMATS:
+        return None, "Invalid audio format"
+    if len(data) > MAX_AUDIO_SIZE:
+        return None, f"Audio too large ({len(data)} bytes, max {MAX_AUDIO_SIZE})"
+    if not data:
+        return None, "Audio is empty"
+    try:
+        y, loader = decode_audio_bytes(data, audio_format)
+    except Exception as exc:
+        return None, f"Audio decode failed: {exc}"
+    if y.size == 0:
+        return None, "Audio is empty"
+    return {"y": y, "loader": loader}, None
+
+
+def _extract_whole_file(audio_path, task_type, device="cpu", profiler=None,
+                        features=None, quality="standard", prepared=None,
+                        voiced_only=False):
+    """Load the whole recording and run the per-task extractors.
+
+    ``features`` restricts the output (see :func:`resolve_features`); MFCC
+    and the Praat Sound are only built when a selected feature needs them.
+    ``voiced_only`` is passed on to :class:`AnalysisContext`.
+    ``prepared`` carries an already decoded waveform (``y``, ``loader``) and
+    optionally its MFCCs (``mfccs``, ``mfcc_backend``), as produced for a
+    group of batch entries by :func:`_prepare_batch_audio`.
+
+    Returns (features, duration_s, sample_rate, audio_backend).
+    """
+    prof = profiler or NULL_PROFILER
+    sr = 16000
+    selected, products = resolve_features(task_type, features)
+
+    # Decode once; Praat and NumPy features share the 16 kHz waveform
+    if prepared is not None:
+        y, loader = prepared["y"], prepared["loader"]
+    else:
+        with prof.stage("load_audio"):
+            y, loader = load_audio(audio_path, sr=sr)
+    spectra = SpectralFrontEnd(y, sr, profiler=prof)
+    mfccs, audio_backend = None, loader
+    if "mfcc" in products and prepared is not None and "mfccs" in prepared:
+        mfccs, audio_backend = prepared["mfccs"], prepared["mfcc_backend"]
+        prof.note(mfcc_backend=audio_backend, mfcc_batch=prepared["mfcc_batch"])
+    elif "mfcc" in products:
+        with prof.stage("mfcc"):
+            mfccs, audio_backend = compute_mfcc(y, sr=sr, n_mfcc=13, device=device,
+                                                spectra=spectra)
+        prof.note(mfcc_backend=audio_backend)
+    prof.note(audio_loader=loader)
+    sound = None
+    if "sound" in products:
+        with prof.stage("make_sound"):
+            sound = make_sound(y, sr)
+    ctx = AnalysisContext(sound, y, sr, mfccs=mfccs, profiler=prof, spectra=spectra,
+                          features=None if features is None else selected,
+                          quality=quality, voiced_only=voiced_only)
+    duration_s = float(len(y) / sr)
+
+    def run(extractor, *args):
+        with prof.stage(extractor.__name__):
+            return extractor(*args)
+
+    # ----- Feature extraction per task type -----
+    if task_type == "conversation":
+        v4_features = {
+            **run(extract_tier1, ctx),
+            **run(extract_tier2, ctx),
+        }
+        v5_features = run(extract_v5_acoustic, ctx)
+        features = {**v4_features, **v5_features}
+
+    elif task_type == "sustained_vowel":
+        v4_features = {
+            **run(extract_sustained_vowel, ctx),
+            **run(extract_vowel_space, ctx),
+        }
+        v5_features = run(extract_v5_acoustic, ctx)
+        features = {**v4_features, **v5_features}
+
+    elif task_type == "ddk":
+        features = run(extract_ddk, y, sr, prof, spectra)
+
+    elif task_type == "fluency":
+        v4_features = run(extract_tier1, ctx)
+        v5_features = run(extract_v5_acoustic, ctx)
+        features = {**v4_features, **v5_features}
+
+    else:
+        features = {}
+
+    if ctx.features is not None:
+        # Blocks compute their feature groups whole (e.g. all F0 stats)
+        features = {k: v for k, v in features.items() if k in selected}
+    return features, duration_s, sr, audio_backend
+
+
+def extract_file(audio_path, task_type, gender="female", device="cpu",
+                 whisper_model="large-v3", word_timestamps=False,
+                 memory_budget_mb=None, cache=None, profile=False, features=None,
+                 quality="standard", prepared=None, whisper_vad=None,
+                 voiced_only=False):
+    """Run the full extraction for one validated audio file.
+
+    When ``memory_budget_mb`` is set and the whole-file path would not fit
+    in it, conversation and fluency recordings are processed in overlapping
+    windows (see :func:`extract_chunked`).  Results are looked up in and
+    stored to ``cache`` (default :data:`FEATURE_CACHE`) when it is enabled;
+    a result whose requested transcription failed is not stored.
+    With ``profile`` the result gets a ``timings`` block (see
+    :class:`StageProfiler`); it is never written to the cache.  ``features``
+    limits the extraction to the named features and the analyses they need
+    (see :func:`resolve_features`); None extracts everything for the task.
+    ``quality`` is one of :data:`QUALITY_TIERS` and is echoed in the result.
+    ``voiced_only`` restricts the signal-level measures to the voiced spans
+    (see :class:`AnalysisContext`); chunked extraction ignores it, so the
+    result echoes the value actually used.
+    ``prepared`` is handed to :func:`_extract_whole_file` (batch mode);
+    ``audio_path`` may be None when it carries audio decoded from memory
+    (see :func:`decode_audio_bytes`), which is never chunked.
+    ``whisper_vad`` (default :data:`WHISPER_VAD`) transcribes only the
+    detected speech regions (see :func:`extract_whisper_timestamps`).
+    With ``word_timestamps``, Whisper runs on a background thread while the
+    acoustic features are extracted (see :func:`submit_whisper`); it is
+    cancelled if extraction fails, and a Whisper failure only leaves
+    ``whisper`` empty.
+
+    Returns the result dict printed by the CLI (``status`` = ``"ok"``).
+    Exceptions propagate to the caller, which reports them as errors.
+    """
+    cache = FEATURE_CACHE if cache is None else cache
+    prof = StageProfiler() if profile else NULL_PROFILER
+    whisper_vad = WHISPER_VAD if whisper_vad is None else bool(whisper_vad)
+    if quality not in QUALITY_TIERS:
+        raise ValueError(f"Unknown quality tier: {quality!r}")
+    if features is not None:
+        features = sorted(resolve_features(task_type, features)[0])
+    wall0, cpu0 = time.perf_counter(), time.process_time()
+
+    def finish(result):
+        if profile:
+            prof.note(device=device,
+                      total_wall_ms=round((time.perf_counter() - wall0) * 1000, 2),
+                      total_cpu_ms=round((time.process_time() - cpu0) * 1000, 2))
+            result["timings"] = prof.report()
+        return result
+
+    chunked = (
+        audio_path is not None and task_type in _CHUNKED_TASKS
+        and needs_chunking(audio_path, memory_budget_mb)
+    )
+    voiced_only = bool(voiced_only) and not chunked
+
+    key = None
+    if cache.enabled:
+        with prof.stage("cache_lookup"):
+            key = FeatureCache.make_key(
+                audio_content_hash(audio_path) if audio_path is not None
+                else audio_samples_hash(prepared["y"]),
+                task_type=task_type, gender=gender,
+                whisper_model=whisper_model if word_timestamps else None,
+                whisper_vad=whisper_vad if word_timestamps else None,
+                chunk_s=chunk_seconds_for_budget(memory_budget_mb) if chunked else None,
+                extractor_mode=_extractor_mode,
+                features=features,
+                quality=quality,
+                voiced_only=voiced_only,
+            )
+            cached = cache.get(key)
+        if cached is not None:
+            cached["cache"] = "hit"
+            return finish(cached)
+
+    result = {
+        "task_type": task_type,
+        "gender": gender,
+    }
+
+    # ----- Whisper transcription, concurrently with the acoustic stage -----
+    whisper_job = None
+    if word_timestamps:
+        if not chunked and prepared is None:
+            # Decode up front so both stages share the waveform
+            with prof.stage("load_audio"):
+                y, loader = load_audio(audio_path)
+            prepared = {"y": y, "loader": loader}
+        whisper_job = submit_whisper(
+            audio_path, model_name=whisper_model, device=device,
+            y=None if chunked else prepared["y"], vad=whisper_vad, profiler=prof,
+        )
+
+    try:
+        if chunked:
+            chunk_s = chunk_seconds_for_budget(memory_budget_mb)
+            with prof.stage("extract_chunked"):
+                values, duration_s = extract_chunked(
+                    audio_path, task_type, chunk_s, profiler=prof, features=features,
+                    quality=quality, device=device,
+                )
+            sr, audio_backend = 16000, "soundfile"
+            prof.note(audio_loader="soundfile")
+            result["extraction_mode"] = "chunked"
+            result["chunk_s"] = chunk_s
+        else:
+            values, duration_s, sr, audio_backend = _extract_whole_file(
+                audio_path, task_type, device=device, profiler=prof, features=features,
+                quality=quality, prepared=prepared, voiced_only=voiced_only,
+            )
+    except BaseException:
+        if whisper_job is not None:
+            future, cancel = whisper_job
+            cancel.set()
+            future.cancel()
+        raise
+
+    result.update({
+        "duration_s": round(duration_s, 3),
+        "sample_rate": sr,
+        "device": device,
+        "audio_backend": audio_backend,
+        "extractor_mode": _extractor_mode,
+        "quality": quality,
+        "voiced_only": voiced_only,
+        "f0_norm_ref": F0_NORMS[gender],
+    })
+
+    if features is not None:
+        result["feature_selection"] = features
+
+    # Sanitize numeric features
+    result["features"] = sanitize_features(values)
+
+    # ----- Whisper word timestamps (error boundary: features are kept) -----
+    if word_timestamps:
+        with prof.stage("whisper_wait"):
+            try:
+                whisper_result = whisper_job[0].result()
+            except Exception:
+                whisper_result = None
+        prof.note(whisper_model=whisper_model,
+                  whisper_device=_whisper_device(device), whisper_vad=whisper_vad)
+        if whisper_result is not None:
+            result["whisper"] = whisper_result
+            # Compute temporal indicators from word timestamps
+            with prof.stage("temporal"):
+                result["temporal"] = compute_temporal_from_whisper(
+                    whisper_result["words"], duration_s,
+                )
+        else:
+            result["whisper"] = None
+            result["temporal"] = _null_temporal()
+    else:
+        result["whisper"] = None
+        result["temporal"] = None
+
+    result["status"] = "ok"
+    # A failed transcription may be transient; don't make it permanent
+    whisper_failed = word_timestamps and result["whisper"] is None
+    if key is not None and not whisper_failed:
+        with prof.stage("cache_store"):
+            cache.put(key, result)
+        result["cache"] = "miss"
+    return finish(result)
+
+
+# ============================================================================
+# Library API -- in-process extraction with typed results
+# ============================================================================
+#
+#   from extract_features_v5 import extract
+#   result = extract("rec.wav", "sustained_vowel", gender="male")
+#   result["jitter_local"], result.unit("jitter_local")   # 0.0042, "ratio"
+#   json.dumps(result.to_dict())                          # the CLI's JSON
+#
+# ``audio`` may be a path, the bytes of an audio file (or raw PCM with
+# ``audio_format``), or a NumPy waveform.  Bad arguments raise ValueError;
+# extraction failures propagate as they do from extract_file.
+
+# Unit of every feature in FEATURE_DEPENDENCIES.  "ratio" is a dimensionless
+# fraction, "FS" is RMS amplitude relative to digital full scale.
+FEATURE_UNITS = {
+    "f0_mean": "Hz", "f0_sd": "Hz", "f0_range": "Hz", "f0_min": "Hz", "f0_max": "Hz",
+    "jitter_local": "ratio", "jitter_local_abs": "s", "jitter_rap": "ratio",
+    "jitter_ppq5": "ratio", "jitter_ddp": "ratio",
+    "shimmer_local": "ratio", "shimmer_local_db": "dB", "shimmer_apq3": "ratio",
+    "shimmer_apq5": "ratio", "shimmer_apq11": "ratio", "shimmer_dda": "ratio",
+    "hnr": "dB",
+    "nhr": "ratio",
+    "mfcc2_mean": "coefficient",
+    "rpde": "dimensionless",
+    "dfa": "dimensionless",
+    "d2": "dimensionless",
+    "ppe": "dimensionless",
+    "cpp": "dB",
+    "articulation_rate": "ratio",
+    "f1_mean": "Hz", "f2_mean": "Hz", "vsa": "Hz^2", "vai": "ratio",
+    "spectral_harmonicity": "ratio",
+    "formant_bandwidth": "Hz",
+    "spectral_tilt": "dB/Hz",
+    "voice_breaks": "1/s",
+    "tremor_freq_power": "ratio",
+    "breathiness_h1h2": "dB",
+    "loudness_decay": "FS/s",
+    "onset_count": "count", "ddk_rate": "1/s", "ddk_regularity_cv": "ratio",
+    "ddk_mean_ioi": "s", "ddk_sd_ioi": "s", "festination": "bool",
+}
+
+
+class FeatureResult:
+    """Typed view of one extraction (see :func:`extract`).
+
+    ``features`` maps each feature the task (or selection) produces to a
+    number in :data:`FEATURE_UNITS`, or None when it could not be measured
+    on this recording (too short, too little voicing, analysis failed).
+    Features that were not requested are absent, not None.  ``whisper``
+    and ``temporal`` are None without word timestamps; ``meta`` holds the
+    remaining fields of the JSON result (device, backends, cache, timings).
+    """
+
+    __slots__ = ("task_type", "gender", "duration_s", "sample_rate", "quality",
+                 "features", "whisper", "temporal", "meta")
+
+    def __init__(self, task_type, gender, duration_s, sample_rate, quality,
+                 features, whisper=None, temporal=None, meta=None):
+        self.task_type = task_type
+        self.gender = gender
+        self.duration_s = duration_s
+        self.sample_rate = sample_rate
+        self.quality = quality
+        self.features = features
+        self.whisper = whisper
+        self.temporal = temporal
+        self.meta = meta or {}
+
+    @classmethod
+    def from_dict(cls, result):
+        """Build from an :func:`extract_file` result dict."""
+        meta = {k: v for k, v in result.items() if k not in cls.__slots__ and k != "status"}
+        return cls(
+            result["task_type"], result["gender"], result["duration_s"],
+            result["sample_rate"], result["quality"], dict(result["features"]),
+            whisper=result.get("whisper"), temporal=result.get("temporal"),
+            meta=meta,
+        )
+
+    def to_dict(self):
+        """The JSON result printed by the CLI and returned by workers."""
+        return {
+            "task_type": self.task_type,
+            "gender": self.gender,
+            "duration_s": self.duration_s,
+            "sample_rate": self.sample_rate,
+            "quality": self.quality,
+            **self.meta,
+            "features": sanitize_features(self.features),
+            "whisper": self.whisper,
+            "temporal": self.temporal,
+            "status": "ok",
+        }
+
+    def __getitem__(self, name):
+        return self.features[name]
+
+    def __contains__(self, name):
+        return name in self.features
+
+    def get(self, name, default=None):
+        return self.features.get(name, default)
+
+    @staticmethod
+    def unit(name):
+        """Unit of feature ``name`` (see :data:`FEATURE_UNITS`)."""
+        return FEATURE_UNITS[name]
+
+    @property
+    def missing(self):
+        """Names of the produced features that could not be measured."""
+        return tuple(k for k, v in self.features.items() if v is None)
+
+    def __repr__(self):
+        measured = len(self.features) - len(self.missing)
+        return (f"FeatureResult(task_type={self.task_type!r}, "
+                f"duration_s={self.duration_s}, features={measured}/{len(self.features)})")
+
+
+def _waveform_input(y, sr):
+    """Mono float32 copy of a NumPy waveform, resampled to 16 kHz.
+
+    2-D input is averaged over its shorter axis (channels); integer samples
+    are scaled to [-1, 1).
+    """
+    y = np.asarray(y)
+    if y.ndim == 2:
+        y = y.mean(axis=int(np.argmin(y.shape)))
+    if y.ndim != 1 or y.size == 0:
+        raise ValueError("audio array must be a non-empty 1-D or 2-D array")
+    if y.dtype.kind == "i":
+        y = y.astype(np.float32) / np.float32(np.iinfo(y.dtype).max + 1)
+    elif y.dtype.kind == "f":
+        y = y.astype(np.float32)
+    else:
+        raise ValueError(f"Unsupported audio dtype: {y.dtype}")
+    return resample_waveform(y, sr, 16000)
+
+
+def extract(audio, task_type, gender="female", *, sr=16000, audio_format="encoded",
+            gpu=False, whisper_model="large-v3", word_timestamps=False,
+            whisper_vad=None, memory_budget_mb=None, features=None,
+            quality="standard", voiced_only=False, profile=False, cache=None):
+    """Extract the features of one recording in-process.
+
+    ``audio`` is a path, ``bytes`` in ``audio_format`` (see
+    :func:`decode_audio_bytes`) or a NumPy waveform at ``sr``.  The other
+    arguments are those of :func:`extract_file`; ``gpu`` picks the device
+    with :func:`get_device`.
+
+    Returns a :class:`FeatureResult`.
+    """
+    if task_type not in VALID_TASK_TYPES:
+        raise ValueError(f"Invalid task type: {task_type!r}")
+    if gender not in VALID_GENDERS:
+        raise ValueError(f"Invalid gender: {gender!r}")
+    if whisper_model not in ALLOWED_WHISPER_MODELS:
+        raise ValueError(f"Invalid Whisper model: {whisper_model!r}")
+
+    audio_path, prepared = None, None
+    if isinstance(audio, (str, os.PathLike)):
+        audio_path, error = validate_audio_path(os.fspath(audio))
+    elif isinstance(audio, (bytes, bytearray, memoryview)):
+        prepared, error = decode_audio_input(bytes(audio), audio_format)
+    elif isinstance(audio, np.ndarray):
+        prepared, error = {"y": _waveform_input(audio, sr), "loader": "array"}, None
+    else:
+        raise TypeError(f"audio must be a path, bytes or ndarray, not {type(audio).__name__}")
+    if error:
+        raise ValueError(error)
+
+    result = extract_file(
+        audio_path, task_type, gender=gender, device=get_device(prefer_gpu=gpu),
+        whisper_model=whisper_model, word_timestamps=word_timestamps,
+        memory_budget_mb=memory_budget_mb, cache=cache, profile=profile,
+        features=parse_feature_list(features), quality=quality,
+        prepared=prepared, whisper_vad=whisper_vad, voiced_only=voiced_only,
+    )
+    return FeatureResult.from_dict(result)
+
+
+# ============================================================================
+# Worker mode -- JSON-lines request/response loop over stdin/stdout
+# ============================================================================
+#
+# Started with ``--worker``.  The process imports the DSP stack once, prints
+# ``{"event": "ready", "pid": ...}`` and then answers one JSON line per
+# request line:
+#
+#   {"id": 1, "op": "extract", "audio_path": "...", "task_type": "ddk",
+#    "gender": "female", "gpu": false, "whisper_model": "large-v3",
+#    "word_timestamps": false, "profile": false, "features": ["f0_mean"],
+#    "quality": "standard", "whisper_vad": true}
+#   -> {"id": 1, "status": "ok", "quality": "standard", "features": {...}, ...}
+#      (plus "timings": {...} when "profile" is true; "features" is
+#      optional and limits the extraction to the listed features;
+#      "whisper_vad" defaults to CVF_WHISPER_VAD; "voiced_only": true
+#      limits CPP, RPDE/DFA/D2, spectral harmonicity and spectral tilt to
+#      the voiced spans)
+#
+#   {"id": 2, "op": "ping"}      -> {"id": 2, "status": "ok", "op": "pong",
+#                                    "whisper_cache": {...},
+#                                    "feature_cache": {...}, ...}
+#   {"id": 3, "op": "shutdown"}  -> {"id": 3, "status": "ok", "op": "shutdown"}
+#
+# Instead of "audio_path" an extract request may carry the audio itself:
+# "audio_bytes": N announces N raw bytes that follow the request's newline,
+# in "audio_format" "encoded" (default; any container ffmpeg reads), "s16le"
+# or "f32le" (16 kHz mono PCM).  Nothing is written to disk.
+#
+# Anything the libraries print is diverted to stderr so stdout only ever
+# carries protocol lines.
+
+def _preload_modules():
+    """Import the heavy DSP stack up front so requests don't pay for it."""
+    import parselmouth  # noqa: F401
+    import scipy.signal  # noqa: F401
+    try:
+        import librosa  # noqa: F401
+    except ImportError:
+        pass
+    try:
+        import torch  # noqa: F401
+        import torchaudio  # noqa: F401
+    except ImportError:
+        pass
+    _get_nolds()
+
+
+def handle_worker_request(request, prefer_gpu=False, memory_budget_mb=None,
+                          prepared=None, audio=None):
+    """Execute one worker request dict and return the response dict.
+
+    ``prefer_gpu`` and ``memory_budget_mb`` are defaults that the request's
+    ``gpu`` / ``memory_budget_mb`` fields override.  ``prepared`` is passed
+    on to :func:`extract_file`.  ``audio`` holds the request's payload bytes
+    (see ``audio_bytes``), which replace ``audio_path``.
+    """
+    op = request.get("op", "extract")
+    if op != "extract":
+        return _error_result(f"Unknown op: {op}")
+
+    task_type = request.get("task_type")
+    if task_type not in VALID_TASK_TYPES:
+        return _error_result("Invalid task type")
+    gender = request.get("gender", "female")
+    if gender not in VALID_GENDERS:
+        gender = "female"
+    whisper_model = request.get("whisper_model", "large-v3")
+    if whisper_model not in ALLOWED_WHISPER_MODELS:
+        return _error_result("Invalid Whisper model")
+
+    quality = request.get("quality") or "standard"
+    if quality not in QUALITY_TIERS:
+        return _error_result("Invalid quality tier")
+    features = parse_feature_list(request.get("features"))
+    if features is not None:
+        unknown = set(features) - set(FEATURE_DEPENDENCIES)
+        if unknown:
+            return _error_result(f"Unknown feature(s): {', '.join(sorted(unknown))}")
+
+    if audio is not None:
+        audio_path = None
+        prepared, error = decode_audio_input(
+            audio, request.get("audio_format") or "encoded")
+    else:
+        audio_path, error = validate_audio_path(request.get("audio_path"))
+    if error:
+        return _error_result(error)
+
+    device = get_device(prefer_gpu=bool(request.get("gpu", prefer_gpu)))
+    try:
+        return extract_file(
+            audio_path, task_type, gender=gender, device=device,
+            whisper_model=whisper_model,
+            word_timestamps=bool(request.get("word_timestamps", False)),
+            memory_budget_mb=request.get("memory_budget_mb", memory_budget_mb),
+            profile=bool(request.get("profile", False)),
+            features=features,
+            quality=quality,
+            prepared=prepared,
+            whisper_vad=request.get("whisper_vad"),
+            voiced_only=bool(request.get("voiced_only", False)),
+        )
+    except Exception as exc:
+        return _error_result(f"Feature extraction failed: {str(exc)}")
+
+
+def _read_payload(stream, n, block=1 << 20):
+    """Read the ``n`` payload bytes following a request line.
+
+    Payloads over MAX_AUDIO_SIZE are drained without being kept (None is
+    returned) so the next request line is still found.
+    """
+    keep = n <= MAX_AUDIO_SIZE
+    parts, remaining = [], n
+    while remaining > 0:
+        data = stream.read(remaining if keep else min(block, remaining))
+        if not data:
+            raise EOFError("stdin closed inside an audio payload")
+        if keep:
+            parts.append(data)
+        remaining -= len(data)
+    return b"".join(parts) if keep else None
+
+
+def run_worker(prefer_gpu=False, prewarm_whisper=(), memory_budget_mb=None,
+               stdin=None, stdout=None):
+    """Serve extraction requests from the binary stream ``stdin`` (default
+    ``sys.stdin.buffer``) until EOF or shutdown.
+
+    ``prewarm_whisper`` lists Whisper models to load before reporting ready.
+    """
+    stdin = stdin or sys.stdin.buffer
+    out = stdout or sys.stdout
+    sys.stdout = sys.stderr
+
+    def send(payload):
+        out.write(json.dumps(payload) + "\n")
+        out.flush()
+
+    _preload_modules()
+    if prewarm_whisper:
+        try:
+            device = _whisper_device(get_device(prefer_gpu=prefer_gpu))
+            WHISPER_MODELS.prewarm(prewarm_whisper, device)
+        except Exception as exc:
+            print(f"Whisper pre-warm failed: {exc}", file=sys.stderr)
+    send({"event": "ready", "pid": os.getpid()})
+
+    jobs_done = 0
+    while True:
+        line = stdin.readline()
+        if not line:
+            break
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+        except ValueError:
+            send({"id": None, **_error_result("Invalid request")})
+            continue
+
+        audio = None
+        n_bytes = request.get("audio_bytes")
+        if n_bytes is not None:
+            if not isinstance(n_bytes, int) or isinstance(n_bytes, bool) or n_bytes < 0:
+                # The payload cannot be skipped, so the stream is unusable
+                send({"id": request.get("id"), **_error_result("Invalid audio_bytes")})
+                break
+            try:
+                audio = _read_payload(stdin, n_bytes)
+            except EOFError:
+                break
+            if audio is None:
+                send({"id": request.get("id"), **_error_result(
+                    f"Audio too large ({n_bytes} bytes, max {MAX_AUDIO_SIZE})")})
+                continue
+
+        req_id = request.get("id")
+        op = request.get("op", "extract")
+        if op == "ping":
+            send({"id": req_id, "status": "ok", "op": "pong",
+                  "pid": os.getpid(), "jobs_done": jobs_done,
+                  "whisper_cache": WHISPER_MODELS.stats(),
+                  "feature_cache": FEATURE_CACHE.stats()})
+            continue
+        if op == "shutdown":
+            send({"id": req_id, "status": "ok", "op": "shutdown"})
+            break
+
+        response = handle_worker_request(
+            request, prefer_gpu=prefer_gpu, memory_budget_mb=memory_budget_mb,
+            audio=audio,
+        )
+        jobs_done += 1
+        send({"id": req_id, **response})
+
+
+# ============================================================================
+# Batch mode -- manifest fan-out across a process pool
+# ============================================================================
+
+def read_manifest(manifest_path):
+    """Parse a CSV or JSONL manifest into a list of entry dicts.
+
+    Each entry needs a ``path`` (or ``audio_path``) and ``task_type``;
+    ``gender`` defaults to female.  Relative paths are resolved against the
+    manifest's directory.  CSV files need a header row; JSONL is detected
+    from the ``.jsonl``/``.ndjson`` extension or a leading ``{``.
+    """
+    base_dir = os.path.dirname(os.path.realpath(manifest_path))
+    with open(manifest_path, newline="", encoding="utf-8") as f:
+        text = f.read()
+
+    is_jsonl = (
+        manifest_path.endswith((".jsonl", ".ndjson"))
+        or text.lstrip().startswith("{")
+    )
+    if is_jsonl:
+        rows = [json.loads(line) for line in text.splitlines() if line.strip()]
+    else:
+        rows = list(csv.DictReader(io.StringIO(text)))
+
+    entries = []
+    for row in rows:
+        path = (row.get("path") or row.get("audio_path") or "").strip()
+        entries.append({
+            "path": path,
+            "audio_path": os.path.join(base_dir, path) if path else "",
+            "task_type": (row.get("task_type") or "").strip(),
+            "gender": (row.get("gender") or "female").strip() or "female",
+        })
+    return entries
+
+
+def _batch_key(entry):
+    return f"{entry['path']}\t{entry['task_type']}"
+
+
+def _completed_keys(output_path):
+    """Keys of entries that already have an ``ok`` result in ``output_path``."""
+    done = set()
+    if not output_path or not os.path.isfile(output_path):
+        return done
+    with open(output_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # truncated last line from an interrupted run
+            if isinstance(record, dict) and record.get("status") == "ok":
+                done.add(_batch_key(record))
+    return done
+
+
+def _batch_extract(entry, prefer_gpu, whisper_model, word_timestamps,
+                   memory_budget_mb=None, profile=False, features=None,
+                   quality="standard", voiced_only=False, prepared=None):
+    """Process-pool task: extract one manifest entry, never raising."""
+    request = {
+        "task_type": entry["task_type"],
+        "gender": entry["gender"],
+        "audio_path": entry["audio_path"],
+        "gpu": prefer_gpu,
+        "whisper_model": whisper_model,
+        "word_timestamps": word_timestamps,
+        "memory_budget_mb": memory_budget_mb,
+        "profile": profile,
+        "features": features,
+        "quality": quality,
+        "voiced_only": voiced_only,
+    }
+    return handle_worker_request(request, prefer_gpu=prefer_gpu, prepared=prepared)
+
+
+def _prepare_batch_audio(entries, prefer_gpu, memory_budget_mb=None, features=None):
+    """Decode the whole-file entries of a group and compute their MFCCs in
+    one padded batch (:func:`compute_mfcc_batch`).
+
+    Returns ``{index: prepared}`` for :func:`_extract_whole_file`.  Entries
+    that are invalid, go chunked or fail to load are left out, so the
+    per-entry path handles and reports them exactly as it would unbatched.
+    """
+    loaded = {}
+    for i, entry in enumerate(entries):
+        task_type = entry["task_type"]
+        if task_type not in VALID_TASK_TYPES:
+            continue
+        audio_path, error = validate_audio_path(entry["audio_path"])
+        if error or (task_type in _CHUNKED_TASKS
+                     and needs_chunking(audio_path, memory_budget_mb)):
+            continue
+        try:
+            y, loader = load_audio(audio_path)
+            products = resolve_features(task_type, features)[1]
+        except Exception:
+            continue
+        loaded[i] = {"y": y, "loader": loader, "_mfcc": "mfcc" in products}
+
+    want = [i for i, p in loaded.items() if p.pop("_mfcc")]
+    if want:
+        device = get_device(prefer_gpu=prefer_gpu)
+        batch = compute_mfcc_batch([loaded[i]["y"] for i in want], device=device)
+        for i, (mfccs, backend) in zip(want, batch):
+            loaded[i].update(mfccs=mfccs, mfcc_backend=backend, mfcc_batch=len(want))
+    return loaded
+
+
+def _batch_extract_group(entries, prefer_gpu, whisper_model, word_timestamps,
+                         memory_budget_mb=None, profile=False, features=None,
+                         quality="standard", voiced_only=False):
+    """Process-pool task: extract several manifest entries sharing one batched
+    MFCC pass; one result per entry, never raising."""
+    prepared = {}
+    if len(entries) > 1:
+        try:
+            prepared = _prepare_batch_audio(entries, prefer_gpu, memory_budget_mb,
+                                            features)
+        except Exception:
+            prepared = {}
+    return [
+        _batch_extract(entry, prefer_gpu, whisper_model, word_timestamps,
+                       memory_budget_mb, profile, features, quality, voiced_only,
+                       prepared=prepared.get(i))
+        for i, entry in enumerate(entries)
+    ]
+
+
+def run_batch(entries, out, jobs=None, prefer_gpu=False,
+              whisper_model="large-v3", word_timestamps=False,
+              memory_budget_mb=None, profile=False, features=None,
+              quality="standard", voiced_only=False, mfcc_batch=1):
+    """Extract ``entries`` on a process pool, writing one JSON line per file
+    to ``out`` as soon as it finishes.
+
+    With ``mfcc_batch > 1`` consecutive entries are sent to a worker in
+    groups of that size and their MFCCs computed in one padded batch; the
+    per-file results are the same as unbatched.
+
+    A failing file only produces an error line for that file.  If a worker
+    process dies outright (which breaks the whole pool), the entries that were
+    still pending are re-run one process each, so only the entry that crashed
+    again is reported as failed.
+
+    Returns the number of entries that finished with status ``ok``.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from concurrent.futures.process import BrokenProcessPool
+
+    jobs = max(1, jobs or os.cpu_count() or 1)
+    mp_context = multiprocessing.get_context("spawn")
+    n_ok = 0
+
+    def emit(entry, result):
+        nonlocal n_ok
+        record = {"path": entry["path"], "task_type": entry["task_type"],
+                  "gender": entry["gender"], **result}
+        out.write(json.dumps(record) + "\n")
+        out.flush()
+        n_ok += result.get("status") == "ok"
+
+    def submit_all(pending, max_workers):
+        crashed = []
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context,
+                                 initializer=_preload_modules) as pool:
+            size = max(1, mfcc_batch)
+            futures = {
+                pool.submit(_batch_extract_group, group, prefer_gpu, whisper_model,
+                            word_timestamps, memory_budget_mb, profile,
+                            features, quality, voiced_only): group
+                for group in (pending[i:i + size]
+                              for i in range(0, len(pending), size))
+            }
+            for fut in as_completed(futures):
+                group = futures[fut]
+                try:
+                    for entry, result in zip(group, fut.result()):
+                        emit(entry, result)
+                except BrokenProcessPool:
+                    crashed.extend(group)
+                except Exception as exc:
+                    for entry in group:
+                        emit(entry, _error_result(
+                            f"Feature extraction failed: {str(exc)}"))
+        return crashed
+
+    crashed = submit_all(entries, min(jobs, max(1, len(entries))))
+    # Isolate survivors of a crashed pool so one bad file can't sink the rest
+    for entry in crashed:
+        if submit_all([entry], 1):
+            emit(entry, _error_result("Extraction worker process crashed"))
+    return n_ok
+
+
 # ============================================================================
 # Main
 # ============================================================================
@@ -1004,22 +4523,27 @@ def main():
         description="MemoVoice CVF V5 GPU-accelerated acoustic feature extraction"
     )
     parser.add_argument(
-        "--audio-path", required=True, help="Path to input WAV file"
+        "--audio-path", help="Path to input WAV file, or - to read the audio "
+                             "from stdin (see --audio-format)"
     )
     parser.add_argument(
-        "--task-type", required=True,
-        choices=["conversation", "sustained_vowel", "ddk", "fluency"],
+        "--audio-format", choices=AUDIO_INPUT_FORMATS, default="encoded",
+        help="Format of audio read from stdin: any ffmpeg-readable file "
+             "(encoded, default) or raw 16 kHz mono PCM (s16le, f32le)",
+    )
+    parser.add_argument(
+        "--task-type",
+        choices=list(VALID_TASK_TYPES),
         help="Micro-task type",
     )
     parser.add_argument(
-        "--gender", default="female", choices=["male", "female"],
+        "--gender", default="female", choices=list(VALID_GENDERS),
         help="Speaker gender for F0 normalization",
     )
     parser.add_argument(
         "--gpu", action="store_true", default=False,
         help="Prefer GPU acceleration (MPS/CUDA) when available",
     )
-    ALLOWED_WHISPER_MODELS = {"tiny", "base", "small", "medium", "large", "large-v2", "large-v3"}
     parser.add_argument(
         "--whisper-model", default="large-v3",
         choices=sorted(ALLOWED_WHISPER_MODELS),
@@ -1029,141 +4553,215 @@ def main():
         "--word-timestamps", action="store_true", default=False,
         help="Enable Whisper word-level timestamp extraction",
     )
+    parser.add_argument(
+        "--stream", action="store_true", default=False,
+        help="Read raw 16 kHz mono PCM from stdin and write rolling and "
+             "cumulative feature snapshots as JSON lines",
+    )
+    parser.add_argument(
+        "--stream-listen", metavar="HOST:PORT",
+        help="Streaming mode: read PCM from TCP connections instead of stdin",
+    )
+    parser.add_argument(
+        "--stream-interval", type=float, default=5.0,
+        help="Streaming mode: seconds of audio per snapshot (default: 5)",
+    )
+    parser.add_argument(
+        "--stream-format", choices=sorted(STREAM_FORMATS), default="s16le",
+        help="Streaming mode: PCM sample format (default: s16le)",
+    )
+    parser.add_argument(
+        "--no-whisper-vad", action="store_true", default=False,
+        help="Transcribe the whole recording instead of only the speech "
+             "regions found by voice activity detection",
+    )
+    parser.add_argument(
+        "--worker", action="store_true", default=False,
+        help="Serve JSON-lines extraction requests on stdin/stdout",
+    )
+    parser.add_argument(
+        "--whisper-prewarm", default=os.environ.get("CVF_WHISPER_PREWARM", ""),
+        help="Comma-separated Whisper models to load at worker startup "
+             "(default: CVF_WHISPER_PREWARM)",
+    )
+    parser.add_argument(
+        "--whisper-ram-budget-mb", type=int, default=None,
+        help="RAM budget for resident Whisper models "
+             "(default: CVF_WHISPER_RAM_BUDGET_MB or 8192)",
+    )
+    parser.add_argument(
+        "--manifest",
+        help="CSV/JSONL manifest (path, task_type, gender) for batch mode",
+    )
+    parser.add_argument(
+        "--output",
+        help="Batch mode: append JSON-lines results here (default: stdout)",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=None,
+        help="Batch mode: worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--resume", action="store_true", default=False,
+        help="Batch mode: skip entries already OK in --output",
+    )
+    parser.add_argument(
+        "--memory-budget-mb", type=int, default=None,
+        help="Process long conversation/fluency recordings in overlapping "
+             "windows when the whole-file path would exceed this budget",
+    )
+    parser.add_argument(
+        "--cache-dir", default=None,
+        help="Feature cache directory (default: CVF_FEATURE_CACHE_DIR, "
+             "unset = no cache)",
+    )
+    parser.add_argument(
+        "--cache-max-mb", type=int, default=None,
+        help="Feature cache size bound (default: CVF_FEATURE_CACHE_MAX_MB or 512)",
+    )
+    parser.add_argument(
+        "--extractor-mode", choices=EXTRACTOR_MODES, default=None,
+        help="Optimised ('fast') or reference implementations "
+             "(default: CVF_EXTRACTOR_MODE or fast)",
+    )
+    parser.add_argument(
+        "--profile", action="store_true", default=False,
+        help="Add a 'timings' block (wall/CPU ms per stage, peak RSS, "
+             "backends used) to each result",
+    )
+    parser.add_argument(
+        "--features", default=None,
+        help="Comma-separated features to extract (default: all for the "
+             "task); only the analyses they depend on are run",
+    )
+    parser.add_argument(
+        "--quality", choices=QUALITY_TIERS, default="standard",
+        help="Estimator tier: fast (interactive), standard, full (offline); "
+             "recorded in each result",
+    )
+    parser.add_argument(
+        "--voiced-only", action="store_true",
+        help="Compute CPP, RPDE/DFA/D2, spectral harmonicity and spectral "
+             "tilt on the voiced spans only (ignored in chunked mode)",
+    )
+    parser.add_argument(
+        "--mfcc-batch", type=int, default=1,
+        help="Batch mode: files per worker task whose MFCCs are computed in "
+             "one padded torch batch (default: 1)",
+    )
     args = parser.parse_args()
 
-    # --- Validate audio path ---
-    audio_path = os.path.realpath(args.audio_path)
-    if not os.path.isfile(audio_path):
-        print(json.dumps({
-            "status": "error",
-            "error": "Audio file not found",
-            "features": None,
-        }))
-        sys.exit(1)
-
-    # --- Audio file size limit (500MB max) ---
-    MAX_AUDIO_SIZE = 500 * 1024 * 1024
-    file_size = os.path.getsize(audio_path)
-    if file_size > MAX_AUDIO_SIZE:
-        print(json.dumps({
-            "status": "error",
-            "error": f"Audio file too large ({file_size} bytes, max {MAX_AUDIO_SIZE})",
-            "features": None,
-        }))
-        sys.exit(1)
-    if file_size == 0:
-        print(json.dumps({
-            "status": "error",
-            "error": "Audio file is empty",
-            "features": None,
-        }))
+    features = parse_feature_list(args.features)
+    if features is not None:
+        unknown = set(features) - set(FEATURE_DEPENDENCIES)
+        if unknown:
+            parser.error(f"unknown feature(s): {', '.join(sorted(unknown))}")
+
+    # Exported as well so spawned batch processes see the same settings
+    if args.cache_dir is not None:
+        os.environ["CVF_FEATURE_CACHE_DIR"] = args.cache_dir
+        FEATURE_CACHE.cache_dir = args.cache_dir
+    if args.cache_max_mb is not None:
+        os.environ["CVF_FEATURE_CACHE_MAX_MB"] = str(args.cache_max_mb)
+        FEATURE_CACHE.max_bytes = args.cache_max_mb * 1024 * 1024
+    if args.extractor_mode is not None:
+        os.environ["CVF_EXTRACTOR_MODE"] = args.extractor_mode
+        set_extractor_mode(args.extractor_mode)
+    if args.no_whisper_vad:
+        os.environ["CVF_WHISPER_VAD"] = "0"
+        global WHISPER_VAD
+        WHISPER_VAD = False
+    if args.whisper_ram_budget_mb is not None:
+        WHISPER_MODELS.ram_budget_bytes = args.whisper_ram_budget_mb * 1024 * 1024
+
+    if args.stream or args.stream_listen:
+        if args.stream_interval <= 0:
+            parser.error("--stream-interval must be positive")
+        stream_kwargs = {"interval_s": args.stream_interval,
+                         "pcm_format": args.stream_format, "quality": args.quality}
+        if args.stream_listen:
+            host, _, port = args.stream_listen.rpartition(":")
+            if not port.isdigit():
+                parser.error("--stream-listen expects HOST:PORT")
+            serve_stream(host or "127.0.0.1", int(port), **stream_kwargs)
+        else:
+            run_stream(sys.stdin.buffer, sys.stdout, **stream_kwargs)
+        return
+
+    if args.worker:
+        prewarm = [m for m in args.whisper_prewarm.split(",") if m]
+        unknown = set(prewarm) - ALLOWED_WHISPER_MODELS
+        if unknown:
+            parser.error(f"unknown Whisper model(s): {', '.join(sorted(unknown))}")
+        run_worker(prefer_gpu=args.gpu, prewarm_whisper=prewarm,
+                   memory_budget_mb=args.memory_budget_mb)
+        return
+
+    if args.manifest:
+        entries = read_manifest(args.manifest)
+        if args.resume:
+            if not args.output:
+                parser.error("--resume requires --output")
+            done = _completed_keys(args.output)
+            entries = [e for e in entries if _batch_key(e) not in done]
+        out = open(args.output, "a", encoding="utf-8") if args.output else sys.stdout
+        try:
+            n_ok = run_batch(
+                entries, out, jobs=args.jobs, prefer_gpu=args.gpu,
+                whisper_model=args.whisper_model,
+                word_timestamps=args.word_timestamps,
+                memory_budget_mb=args.memory_budget_mb,
+                profile=args.profile,
+                features=features,
+                quality=args.quality,
+                voiced_only=args.voiced_only,
+                mfcc_batch=args.mfcc_batch,
+            )
+        finally:
+            if out is not sys.stdout:
+                out.close()
+        print(f"Batch: {n_ok}/{len(entries)} entries OK", file=sys.stderr)
+        sys.exit(0 if n_ok == len(entries) else 1)
+
+    if not args.audio_path or not args.task_type:
+        parser.error("--audio-path and --task-type are required")
+
+    # --- Validate audio path (existence, 500MB limit, non-empty) ---
+    prepared = None
+    if args.audio_path == "-":
+        audio_path = None
+        prepared, error = decode_audio_input(
+            sys.stdin.buffer.read(MAX_AUDIO_SIZE + 1), args.audio_format)
+    else:
+        audio_path, error = validate_audio_path(args.audio_path)
+    if error:
+        print(json.dumps(_error_result(error)))
         sys.exit(1)
 
     # --- Validate task_type ---
-    valid_tasks = {"conversation", "sustained_vowel", "ddk", "fluency"}
-    if args.task_type not in valid_tasks:
-        print(json.dumps({
-            "status": "error",
-            "error": "Invalid task type",
-            "features": None,
-        }))
+    if args.task_type not in VALID_TASK_TYPES:
+        print(json.dumps(_error_result("Invalid task type")))
         sys.exit(1)
 
     # --- Device detection ---
     device = get_device(prefer_gpu=args.gpu)
 
     try:
-        import parselmouth
-
-        # Load audio + GPU-accelerated MFCCs (with librosa fallback)
-        y, sr, mfccs, audio_backend = load_audio_and_mfcc(
-            audio_path, sr=16000, n_mfcc=13, device=device,
+        result = extract_file(
+            audio_path, args.task_type, gender=args.gender, device=device,
+            whisper_model=args.whisper_model,
+            word_timestamps=args.word_timestamps,
+            memory_budget_mb=args.memory_budget_mb,
+            profile=args.profile,
+            features=features,
+            quality=args.quality,
+            prepared=prepared,
+            voiced_only=args.voiced_only,
         )
-        sound = parselmouth.Sound(audio_path)
-        duration_s = float(len(y) / sr)
-
-        f0_norms = {
-            "male": {"mean": 120, "sd": 20},
-            "female": {"mean": 210, "sd": 30},
-        }
-
-        result = {
-            "task_type": args.task_type,
-            "gender": args.gender,
-            "duration_s": round(duration_s, 3),
-            "sample_rate": sr,
-            "device": device,
-            "audio_backend": audio_backend,
-            "f0_norm_ref": f0_norms[args.gender],
-        }
-
-        # ----- Feature extraction per task type -----
-        if args.task_type == "conversation":
-            v4_features = {
-                **extract_tier1(sound, y, sr, mfccs=mfccs),
-                **extract_tier2(sound, y, sr),
-            }
-            v5_features = extract_v5_acoustic(sound, y, sr)
-            result["features"] = {**v4_features, **v5_features}
-
-        elif args.task_type == "sustained_vowel":
-            v4_features = {
-                **extract_sustained_vowel(sound, y, sr),
-                **extract_vowel_space(sound),
-            }
-            v5_features = extract_v5_acoustic(sound, y, sr)
-            result["features"] = {**v4_features, **v5_features}
-
-        elif args.task_type == "ddk":
-            result["features"] = extract_ddk(y, sr)
-
-        elif args.task_type == "fluency":
-            v4_features = extract_tier1(sound, y, sr, mfccs=mfccs)
-            v5_features = extract_v5_acoustic(sound, y, sr)
-            result["features"] = {**v4_features, **v5_features}
-
-        else:
-            result["features"] = {}
-
-        # Sanitize numeric features
-        if "features" in result and isinstance(result["features"], dict):
-            result["features"] = sanitize_features(result["features"])
-
-        # ----- Whisper transcription + word timestamps -----
-        if args.word_timestamps:
-            whisper_result = extract_whisper_timestamps(
-                audio_path,
-                model_name=args.whisper_model,
-                device=device,
-            )
-            if whisper_result is not None:
-                result["whisper"] = whisper_result
-                # Compute temporal indicators from word timestamps
-                result["temporal"] = compute_temporal_from_whisper(
-                    whisper_result["words"], duration_s,
-                )
-            else:
-                result["whisper"] = None
-                result["temporal"] = {
-                    "pause_before_noun": None,
-                    "pause_variability": None,
-                    "syllable_rate_decay": None,
-                    "word_duration_mean": None,
-                    "voiced_ratio": None,
-                }
-        else:
-            result["whisper"] = None
-            result["temporal"] = None
-
-        result["status"] = "ok"
         print(json.dumps(result))
 
     except Exception as exc:
-        print(json.dumps({
-            "status": "error",
-            "error": f"Feature extraction failed: {str(exc)}",
-            "features": None,
-        }))
+        print(json.dumps(_error_result(f"Feature extraction failed: {str(exc)}")))
         sys.exit(1)
 
 
@@ -11,27 +11,43 @@
  *   - computeWhisperTemporalIndicators() for converting Whisper word arrays into
  *     measured temporal indicators that replace text-proxy estimates
  *
+ * Extraction runs on a pool of long-lived Python workers (extract_features_v5.py
+ * --worker) so the numpy/parselmouth/librosa/torch import cost is paid once per
+ * worker instead of once per recording. Set CVF_ACOUSTIC_WORKERS=0 to fall back
+ * to one process per request.
+ *
+ * Jobs pass through an ExtractionScheduler first: micro-tasks and conversations
+ * run in separate priority lanes with bounded queues, and jobs that cannot
+ * start in time are refused (ExtractionRejectedError, 429/503) up front.
+ *
+ * Audio never touches the disk: the upload bytes are sent to Python with the
+ * request (after the JSON line for workers, on stdin for one-shot runs) and
+ * decoded there, in-process for anything libsndfile reads (WAV, FLAC, Ogg)
+ * and through ffmpeg pipes for other codecs.
+ *
  * Graceful degradation: if Python or ffmpeg are unavailable, all audio
  * indicators return null rather than throwing.
  */
 
-import { execFile } from 'child_process';
+import { execFile, spawn } from 'child_process';
+import { createInterface } from 'readline';
 import { promisify } from 'util';
 import path from 'path';
-import fs from 'fs/promises';
-import os from 'os';
 import { AUDIO_INDICATORS, ACOUSTIC_NORMS, INDICATORS, WHISPER_TEMPORAL_INDICATORS } from './indicators.js';
 
 const execFileAsync = promisify(execFile);
 
 const VALID_TASK_TYPES = new Set(['conversation', 'sustained_vowel', 'ddk', 'fluency']);
 const VALID_GENDERS = new Set(['male', 'female']);
+const QUALITY_TIERS = new Set(['fast', 'standard', 'full']);
 
 const PYTHON_SCRIPT = path.resolve(
   path.dirname(new URL(import.meta.url).pathname),
-  '../../audio/extract_features_v5.py'
+  '../audio/extract_features_v5.py'
 );
 
+const DEFAULT_JOB_TIMEOUT_MS = 120_000;
+
 // ─────────────────────────────────────────────────────────────────────────────
 // Map Python output feature keys -> indicator IDs
 // V4 preserved + 6 new V5 acoustic indicators
@@ -68,6 +84,36 @@ const PYTHON_KEY_TO_INDICATOR = {
   loudness_decay:        'ACU_LOUDNESS_DECAY',
 };
 
+// Indicators derived in JS from several Python features
+const DERIVED_INDICATOR_KEYS = {
+  ACU_F1F2_RATIO: ['f1_mean', 'f2_mean'],
+  PDM_MONOPITCH:  ['f0_sd', 'f0_mean'],
+};
+
+// Mapped keys that extract_features_v5.py does not produce (yet)
+const UNEXTRACTED_KEYS = new Set(['energy_range', 'vot']);
+
+/**
+ * Python feature names needed to fill the given indicator IDs, for the
+ * `features` option of extractAcousticFeatures (Python then only runs the
+ * analyses those features depend on).
+ *
+ * @param {string[]} indicatorIds — e.g. ['ACU_JITTER', 'ACU_F1F2_RATIO'].
+ * @returns {string[]} — Python feature keys.
+ */
+export function featuresForIndicators(indicatorIds) {
+  const keys = new Set();
+  for (const id of indicatorIds) {
+    for (const key of DERIVED_INDICATOR_KEYS[id] || []) keys.add(key);
+    for (const [key, indId] of Object.entries(PYTHON_KEY_TO_INDICATOR)) {
+      if (indId === id && !DERIVED_INDICATOR_KEYS[id] && !UNEXTRACTED_KEYS.has(key)) {
+        keys.add(key);
+      }
+    }
+  }
+  return [...keys];
+}
+
 // Features where HIGHER raw value = WORSE cognitive/motor health.
 // These use inverted sigmoid: score = 0.5 - 0.5 * tanh(...)
 const HIGHER_IS_WORSE = new Set([
@@ -98,49 +144,638 @@ function buildNullVector() {
 }
 
 /**
- * Generate a unique temp file path within os.tmpdir().
+ * Parse JSON from the Python process with prototype pollution protection.
  */
-function tempPath(extension) {
-  const stamp = Date.now().toString(36) + Math.random().toString(36).slice(2, 8);
-  return path.join(os.tmpdir(), `memovoice-${stamp}.${extension}`);
+function parsePythonJson(text) {
+  return JSON.parse(text, (key, value) => {
+    if (key === '__proto__' || key === 'constructor' || key === 'prototype') return undefined;
+    return value;
+  });
 }
 
 // ─────────────────────────────────────────────────────────────────────────────
-// convertToWav
+// ExtractionWorkerPool
 // ─────────────────────────────────────────────────────────────────────────────
 
 /**
- * Convert an audio buffer to 16kHz mono WAV using ffmpeg.
+ * Pool of persistent `extract_features_v5.py --worker` processes speaking the
+ * JSON-lines protocol documented in the Python script. Each worker runs one
+ * job at a time; extra jobs wait in a FIFO queue.
  *
- * @param {Buffer} inputBuffer — Raw audio bytes in any ffmpeg-supported format.
- * @param {string} inputFormat — File extension hint (e.g. 'mp3', 'ogg', 'webm').
- * @returns {Promise<string>} — Path to the converted WAV temp file.
+ *   - Workers are spawned lazily up to `size` and reused across jobs.
+ *   - A worker is recycled after `maxJobsPerWorker` jobs to cap leaks/fragmentation.
+ *   - Each job has its own timeout; a worker that overruns it is killed and replaced.
+ *   - Idle workers are pinged every `healthCheckIntervalMs`; a worker that misses
+ *     the pong deadline is killed and replaced on demand.
+ *   - A worker that dies before reporting ready fails the queued jobs instead of
+ *     respawning in a loop (e.g. python3 or parselmouth missing).
+ *
+ * Worker processes only hold the event loop open while jobs are queued or
+ * running, so an idle pool never keeps Node alive.
  */
-export async function convertToWav(inputBuffer, inputFormat = 'wav') {
-  const inputPath = tempPath(inputFormat);
-  const outputPath = tempPath('wav');
+export class ExtractionWorkerPool {
+  /**
+   * @param {Object} options
+   * @param {number} options.size — Maximum number of worker processes (default 2).
+   * @param {number} options.maxJobsPerWorker — Recycle a worker after this many jobs (default 200).
+   * @param {number} options.jobTimeoutMs — Per-job timeout (default 120s).
+   * @param {number} options.startupTimeoutMs — Time allowed for imports before "ready" (default 60s).
+   * @param {number} options.healthCheckIntervalMs — Idle ping period, 0 disables (default 30s).
+   * @param {number} options.healthCheckTimeoutMs — Pong deadline (default 5s).
+   * @param {string} options.pythonBin — Python executable (default 'python3').
+   * @param {string} options.script — Path to extract_features_v5.py.
+   * @param {string[]} options.workerArgs — Extra CLI args for every worker.
+   */
+  constructor({
+    size = 2,
+    maxJobsPerWorker = 200,
+    jobTimeoutMs = DEFAULT_JOB_TIMEOUT_MS,
+    startupTimeoutMs = 60_000,
+    healthCheckIntervalMs = 30_000,
+    healthCheckTimeoutMs = 5_000,
+    pythonBin = 'python3',
+    script = PYTHON_SCRIPT,
+    workerArgs = [],
+  } = {}) {
+    this.size = Math.max(1, Math.floor(size));
+    this.maxJobsPerWorker = maxJobsPerWorker;
+    this.jobTimeoutMs = jobTimeoutMs;
+    this.startupTimeoutMs = startupTimeoutMs;
+    this.healthCheckTimeoutMs = healthCheckTimeoutMs;
+    this.pythonBin = pythonBin;
+    this.script = script;
+    this.workerArgs = workerArgs;
 
-  await fs.writeFile(inputPath, inputBuffer);
-  await fs.chmod(inputPath, 0o600);
+    this.workers = new Set();
+    this.queue = [];
+    this.nextId = 1;
+    this.closed = false;
+    this.counters = { jobs_completed: 0, jobs_failed: 0, timeouts: 0, workers_started: 0, workers_recycled: 0, workers_crashed: 0 };
 
-  try {
-    await execFileAsync('ffmpeg', [
-      '-y',
-      '-i', inputPath,
-      '-ar', '16000',
-      '-ac', '1',
-      '-sample_fmt', 's16',
-      '-f', 'wav',
-      outputPath,
-    ], { timeout: 30_000 });
-
-    return outputPath;
-  } finally {
-    // Always clean up the input temp file; output is caller's responsibility
-    await cleanup([inputPath]);
+    this.healthTimer = null;
+    if (healthCheckIntervalMs > 0) {
+      this.healthTimer = setInterval(() => this._healthCheck(), healthCheckIntervalMs);
+      this.healthTimer.unref();
+    }
+  }
+
+  /**
+   * Submit one extraction request (fields of the worker protocol, minus `id`).
+   *
+   * @param {Object} request — { audio_path, task_type, gender, gpu, whisper_model, word_timestamps }
+   * @param {Object} options
+   * @param {number} options.timeoutMs — Override the pool's per-job timeout.
+   * @param {Buffer|null} options.audio — Audio bytes sent after the request line
+   *   in place of `audio_path` (format given by `request.audio_format`).
+   * @returns {Promise<Object>} — Parsed worker response (status 'ok' or 'error').
+   */
+  run(request, { timeoutMs = this.jobTimeoutMs, audio = null } = {}) {
+    if (this.closed) return Promise.reject(new Error('Extraction pool is closed'));
+    return new Promise((resolve, reject) => {
+      const line = { ...request, op: 'extract', ...(audio ? { audio_bytes: audio.length } : {}) };
+      this.queue.push({ request: line, audio, timeoutMs, resolve, reject });
+      this._dispatch();
+    });
+  }
+
+  /** Snapshot of pool state for metrics endpoints. */
+  stats() {
+    let busy = 0, starting = 0;
+    for (const w of this.workers) {
+      if (!w.ready) starting++;
+      else if (w.job) busy++;
+    }
+    return {
+      size: this.size,
+      workers: this.workers.size,
+      busy,
+      starting,
+      idle: this.workers.size - busy - starting,
+      queued: this.queue.length,
+      ...this.counters,
+    };
+  }
+
+  /** Stop all workers and reject queued jobs. */
+  async close() {
+    this.closed = true;
+    if (this.healthTimer) clearInterval(this.healthTimer);
+    for (const job of this.queue.splice(0)) job.reject(new Error('Extraction pool is closed'));
+    for (const w of this.workers) this._kill(w, new Error('Extraction pool is closed'));
+  }
+
+  _hasPendingWork() {
+    if (this.queue.length > 0) return true;
+    for (const w of this.workers) if (w.job?.kind === 'extract') return true;
+    return false;
+  }
+
+  _setRef(worker, keepAlive) {
+    const method = keepAlive ? 'ref' : 'unref';
+    worker.proc[method]();
+    worker.proc.stdin?.[method]?.();
+    worker.proc.stdout?.[method]?.();
+  }
+
+  _dispatch() {
+    if (this.closed) return;
+    this._dispatchJobs();
+    const keepAlive = this._hasPendingWork();
+    for (const w of this.workers) this._setRef(w, keepAlive);
+  }
+
+  _dispatchJobs() {
+    for (const w of this.workers) {
+      if (this.queue.length === 0) return;
+      if (w.ready && !w.job && !w.retiring) this._assign(w, this.queue.shift());
+    }
+    // Only spawn for work that no starting worker will pick up
+    let starting = 0;
+    for (const w of this.workers) if (!w.ready) starting++;
+    while (this.workers.size < this.size && this.queue.length > starting) {
+      this._spawn();
+      starting++;
+    }
+  }
+
+  _spawn() {
+    const proc = spawn(this.pythonBin, [this.script, '--worker', ...this.workerArgs], {
+      stdio: ['pipe', 'pipe', 'ignore'],
+    });
+    const worker = { proc, ready: false, job: null, jobs: 0, retiring: false, exited: false };
+    this.workers.add(worker);
+    this.counters.workers_started++;
+
+    this._setRef(worker, this._hasPendingWork());
+    proc.stdin.on('error', () => {}); // EPIPE surfaces through 'exit'
+
+    worker.startupTimer = setTimeout(() => {
+      this._kill(worker, new Error('Extraction worker did not start in time'));
+    }, this.startupTimeoutMs);
+    worker.startupTimer.unref();
+
+    const lines = createInterface({ input: proc.stdout });
+    lines.on('line', line => this._onLine(worker, line));
+    proc.on('error', err => this._onExit(worker, err));
+    proc.on('exit', (code, signal) => {
+      this._onExit(worker, new Error(`Extraction worker exited (code=${code}, signal=${signal})`));
+    });
+  }
+
+  _onLine(worker, line) {
+    let msg;
+    try {
+      msg = parsePythonJson(line);
+    } catch {
+      return; // not a protocol line
+    }
+    if (!msg || typeof msg !== 'object') return;
+
+    if (msg.event === 'ready') {
+      worker.ready = true;
+      clearTimeout(worker.startupTimer);
+      this._dispatch();
+      return;
+    }
+
+    const job = worker.job;
+    if (!job || msg.id !== job.id) return;
+    clearTimeout(job.timer);
+    worker.job = null;
+
+    if (job.kind === 'ping') {
+      this._release(worker);
+      return;
+    }
+
+    worker.jobs++;
+    if (msg.status === 'ok') this.counters.jobs_completed++;
+    else this.counters.jobs_failed++;
+    delete msg.id;
+    job.resolve(msg);
+    this._release(worker);
+  }
+
+  _assign(worker, job) {
+    const id = this.nextId++;
+    worker.job = { ...job, id, kind: 'extract' };
+    worker.job.timer = setTimeout(() => {
+      this.counters.timeouts++;
+      this._kill(worker, new Error(`Extraction timed out after ${job.timeoutMs} ms`));
+    }, job.timeoutMs);
+    worker.proc.stdin.write(JSON.stringify({ id, ...job.request }) + '\n');
+    if (job.audio) worker.proc.stdin.write(job.audio);
+  }
+
+  _release(worker) {
+    if (worker.jobs >= this.maxJobsPerWorker) {
+      // Graceful recycle: the worker exits after answering the shutdown op
+      worker.retiring = true;
+      this.counters.workers_recycled++;
+      this.workers.delete(worker);
+      worker.proc.stdin.end(JSON.stringify({ id: this.nextId++, op: 'shutdown' }) + '\n');
+    }
+    this._dispatch();
+  }
+
+  _healthCheck() {
+    for (const w of this.workers) {
+      if (!w.ready || w.job || w.retiring) continue;
+      const id = this.nextId++;
+      w.job = { id, kind: 'ping' };
+      w.job.timer = setTimeout(() => {
+        this._kill(w, new Error('Extraction worker failed health check'));
+      }, this.healthCheckTimeoutMs);
+      w.job.timer.unref();
+      w.proc.stdin.write(JSON.stringify({ id, op: 'ping' }) + '\n');
+    }
+  }
+
+  _kill(worker, reason) {
+    try { worker.proc.kill('SIGKILL'); } catch { /* already gone */ }
+    this._onExit(worker, reason);
+  }
+
+  _onExit(worker, reason) {
+    if (worker.exited) return;
+    worker.exited = true;
+    clearTimeout(worker.startupTimer);
+    const wasTracked = this.workers.delete(worker);
+
+    if (worker.job) {
+      clearTimeout(worker.job.timer);
+      if (worker.job.kind === 'extract') {
+        this.counters.jobs_failed++;
+        worker.job.reject(reason);
+      }
+      worker.job = null;
+    }
+    if (!wasTracked || this.closed) return;
+    this.counters.workers_crashed++;
+
+    if (!worker.ready) {
+      // Startup failure: respawning would just fail again, so fail fast
+      for (const job of this.queue.splice(0)) job.reject(reason);
+      return;
+    }
+    this._dispatch();
+  }
+}
+
+let sharedPool = null;
+let sharedPoolOptions = null;
+
+/**
+ * Configure the pool used by extractAcousticFeatures(). Passing `size: 0`
+ * disables pooling (one Python process per request). Replaces any existing pool.
+ *
+ * @param {Object} options — ExtractionWorkerPool options.
+ */
+export function configureExtractionPool(options = {}) {
+  if (sharedPool) sharedPool.close();
+  sharedPool = null;
+  sharedPoolOptions = options;
+}
+
+/**
+ * Shared pool for extractAcousticFeatures(), created on first use.
+ * Size defaults to CVF_ACOUSTIC_WORKERS (2 when unset).
+ *
+ * @returns {ExtractionWorkerPool|null} — null when pooling is disabled.
+ */
+export function getExtractionPool() {
+  if (sharedPool) return sharedPool;
+  const envSize = Number.parseInt(process.env.CVF_ACOUSTIC_WORKERS ?? '', 10);
+  const options = { size: Number.isFinite(envSize) ? envSize : 2, ...sharedPoolOptions };
+  if (!(options.size > 0)) return null;
+  sharedPool = new ExtractionWorkerPool(options);
+  return sharedPool;
+}
+
+// ─────────────────────────────────────────────────────────────────────────────
+// ExtractionScheduler
+// ─────────────────────────────────────────────────────────────────────────────
+
+// Micro-tasks a patient is waiting on; everything else runs in the batch lane
+const INTERACTIVE_TASK_TYPES = new Set(['sustained_vowel', 'ddk', 'fluency']);
+
+// Worker milliseconds per second of audio, before per-task calibration
+const ACOUSTIC_MS_PER_AUDIO_S = { conversation: 350, sustained_vowel: 500, ddk: 100, fluency: 200 };
+const WHISPER_MS_PER_AUDIO_S = {
+  tiny: 100, base: 150, small: 350, medium: 800, large: 1500, 'large-v2': 1500, 'large-v3': 1500,
+};
+const JOB_OVERHEAD_MS = 300;
+const MAX_JOB_TIMEOUT_MS = 900_000;
+
+// Conservative byte rates (bytes per second of audio) for compressed uploads;
+// underestimating the bitrate overestimates the duration, which errs on the
+// side of admitting less.
+const ASSUMED_BYTE_RATE = { mp3: 8_000, ogg: 4_000, webm: 4_000, flac: 16_000 };
+
+/**
+ * Duration of an audio buffer in seconds: exact for PCM WAV (from the header),
+ * estimated from the size for compressed formats.
+ *
+ * @param {Buffer} buffer — Audio bytes.
+ * @param {string} format — File extension hint (e.g. 'wav', 'webm').
+ * @returns {number} — Duration in seconds.
+ */
+export function estimateAudioDurationS(buffer, format = 'wav') {
+  if (buffer.length >= 12 && buffer.toString('ascii', 0, 4) === 'RIFF' && buffer.toString('ascii', 8, 12) === 'WAVE') {
+    let byteRate = 0;
+    for (let pos = 12; pos + 8 <= buffer.length;) {
+      const id = buffer.toString('ascii', pos, pos + 4);
+      const size = buffer.readUInt32LE(pos + 4);
+      if (id === 'fmt ' && pos + 16 <= buffer.length) byteRate = buffer.readUInt32LE(pos + 16);
+      if (id === 'data' && byteRate > 0) {
+        return Math.min(size, buffer.length - pos - 8) / byteRate;
+      }
+      pos += 8 + size + (size % 2);
+    }
+  }
+  return buffer.length / (ASSUMED_BYTE_RATE[format] || 32_000);
+}
+
+/**
+ * Rejection from ExtractionScheduler admission control. `statusCode` is 429
+ * when the lane's queue is full and 503 when the estimated wait exceeds the
+ * lane's deadline (or the scheduler is closed); `retryAfterS` is the
+ * suggested Retry-After.
+ */
+export class ExtractionRejectedError extends Error {
+  constructor(message, { statusCode, retryAfterS = null, lane = null } = {}) {
+    super(message);
+    this.name = 'ExtractionRejectedError';
+    this.statusCode = statusCode;
+    this.retryAfterS = retryAfterS;
+    this.lane = lane;
+    this.expose = true;
+  }
+}
+
+function percentile(sorted, p) {
+  if (sorted.length === 0) return null;
+  return sorted[Math.min(sorted.length - 1, Math.floor(p * sorted.length))];
+}
+
+/**
+ * Admission control and priority lanes in front of the extractor.
+ *
+ *   - Jobs are costed (expected worker ms) from audio duration, task type and
+ *     Whisper model; the per-task estimate is calibrated online against the
+ *     observed run times. Each job's timeout scales with its cost.
+ *   - At most `concurrency` jobs run at once. The `interactive` lane is always
+ *     served first and `reservedInteractive` slots are never given to the
+ *     `batch` lane, so a long conversation cannot hold every worker while a
+ *     micro-task waits.
+ *   - Each lane has a bounded queue (`maxQueued`, else 429) and a wait
+ *     deadline (`maxWaitMs`): a job whose estimated start is later than that
+ *     is refused with 503 instead of queueing.
+ *
+ * `stats()` reports queue depth, queued cost and wait/run percentiles per lane.
+ */
+export class ExtractionScheduler {
+  /**
+   * @param {Object} options
+   * @param {number} options.concurrency — Jobs running at once (default 2; match the pool size).
+   * @param {number} options.reservedInteractive — Slots kept free of batch jobs
+   *   (default 1 when concurrency > 1, else 0).
+   * @param {Object} options.lanes — Per-lane { maxQueued, maxWaitMs } overrides for
+   *   'interactive' (default 32, 15 s) and 'batch' (default 8, 30 min).
+   * @param {number} options.historySize — Jobs kept per lane for percentiles (default 200).
+   */
+  constructor({
+    concurrency = 2,
+    reservedInteractive = concurrency > 1 ? 1 : 0,
+    lanes = {},
+    historySize = 200,
+  } = {}) {
+    this.concurrency = Math.max(1, Math.floor(concurrency));
+    this.reservedInteractive = Math.min(Math.max(0, reservedInteractive), this.concurrency - 1);
+    this.historySize = historySize;
+    this.lanes = {
+      interactive: this._lane({ maxQueued: 32, maxWaitMs: 15_000, ...lanes.interactive }),
+      batch: this._lane({ maxQueued: 8, maxWaitMs: 1_800_000, ...lanes.batch }),
+    };
+    this.running = new Set();
+    this.calibration = {};
+    this.closed = false;
+  }
+
+  _lane({ maxQueued, maxWaitMs }) {
+    return {
+      maxQueued, maxWaitMs, queue: [], running: 0,
+      counters: { admitted: 0, completed: 0, failed: 0, rejected_429: 0, rejected_503: 0 },
+      waits: [], runs: [],
+    };
+  }
+
+  /**
+   * Lane and expected worker milliseconds for one extraction.
+   *
+   * @param {Object} job — { taskType, durationS, wordTimestamps, whisperModel }
+   * @returns {{ lane: string, costMs: number, timeoutMs: number }}
+   */
+  estimate({ taskType, durationS, wordTimestamps = false, whisperModel = 'large-v3' }) {
+    const perSecond = (ACOUSTIC_MS_PER_AUDIO_S[taskType] ?? ACOUSTIC_MS_PER_AUDIO_S.conversation)
+      + (wordTimestamps ? (WHISPER_MS_PER_AUDIO_S[whisperModel] ?? WHISPER_MS_PER_AUDIO_S['large-v3']) : 0);
+    const costMs = Math.round((JOB_OVERHEAD_MS + perSecond * durationS) * (this.calibration[taskType] ?? 1));
+    return {
+      lane: INTERACTIVE_TASK_TYPES.has(taskType) ? 'interactive' : 'batch',
+      costMs,
+      timeoutMs: Math.min(MAX_JOB_TIMEOUT_MS, Math.max(DEFAULT_JOB_TIMEOUT_MS, 3 * costMs)),
+    };
+  }
+
+  /**
+   * Estimated milliseconds until a new job in `laneName` would start: the
+   * lane's queue is laid onto the slots it may use, each busy until its
+   * running job's remaining estimated cost is spent. (Batch estimates ignore
+   * interactive jobs borrowing unreserved slots; those are short.)
+   */
+  estimatedWaitMs(laneName) {
+    const now = Date.now();
+    const batch = laneName === 'batch';
+    const slots = [];
+    for (const job of this.running) {
+      if (!batch || job.lane === 'batch') slots.push(Math.max(0, job.costMs - (now - job.startedAt)));
+    }
+    const usable = batch ? this.concurrency - this.reservedInteractive : this.concurrency;
+    while (slots.length < usable) slots.push(0);
+    for (const job of this.lanes[laneName].queue) {
+      slots.sort((a, b) => a - b);
+      slots[0] += job.costMs;
+    }
+    return Math.round(Math.min(...slots));
+  }
+
+  /**
+   * Throw the ExtractionRejectedError `submit` would reject with, without
+   * queueing anything (lets callers refuse a request before doing other work).
+   */
+  checkAdmission(job) {
+    const { lane: laneName } = this.estimate(job);
+    const lane = this.lanes[laneName];
+    if (this.closed) {
+      throw new ExtractionRejectedError('Extraction scheduler is closed', { statusCode: 503, lane: laneName });
+    }
+    const waitMs = this.estimatedWaitMs(laneName);
+    const retryAfterS = Math.max(1, Math.ceil(waitMs / 1000));
+    if (lane.queue.length >= lane.maxQueued) {
+      lane.counters.rejected_429++;
+      throw new ExtractionRejectedError(
+        `Acoustic ${laneName} queue is full (${lane.queue.length} jobs)`,
+        { statusCode: 429, retryAfterS, lane: laneName },
+      );
+    }
+    if (waitMs > lane.maxWaitMs) {
+      lane.counters.rejected_503++;
+      throw new ExtractionRejectedError(
+        `Acoustic ${laneName} backlog too long (estimated wait ${retryAfterS} s)`,
+        { statusCode: 503, retryAfterS, lane: laneName },
+      );
+    }
+  }
+
+  /**
+   * Queue `run(timeoutMs)` as one extraction job.
+   *
+   * @param {Object} job — { taskType, durationS, wordTimestamps, whisperModel }
+   * @param {Function} run — Called with the job's timeout when a slot frees; returns a Promise.
+   * @returns {Promise<*>} — Result of `run`, or an ExtractionRejectedError.
+   */
+  submit(job, run) {
+    try {
+      this.checkAdmission(job);
+    } catch (err) {
+      return Promise.reject(err);
+    }
+    const { lane, costMs, timeoutMs } = this.estimate(job);
+    this.lanes[lane].counters.admitted++;
+    return new Promise((resolve, reject) => {
+      this.lanes[lane].queue.push({
+        lane, costMs, timeoutMs, taskType: job.taskType, run, resolve, reject, queuedAt: Date.now(),
+      });
+      this._dispatch();
+    });
+  }
+
+  /** Queue depth, cost backlog and wait/run percentiles per lane. */
+  stats() {
+    const lanes = {};
+    for (const [name, lane] of Object.entries(this.lanes)) {
+      const waits = [...lane.waits].sort((a, b) => a - b);
+      const runs = [...lane.runs].sort((a, b) => a - b);
+      lanes[name] = {
+        queued: lane.queue.length,
+        running: lane.running,
+        queued_cost_ms: lane.queue.reduce((sum, job) => sum + job.costMs, 0),
+        oldest_wait_ms: lane.queue.length ? Date.now() - lane.queue[0].queuedAt : 0,
+        estimated_wait_ms: this.estimatedWaitMs(name),
+        max_queued: lane.maxQueued,
+        max_wait_ms: lane.maxWaitMs,
+        wait_ms: { p50: percentile(waits, 0.5), p95: percentile(waits, 0.95), p99: percentile(waits, 0.99) },
+        run_ms: { p50: percentile(runs, 0.5), p95: percentile(runs, 0.95), p99: percentile(runs, 0.99) },
+        ...lane.counters,
+      };
+    }
+    return {
+      concurrency: this.concurrency,
+      reserved_interactive: this.reservedInteractive,
+      running: this.running.size,
+      calibration: { ...this.calibration },
+      lanes,
+    };
+  }
+
+  /** Reject queued jobs; running jobs finish. */
+  close() {
+    this.closed = true;
+    for (const [name, lane] of Object.entries(this.lanes)) {
+      for (const job of lane.queue.splice(0)) {
+        job.reject(new ExtractionRejectedError('Extraction scheduler is closed', { statusCode: 503, lane: name }));
+      }
+    }
+  }
+
+  _record(list, value) {
+    list.push(value);
+    if (list.length > this.historySize) list.shift();
+  }
+
+  _dispatch() {
+    const batchSlots = this.concurrency - this.reservedInteractive;
+    while (this.running.size < this.concurrency) {
+      let lane = this.lanes.interactive;
+      if (lane.queue.length === 0) {
+        lane = this.lanes.batch;
+        if (lane.queue.length === 0 || lane.running >= batchSlots) return;
+      }
+      this._start(lane, lane.queue.shift());
+    }
+  }
+
+  _start(lane, job) {
+    job.startedAt = Date.now();
+    this._record(lane.waits, job.startedAt - job.queuedAt);
+    lane.running++;
+    this.running.add(job);
+
+    const finish = (ok) => {
+      const elapsed = Date.now() - job.startedAt;
+      this.running.delete(job);
+      lane.running--;
+      this._record(lane.runs, elapsed);
+      if (ok) {
+        lane.counters.completed++;
+        // Per-task cost calibration: EWMA of observed / estimated, clamped
+        const ratio = Math.min(4, Math.max(0.25, elapsed / Math.max(1, job.costMs)));
+        const prev = this.calibration[job.taskType] ?? 1;
+        this.calibration[job.taskType] = Math.round((0.8 * prev + 0.2 * ratio * prev) * 1000) / 1000;
+      } else {
+        lane.counters.failed++;
+      }
+      this._dispatch();
+    };
+
+    Promise.resolve()
+      .then(() => job.run(job.timeoutMs))
+      .then(
+        result => { finish(true); job.resolve(result); },
+        err => { finish(false); job.reject(err); },
+      );
   }
 }
 
+let sharedScheduler = null;
+let sharedSchedulerOptions = null;
+
+/**
+ * Configure the scheduler used by extractAcousticFeatures(). Queued jobs of
+ * the previous scheduler are rejected.
+ *
+ * @param {Object} options — ExtractionScheduler options.
+ */
+export function configureExtractionScheduler(options = {}) {
+  if (sharedScheduler) sharedScheduler.close();
+  sharedScheduler = null;
+  sharedSchedulerOptions = options;
+}
+
+/**
+ * Shared scheduler for extractAcousticFeatures(), created on first use.
+ * Concurrency defaults to the pool size (CVF_ACOUSTIC_WORKERS, 2 when unset
+ * or when pooling is disabled).
+ *
+ * @returns {ExtractionScheduler}
+ */
+export function getExtractionScheduler() {
+  if (sharedScheduler) return sharedScheduler;
+  const poolSize = getExtractionPool()?.size ?? 2;
+  sharedScheduler = new ExtractionScheduler({ concurrency: poolSize, ...sharedSchedulerOptions });
+  return sharedScheduler;
+}
+
 // ─────────────────────────────────────────────────────────────────────────────
 // normalizeAcousticValue
 // ─────────────────────────────────────────────────────────────────────────────
@@ -292,6 +927,48 @@ export function computeWhisperTemporalIndicators(words) {
   return result;
 }
 
+// ─────────────────────────────────────────────────────────────────────────────
+// runPythonExtraction
+// ─────────────────────────────────────────────────────────────────────────────
+
+/**
+ * Run one extraction request through the worker pool, or through a one-shot
+ * Python process when pooling is disabled. Both paths return the same
+ * parsed result object.
+ *
+ * @param {Object} request — Worker protocol fields (task_type, audio_format, ...).
+ * @param {Buffer} audio — Audio bytes, piped to Python instead of a file path.
+ * @param {number} timeoutMs — Job timeout (from the scheduler's cost estimate).
+ * @returns {Promise<Object>} — Parsed Python result.
+ */
+async function runPythonExtraction(request, audio, timeoutMs = DEFAULT_JOB_TIMEOUT_MS) {
+  const pool = getExtractionPool();
+  if (pool) return pool.run(request, { audio, timeoutMs });
+
+  const args = [
+    PYTHON_SCRIPT,
+    '--audio-path', '-',
+    '--audio-format', request.audio_format,
+    '--task-type', request.task_type,
+    '--gender', request.gender,
+  ];
+  if (request.gpu) args.push('--gpu');
+  if (request.profile) args.push('--profile');
+  if (request.features) args.push('--features', request.features.join(','));
+  if (request.quality) args.push('--quality', request.quality);
+  if (request.voiced_only) args.push('--voiced-only');
+  if (request.word_timestamps) {
+    args.push('--whisper-model', request.whisper_model);
+    args.push('--word-timestamps');
+  }
+
+  const pending = execFileAsync('python3', args, { timeout: timeoutMs });
+  pending.child.stdin.on('error', () => {}); // EPIPE surfaces as a failed exit
+  pending.child.stdin.end(audio);
+  const { stdout } = await pending;
+  return parsePythonJson(stdout.trim());
+}
+
 // ─────────────────────────────────────────────────────────────────────────────
 // extractAcousticFeatures
 // ─────────────────────────────────────────────────────────────────────────────
@@ -307,13 +984,28 @@ export function computeWhisperTemporalIndicators(words) {
  *
  * @param {Buffer} audioBuffer — Audio data.
  * @param {Object} options
- * @param {string} options.format — Input format (default 'wav').
+ * @param {string} options.format — Input format hint (default 'wav'); the
+ *   container is probed from the bytes, so any ffmpeg-readable format works.
  * @param {string} options.taskType — Python task type (default 'conversation').
  * @param {string} options.gender — Speaker gender (default 'unknown').
  * @param {boolean} options.gpu — Enable GPU acceleration (default true).
  * @param {string} options.whisperModel — Whisper model size (default 'large-v3').
  * @param {boolean} options.wordTimestamps — Request word-level timestamps (default true).
- * @returns {Promise<Object>} — { acousticVector, temporalIndicators, whisperResult }
+ * @param {boolean} options.profile — Ask Python for per-stage timings
+ *   (default: CVF_ACOUSTIC_PROFILE=1).
+ * @param {string[]|null} options.features — Only extract these Python
+ *   features (see featuresForIndicators); indicators outside the selection
+ *   come back null. Default null = every feature of the task.
+ * @param {string} options.quality — Estimator tier 'fast' | 'standard' | 'full'
+ *   (default: CVF_ACOUSTIC_QUALITY or 'standard'). Echoed as `quality`.
+ * @param {boolean} options.voicedOnly — Compute CPP, RPDE/DFA/D2, spectral
+ *   harmonicity and spectral tilt on the voiced spans only (default:
+ *   CVF_ACOUSTIC_VOICED_ONLY=1). Echoed as `voicedOnly`.
+ * @param {number|null} options.durationS — Known audio duration for the cost
+ *   estimate (default: read from the WAV header or estimated from the size).
+ * @returns {Promise<Object>} — { acousticVector, temporalIndicators, whisperResult },
+ *   plus `timings` when profiling. Rejects with ExtractionRejectedError (429/503)
+ *   when the scheduler refuses the job; other failures give a null vector.
  */
 export async function extractAcousticFeatures(audioBuffer, {
   format = 'wav',
@@ -322,48 +1014,40 @@ export async function extractAcousticFeatures(audioBuffer, {
   gpu = true,
   whisperModel = 'large-v3',
   wordTimestamps = true,
+  profile = process.env.CVF_ACOUSTIC_PROFILE === '1',
+  features = null,
+  quality = process.env.CVF_ACOUSTIC_QUALITY || 'standard',
+  voicedOnly = process.env.CVF_ACOUSTIC_VOICED_ONLY === '1',
+  durationS = null,
 } = {}) {
   if (!VALID_TASK_TYPES.has(taskType)) {
     throw new Error(`Invalid taskType: must be one of ${[...VALID_TASK_TYPES].join(', ')}`);
   }
+  if (!QUALITY_TIERS.has(quality)) {
+    throw new Error(`Invalid quality: must be one of ${[...QUALITY_TIERS].join(', ')}`);
+  }
   const safeGender = VALID_GENDERS.has(gender) ? gender : 'female';
-
-  const tempFiles = [];
+  const job = {
+    taskType,
+    durationS: durationS ?? estimateAudioDurationS(audioBuffer, format),
+    wordTimestamps,
+    whisperModel,
+  };
 
   try {
-    // Convert to 16kHz mono WAV if not already WAV
-    let wavPath;
-    if (format === 'wav') {
-      wavPath = tempPath('wav');
-      await fs.writeFile(wavPath, audioBuffer);
-      await fs.chmod(wavPath, 0o600);
-      tempFiles.push(wavPath);
-    } else {
-      wavPath = await convertToWav(audioBuffer, format);
-      tempFiles.push(wavPath);
-    }
-
-    // Build Python invocation arguments
-    const args = [
-      PYTHON_SCRIPT,
-      '--audio-path', wavPath,
-      '--task-type', taskType,
-      '--gender', safeGender,
-    ];
-    if (gpu) args.push('--gpu');
-    if (wordTimestamps) {
-      args.push('--whisper-model', whisperModel);
-      args.push('--word-timestamps');
-    }
-
-    // Invoke Python extraction script (V5 may take longer with Whisper — 120s timeout)
-    const { stdout } = await execFileAsync('python3', args, { timeout: 120_000 });
-
-    // Parse Python output with prototype pollution protection
-    const result = JSON.parse(stdout.trim(), (key, value) => {
-      if (key === '__proto__' || key === 'constructor' || key === 'prototype') return undefined;
-      return value;
-    });
+    // The upload goes to Python as-is and is decoded there without temp files
+    const result = await getExtractionScheduler().submit(job, timeoutMs => runPythonExtraction({
+      audio_format: 'encoded',
+      task_type: taskType,
+      gender: safeGender,
+      gpu,
+      whisper_model: whisperModel,
+      word_timestamps: wordTimestamps,
+      profile,
+      ...(features ? { features } : {}),
+      quality,
+      voiced_only: voicedOnly,
+    }, audioBuffer, timeoutMs));
 
     if (result.status !== 'ok' || !result.features) {
       console.warn(
@@ -433,13 +1117,21 @@ export async function extractAcousticFeatures(audioBuffer, {
       }
     }
 
-    return {
+    const extracted = {
       acousticVector: vector,
       temporalIndicators,
       whisperResult,
+      // Estimator tier; values from different tiers must not be compared
+      quality: result.quality || quality,
+      voicedOnly: result.voiced_only ?? voicedOnly,
     };
+    // Per-stage timings from the Python side (only present when profiling)
+    if (result.timings) extracted.timings = result.timings;
+    return extracted;
 
   } catch (err) {
+    // Backpressure is the caller's to report (429/503), not a missing signal
+    if (err instanceof ExtractionRejectedError) throw err;
     // Graceful degradation: Python not available, ffmpeg missing, etc.
     console.warn(
       `[acoustic-pipeline] Feature extraction failed, returning null vector:`,
@@ -450,11 +1142,33 @@ export async function extractAcousticFeatures(audioBuffer, {
       temporalIndicators: {},
       whisperResult: null,
     };
-  } finally {
-    await cleanup(tempFiles);
   }
 }
 
+/**
+ * Throw the ExtractionRejectedError that extractAcousticFeatures() would
+ * currently reject with, so a route can answer 429/503 before starting other
+ * work. Admission is re-checked when the extraction is submitted.
+ *
+ * @param {Buffer} audioBuffer — Audio data.
+ * @param {Object} options — format, taskType, wordTimestamps, whisperModel,
+ *   durationS, with extractAcousticFeatures() defaults.
+ */
+export function checkAcousticAdmission(audioBuffer, {
+  format = 'wav',
+  taskType = 'conversation',
+  wordTimestamps = true,
+  whisperModel = 'large-v3',
+  durationS = null,
+} = {}) {
+  getExtractionScheduler().checkAdmission({
+    taskType,
+    durationS: durationS ?? estimateAudioDurationS(audioBuffer, format),
+    wordTimestamps,
+    whisperModel,
+  });
+}
+
 // ─────────────────────────────────────────────────────────────────────────────
 // extractMicroTaskAudio
 // ─────────────────────────────────────────────────────────────────────────────
@@ -473,6 +1187,11 @@ export async function extractAcousticFeatures(audioBuffer, {
  * @param {boolean} options.gpu — Enable GPU acceleration (default true).
  * @param {string} options.whisperModel — Whisper model size (default 'large-v3').
  * @param {boolean} options.wordTimestamps — Request word-level timestamps (default true).
+ * @param {boolean} options.profile — Ask Python for per-stage timings.
+ * @param {string[]|null} options.features — Python feature selection.
+ * @param {string} options.quality — Estimator tier.
+ * @param {boolean} options.voicedOnly — Voiced-span-only signal measures.
+ * @param {number|null} options.durationS — Known audio duration (cost estimate).
  * @returns {Promise<Object>} — { acousticVector, temporalIndicators, whisperResult }
  */
 export async function extractMicroTaskAudio(audioBuffer, taskType, {
@@ -481,6 +1200,11 @@ export async function extractMicroTaskAudio(audioBuffer, taskType, {
   gpu = true,
   whisperModel = 'large-v3',
   wordTimestamps = true,
+  profile,
+  features = null,
+  quality,
+  voicedOnly,
+  durationS = null,
 } = {}) {
   if (!VALID_TASK_TYPES.has(taskType)) {
     throw new Error(`Invalid taskType: must be one of ${[...VALID_TASK_TYPES].join(', ')}`);
@@ -492,23 +1216,10 @@ export async function extractMicroTaskAudio(audioBuffer, taskType, {
     gpu,
     whisperModel,
     wordTimestamps,
+    profile,
+    features,
+    quality,
+    voicedOnly,
+    durationS,
   });
 }
-
-// ─────────────────────────────────────────────────────────────────────────────
-// cleanup
-// ─────────────────────────────────────────────────────────────────────────────
-
-/**
- * Remove temp files, ignoring errors for files that may already be deleted.
- *
- * @param {string[]} tempFiles — Array of absolute paths to remove.
- */
-export async function cleanup(tempFiles) {
-  const tmpDir = os.tmpdir();
-  await Promise.allSettled(
-    tempFiles
-      .filter(f => path.resolve(f).startsWith(path.resolve(tmpDir)))
-      .map(f => fs.unlink(f).catch(() => {}))
-  );
-}
@@ -34,8 +34,9 @@ import {
   extractV5EarlyDetection,
   extractAcousticFeatures,
   extractMicroTaskAudio,
-  convertToWav,
-  cleanupAudioTemp,
+  checkAcousticAdmission,
+  getExtractionScheduler,
+  getExtractionPool,
   runPDAnalysis,
   MICRO_TASKS,
   getScheduledTasks,
@@ -100,6 +101,47 @@ function pushProcessingTime(entry) {
   }
 }
 
+// Record the Python per-stage timings of one extraction (CVF_ACOUSTIC_PROFILE=1)
+function pushAcousticProfile(timings, taskType, patientHash) {
+  if (!timings?.stages) return;
+  const stages = {};
+  for (const [name, stage] of Object.entries(timings.stages)) {
+    stages[name] = stage.wall_ms;
+  }
+  pushProcessingTime({
+    timestamp: new Date().toISOString(),
+    duration_ms: Math.round(timings.total_wall_ms ?? 0),
+    type: 'acoustic_profile',
+    task_type: taskType,
+    patient_hash: patientHash,
+    stages,
+    peak_rss_mb: timings.peak_rss_mb ?? null,
+    device: timings.device ?? null,
+    mfcc_backend: timings.mfcc_backend ?? null,
+  });
+}
+
+// Mean wall time per stage and task type over the profiled entries in the ring buffer
+function aggregateAcousticProfiles(entries) {
+  const sums = {};
+  for (const entry of entries) {
+    if (entry.type !== 'acoustic_profile') continue;
+    const task = (sums[entry.task_type] ??= { count: 0, stages: {} });
+    task.count++;
+    for (const [name, ms] of Object.entries(entry.stages)) {
+      task.stages[name] = (task.stages[name] || 0) + ms;
+    }
+  }
+  const result = {};
+  for (const [taskType, { count, stages }] of Object.entries(sums)) {
+    result[taskType] = { samples: count, avg_stage_ms: {} };
+    for (const [name, total] of Object.entries(stages)) {
+      result[taskType].avg_stage_ms[name] = Math.round((total / count) * 100) / 100;
+    }
+  }
+  return result;
+}
+
 function validatePatientId(patientId) {
   if (!patientId || !PATIENT_ID_REGEX.test(patientId)) {
     throw { statusCode: 400, message: 'Invalid patientId: must be 1-64 alphanumeric/dash/underscore characters' };
@@ -145,8 +187,10 @@ export default async function v5Routes(app) {
   app.setErrorHandler((err, request, reply) => {
     const statusCode = err.statusCode || 500;
     const isDev = process.env.NODE_ENV === 'development';
+    // Extraction backpressure (429/503) tells the client when to retry
+    if (err.retryAfterS) reply.header('Retry-After', String(err.retryAfterS));
     reply.code(statusCode).send({
-      error: statusCode >= 500 && !isDev ? 'Internal server error' : (err.message || 'An error occurred'),
+      error: statusCode >= 500 && !isDev && !err.expose ? 'Internal server error' : (err.message || 'An error occurred'),
     });
   });
 
@@ -186,6 +230,12 @@ export default async function v5Routes(app) {
     const processStart = performance.now();
     const patientHash = crypto.createHash('sha256').update(patientId).digest('hex').slice(0, 8);
 
+    // Refuse up front (429/503) rather than pay for text extraction first
+    const audioBuffer = audioBase64 ? Buffer.from(audioBase64, 'base64') : null;
+    if (audioBuffer) {
+      checkAcousticAdmission(audioBuffer, { format: audioFormat || 'wav', durationS: durationSeconds ?? null });
+    }
+
     try {
 
     let patient = getPatient(patientId);
@@ -208,13 +258,12 @@ export default async function v5Routes(app) {
       : extractV5Features(transcript, { language: language || patient.language });
 
     let audioPromise = null;
-    let audioTempFiles = [];
     const audioStart = performance.now();
-    if (audioBase64) {
-      const audioBuffer = Buffer.from(audioBase64, 'base64');
+    if (audioBuffer) {
       audioPromise = extractAcousticFeatures(audioBuffer, {
         format: audioFormat || 'wav',
         gender: patient.gender || 'unknown',
+        durationS: durationSeconds ?? null,
       }).catch(err => {
         console.error('[V5] Audio extraction failed, continuing with text only:', err.message);
         metrics.audio_failures++;
@@ -231,6 +280,7 @@ export default async function v5Routes(app) {
     if (audioBase64 && audioVector && Object.keys(audioVector).length > 0) {
       metrics.audio_extractions++;
       metrics.audio_extraction_total_ms += performance.now() - audioStart;
+      pushAcousticProfile(audioVector.timings, 'conversation', patientHash);
     }
 
     // V5 dual-pass returns { vector, confidence } or plain vector
@@ -259,6 +309,7 @@ export default async function v5Routes(app) {
       feature_vector: mergedVector,
       extraction_model: mode === 'early_detection' ? 'opus-early-v5' : 'opus-dual-v5',
       has_audio: !!audioBase64,
+      acoustic_quality: audioVector?.quality || null,
       topic_genre: topicGenre,
       topic_confidence: topicResult?.confidence || null,
       indicator_confidence: indicatorConfidence,
@@ -380,6 +431,7 @@ export default async function v5Routes(app) {
     const duration = performance.now() - audioStart;
     metrics.audio_extraction_total_ms += duration;
     pushProcessingTime({ timestamp: new Date().toISOString(), duration_ms: Math.round(duration), type: 'audio', patient_hash: patientHash });
+    pushAcousticProfile(features.timings, taskType, patientHash);
 
     return {
       version: 'v5',
@@ -803,6 +855,13 @@ export default async function v5Routes(app) {
       avg_analysis_ms: metrics.sessions_processed > 0
         ? Math.round(metrics.analysis_total_ms / metrics.sessions_processed) : 0,
 
+      // Python extractor stages (profiled extractions in the recent window)
+      acoustic_stage_profile: aggregateAcousticProfiles(metrics.last_processing_times),
+
+      // Extraction lanes (queue depth, wait percentiles, rejections) and workers
+      acoustic_scheduler: getExtractionScheduler().stats(),
+      acoustic_pool: getExtractionPool()?.stats() ?? null,
+
       // Recent activity (last 50 processing events)
       recent_activity: metrics.last_processing_times,
     };
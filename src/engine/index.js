@@ -55,10 +55,17 @@ export {
 export {
   extractAcousticFeatures,
   extractMicroTaskAudio,
-  convertToWav,
   normalizeAcousticValue,
   computeWhisperTemporalIndicators,
-  cleanup as cleanupAudioTemp,
+  ExtractionWorkerPool,
+  configureExtractionPool,
+  getExtractionPool,
+  ExtractionScheduler,
+  ExtractionRejectedError,
+  configureExtractionScheduler,
+  getExtractionScheduler,
+  checkAcousticAdmission,
+  estimateAudioDurationS,
 } from './acoustic-pipeline.js';
 
 // PD-specific analysis engine
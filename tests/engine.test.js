@@ -9,6 +9,7 @@
 
 import { describe, it } from 'node:test';
 import assert from 'node:assert/strict';
+import { fileURLToPath } from 'node:url';
 
 import {
   computeV5Baseline, computeZScores, computeDomainScores,
@@ -31,6 +32,10 @@ import {
 
 import { detectPDSignature, classifyPDSubtype, runPDAnalysis } from '../src/engine/pd-engine.js';
 
+import {
+  ExtractionScheduler, ExtractionRejectedError, ExtractionWorkerPool, estimateAudioDurationS
+} from '../src/engine/acoustic-pipeline.js';
+
 // ════════════════════════════════════════════════
 // TEST HELPERS — build synthetic data
 // ════════════════════════════════════════════════
@@ -1040,3 +1045,170 @@ describe('Session Quality', () => {
       `Sparse (${sparseQuality.score}) should be < full (${fullQuality.score})`);
   });
 });
+
+// ════════════════════════════════════════════════
+// ACOUSTIC EXTRACTION SCHEDULER
+// ════════════════════════════════════════════════
+
+describe('ExtractionScheduler', () => {
+  const sleep = ms => new Promise(resolve => setTimeout(resolve, ms));
+  const CONVERSATION = { taskType: 'conversation', durationS: 420, wordTimestamps: true, whisperModel: 'large-v3' };
+  const DDK = { taskType: 'ddk', durationS: 10, wordTimestamps: false };
+
+  it('should run micro-tasks on the reserved slot while conversations queue', async () => {
+    const scheduler = new ExtractionScheduler({ concurrency: 2 });
+    const order = [];
+    const job = (name, ms) => () => sleep(ms).then(() => order.push(name));
+    const jobs = [
+      scheduler.submit(CONVERSATION, job('conversation1', 40)),
+      scheduler.submit(CONVERSATION, job('conversation2', 10)),
+      scheduler.submit(DDK, job('ddk', 5)),
+    ];
+    assert.equal(scheduler.stats().lanes.batch.queued, 1);
+    assert.equal(scheduler.stats().lanes.interactive.running, 1);
+    await Promise.all(jobs);
+    assert.deepEqual(order, ['ddk', 'conversation1', 'conversation2']);
+  });
+
+  it('should answer 429 when a lane queue is full', async () => {
+    const scheduler = new ExtractionScheduler({ concurrency: 1, lanes: { interactive: { maxQueued: 1 } } });
+    const running = scheduler.submit(DDK, () => sleep(5));
+    const queued = scheduler.submit(DDK, () => sleep(5));
+    await assert.rejects(scheduler.submit(DDK, () => sleep(5)), err => {
+      assert.ok(err instanceof ExtractionRejectedError);
+      assert.equal(err.statusCode, 429);
+      assert.ok(err.retryAfterS >= 1);
+      return true;
+    });
+    await Promise.all([running, queued]);
+    assert.equal(scheduler.stats().lanes.interactive.rejected_429, 1);
+  });
+
+  it('should answer 503 when the estimated wait exceeds the lane deadline', async () => {
+    const scheduler = new ExtractionScheduler({ concurrency: 1 });
+    const conversation = scheduler.submit(CONVERSATION, () => sleep(5));
+    assert.throws(() => scheduler.checkAdmission(DDK), err => err.statusCode === 503);
+    await conversation;
+    assert.doesNotThrow(() => scheduler.checkAdmission(DDK));
+  });
+
+  it('should cost Whisper jobs above acoustic-only jobs and scale timeouts', () => {
+    const scheduler = new ExtractionScheduler();
+    const withWhisper = scheduler.estimate(CONVERSATION);
+    const acousticOnly = scheduler.estimate({ ...CONVERSATION, wordTimestamps: false });
+    assert.equal(withWhisper.lane, 'batch');
+    assert.equal(scheduler.estimate(DDK).lane, 'interactive');
+    assert.ok(withWhisper.costMs > acousticOnly.costMs);
+    assert.ok(withWhisper.timeoutMs > 120_000);
+  });
+
+  it('should read the duration of a PCM WAV from its header', () => {
+    const header = Buffer.alloc(44);
+    header.write('RIFF', 0);
+    header.write('WAVE', 8);
+    header.write('fmt ', 12);
+    header.writeUInt32LE(16, 16);
+    header.writeUInt32LE(32000, 28); // 16 kHz mono 16-bit
+    header.write('data', 36);
+    header.writeUInt32LE(96000, 40);
+    assert.equal(estimateAudioDurationS(Buffer.concat([header, Buffer.alloc(96000)]), 'wav'), 3);
+  });
+});
+
+describe('ExtractionWorkerPool', () => {
+  const sleep = ms => new Promise(resolve => setTimeout(resolve, ms));
+  const STUB_WORKER = fileURLToPath(new URL('./fixtures/stub-extraction-worker.mjs', import.meta.url));
+  const REQUEST = { task_type: 'ddk', gender: 'female' };
+  const makePool = options => new ExtractionWorkerPool({
+    size: 1, healthCheckIntervalMs: 0, pythonBin: process.execPath, script: STUB_WORKER, ...options,
+  });
+
+  it('should send audio bytes after the request line and resolve with the response', async () => {
+    const pool = makePool();
+    try {
+      const audio = Buffer.alloc(4096, 7);
+      const result = await pool.run({ ...REQUEST, audio_format: 'encoded' }, { audio });
+      assert.equal(result.status, 'ok');
+      assert.equal(result.task_type, 'ddk');
+      assert.equal(result.audio_length, audio.length);
+      assert.equal(result.id, undefined);
+      assert.equal(pool.stats().jobs_completed, 1);
+    } finally {
+      await pool.close();
+    }
+  });
+
+  it('should reject a job that exceeds its timeout and replace the worker', async () => {
+    const pool = makePool();
+    try {
+      await assert.rejects(pool.run({ ...REQUEST, stub: 'hang' }, { timeoutMs: 200 }), /timed out after 200 ms/);
+      assert.equal(pool.stats().timeouts, 1);
+      assert.equal(pool.stats().jobs_failed, 1);
+      const next = await pool.run(REQUEST);
+      assert.equal(next.status, 'ok');
+      assert.equal(next.jobs, 1);
+    } finally {
+      await pool.close();
+    }
+  });
+
+  it('should recycle a worker after maxJobsPerWorker jobs', async () => {
+    const pool = makePool({ maxJobsPerWorker: 2 });
+    try {
+      const pids = [];
+      for (let i = 0; i < 3; i++) pids.push((await pool.run(REQUEST)).pid);
+      assert.equal(pids[0], pids[1]);
+      assert.notEqual(pids[1], pids[2]);
+      assert.equal(pool.stats().workers_recycled, 1);
+      assert.equal(pool.stats().workers_crashed, 0);
+    } finally {
+      await pool.close();
+    }
+  });
+
+  it('should reject the in-flight job of a crashed worker and keep serving', async () => {
+    const pool = makePool();
+    try {
+      await assert.rejects(pool.run({ ...REQUEST, stub: 'crash' }), /exited \(code=3/);
+      assert.equal(pool.stats().workers_crashed, 1);
+      assert.equal(pool.stats().jobs_failed, 1);
+      assert.equal((await pool.run(REQUEST)).status, 'ok');
+    } finally {
+      await pool.close();
+    }
+  });
+
+  it('should keep idle workers that answer health pings', async () => {
+    const pool = makePool({ healthCheckIntervalMs: 50, healthCheckTimeoutMs: 200 });
+    try {
+      const { pid } = await pool.run(REQUEST);
+      await sleep(300);
+      assert.equal(pool.stats().workers, 1);
+      assert.equal((await pool.run(REQUEST)).pid, pid);
+    } finally {
+      await pool.close();
+    }
+  });
+
+  it('should kill idle workers that miss a health ping', async () => {
+    const pool = makePool({ healthCheckIntervalMs: 50, healthCheckTimeoutMs: 50, workerArgs: ['--no-pong'] });
+    try {
+      const { pid } = await pool.run(REQUEST);
+      await sleep(300);
+      assert.equal(pool.stats().workers, 0);
+      assert.ok(pool.stats().workers_crashed >= 1);
+      const next = await pool.run(REQUEST);
+      assert.notEqual(next.pid, pid);
+    } finally {
+      await pool.close();
+    }
+  });
+
+  it('should reject queued jobs once closed', async () => {
+    const pool = makePool();
+    const pending = pool.run({ ...REQUEST, stub: 'hang' });
+    await pool.close();
+    await assert.rejects(pending, /closed/);
+    await assert.rejects(pool.run(REQUEST), /closed/);
+  });
+});
@@ -0,0 +1,67 @@
+/**
+ * Stub of `extract_features_v5.py --worker` for the ExtractionWorkerPool tests.
+ *
+ * Speaks the JSON-lines worker protocol (ready event, extract / ping /
+ * shutdown ops, `audio_bytes` payloads after the request line) without any
+ * DSP. The `stub` field of an extract request selects the behaviour:
+ *   'echo' (default) — answer ok with this process's pid and job count
+ *   'hang'           — never answer
+ *   'crash'          — exit with status 3 before answering
+ * Extra CLI args: `--no-pong` ignores pings.
+ */
+
+const ignorePings = process.argv.includes('--no-pong');
+let buffered = Buffer.alloc(0);
+let payloadFor = null; // request waiting for its audio bytes
+let jobs = 0;
+
+function send(msg) {
+  process.stdout.write(JSON.stringify(msg) + '\n');
+}
+
+function handle(request, audio = null) {
+  if (request.op === 'ping') {
+    if (!ignorePings) send({ id: request.id, status: 'ok', op: 'pong' });
+    return;
+  }
+  if (request.op === 'shutdown') {
+    send({ id: request.id, status: 'ok', op: 'shutdown' });
+    process.exit(0);
+  }
+  const behaviour = request.stub ?? 'echo';
+  if (behaviour === 'hang') return;
+  if (behaviour === 'crash') process.exit(3);
+  jobs++;
+  send({
+    id: request.id,
+    status: 'ok',
+    pid: process.pid,
+    jobs,
+    task_type: request.task_type,
+    audio_length: audio ? audio.length : null,
+  });
+}
+
+process.stdin.on('data', chunk => {
+  buffered = Buffer.concat([buffered, chunk]);
+  for (;;) {
+    if (payloadFor) {
+      if (buffered.length < payloadFor.audio_bytes) return;
+      const audio = buffered.subarray(0, payloadFor.audio_bytes);
+      buffered = buffered.subarray(payloadFor.audio_bytes);
+      const request = payloadFor;
+      payloadFor = null;
+      handle(request, audio);
+      continue;
+    }
+    const newline = buffered.indexOf(0x0a);
+    if (newline < 0) return;
+    const request = JSON.parse(buffered.subarray(0, newline).toString('utf8'));
+    buffered = buffered.subarray(newline + 1);
+    if (request.audio_bytes) payloadFor = request;
+    else handle(request);
+  }
+});
+process.stdin.on('end', () => process.exit(0));
+
+send({ event: 'ready', pid: process.pid });